@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 18:02
+@File: benchmark.py
+@License: MIT
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+from benchmark_case.bench_protocol import PROTOCOLS, operands, sample, setup
+
+KEY_LENGTHS = (1024, 2048, 3072)  # TODO 密钥长度
+BATCHES = (1, 10, 100, 1000, 10000)  # TODO 批量大小
+REPEAT = 5  # TODO 每组重复次数
+THRESHOLD = 0.2  # TODO 回归阈值 p50相对基线变慢超过20%视为回归
+OUTPUT_PATH = 'benchmark_case/report/benchmark.json'  # 结果文件路径
+BASELINE_PATH = 'benchmark_case/baseline.json'  # 基线文件路径
+
+
+def percentile(samples, q):
+    """
+    百分位数 线性插值
+    :param samples: 样本
+    :param q: 百分位 0~100
+    :return: 百分位数
+    """
+    samples = sorted(samples)
+    k = (len(samples) - 1) * q / 100
+    lower = int(k)
+    upper = min(lower + 1, len(samples) - 1)
+
+    return samples[lower] + (samples[upper] - samples[lower]) * (k - lower)
+
+
+def run(key_lengths, batches, protocols, repeat):
+    """
+    开始基准测试
+    :param key_lengths: 密钥长度列表
+    :param batches: 批量大小列表
+    :param protocols: 协议名称列表
+    :param repeat: 每组重复次数
+    :return: 基准测试结果列表
+    """
+    results = []
+    for key_length in key_lengths:
+        public_key, cloud1, cloud2 = setup(key_length)
+        x = operands(public_key, max(batches))
+        for batch in batches:
+            args = {k: v[:batch] for k, v in x.items()}
+            for name in protocols:
+                samples = [sample(name, cloud1, cloud2, args) for _ in range(repeat)]
+                result = {
+                    'protocol': name,
+                    'key_length': key_length,
+                    'batch': batch,
+                    'repeat': repeat,
+                    'p50': percentile(samples, 50),
+                    'p95': percentile(samples, 95),
+                    'p99': percentile(samples, 99),
+                    'throughput': batch * len(samples) / sum(samples),
+                }
+                results.append(result)
+                print("{protocol:<10}{key_length:>6}{batch:>8}{p50:>14.6f}{p95:>14.6f}{p99:>14.6f}"
+                      "{throughput:>14.1f}".format(**result), flush=True)
+
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    与基线比较
+    :param results: 基准测试结果列表
+    :param baseline: 基线结果列表
+    :param threshold: 回归阈值
+    :return: 回归项列表 [(结果, 基线p50), ...]
+    """
+    reference = {(v['protocol'], v['key_length'], v['batch']): v['p50'] for v in baseline}
+    regressions = []
+    for v in results:
+        p50 = reference.get((v['protocol'], v['key_length'], v['batch']))
+        if p50 is not None and v['p50'] > p50 * (1 + threshold):
+            regressions.append((v, p50))
+
+    return regressions
+
+
+def dump(path, results):
+    """
+    输出基准测试结果
+    :param path: 文件路径
+    :param results: 基准测试结果列表
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    output = {
+        'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(output, f, indent=2)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='安全多方计算协议基准测试')
+    parser.add_argument('--keys', type=int, nargs='+', default=KEY_LENGTHS, help='密钥长度')
+    parser.add_argument('--batches', type=int, nargs='+', default=BATCHES, help='批量大小')
+    parser.add_argument('--protocols', nargs='+', default=list(PROTOCOLS), choices=list(PROTOCOLS), help='协议')
+    parser.add_argument('--repeat', type=int, default=REPEAT, help='每组重复次数')
+    parser.add_argument('--output', default=OUTPUT_PATH, help='结果文件路径')
+    parser.add_argument('--baseline', help='基线文件路径 默认{0}, 指定时文件必须存在'.format(BASELINE_PATH))
+    parser.add_argument('--threshold', type=float, default=THRESHOLD, help='回归阈值')
+    parser.add_argument('--save-baseline', action='store_true', help='将本次结果保存为基线')
+    options = parser.parse_args()
+    if options.baseline is not None and not options.save_baseline and not os.path.exists(options.baseline):
+        parser.error("baseline file not found: {0}".format(options.baseline))
+    baseline_path = options.baseline or BASELINE_PATH
+
+    print("{0:<10}{1:>6}{2:>8}{3:>14}{4:>14}{5:>14}{6:>14}".format(
+        'protocol', 'key', 'batch', 'p50(s)', 'p95(s)', 'p99(s)', 'ops/s'))
+    report = run(options.keys, options.batches, options.protocols, options.repeat)
+    dump(options.output, report)
+
+    if options.save_baseline:
+        dump(baseline_path, report)
+    elif os.path.exists(baseline_path):
+        with open(baseline_path, encoding='utf-8') as file:
+            baseline = json.load(file)['results']
+        covered = {(v['protocol'], v['key_length'], v['batch']) for v in baseline}
+        uncovered = [v for v in report if (v['protocol'], v['key_length'], v['batch']) not in covered]
+        if uncovered:
+            print("WARNING: {0} of {1} results have no baseline entry in {2} and were not checked".format(
+                len(uncovered), len(report), baseline_path), file=sys.stderr)
+        regression = compare(report, baseline, options.threshold)
+        for item, reference_p50 in regression:
+            print("REGRESSION {protocol} key={key_length} batch={batch}: p50 {p50:.6f}s".format(**item),
+                  "vs baseline {0:.6f}s".format(reference_p50))
+        sys.exit(1 if regression else 0)
+    else:
+        print("WARNING: no baseline at {0}, regression check skipped; run with --save-baseline to create one".format(
+            baseline_path), file=sys.stderr)
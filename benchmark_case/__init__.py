@@ -0,0 +1,11 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 12:58
+@File: __init__.py
+@License: MIT
+"""
+__name__ = 'benchmark_case'
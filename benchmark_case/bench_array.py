@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 20:50
+@File: bench_array.py
+@License: MIT
+"""
+import random
+import time
+import tracemalloc
+
+import phe
+
+from benchmark_case.keypair import keypair
+from smpcp.array import CipherArray
+
+KEY_LENGTH = 2048  # TODO 密钥长度
+COUNT = 100000  # TODO 密文数量
+
+
+def measure(name, build, count):
+    """
+    统计内存与耗时
+    :param name: 名称
+    :param build: 构造函数
+    :param count: 密文数量
+    :return: 构造结果
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("{0:<24}{1:>12.1f} B/elem{2:>12.3f} s".format(name, size / count, elapsed))
+
+    return result
+
+
+if __name__ == '__main__':
+    public_key, _ = keypair(KEY_LENGTH)
+    ciphertexts = [random.SystemRandom().randrange(public_key.nsquare) for _ in range(COUNT)]
+    print("key: {0} bits, {1} ciphertexts".format(KEY_LENGTH, COUNT))
+    array = measure('CipherArray', lambda: CipherArray.from_numbers(
+        public_key, (phe.EncryptedNumber(public_key, c, 0) for c in ciphertexts)), COUNT)
+    print("{0:<24}{1:>12.1f} B/elem".format('CipherArray.nbytes', array.memory_per_element()))
+    # 从数组重新构造, 统计包含密文整数本身的内存
+    measure('list[EncryptedNumber]', array.to_list, COUNT)
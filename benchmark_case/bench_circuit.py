@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/19 04:30
+@File: bench_circuit.py
+@License: MIT
+"""
+import random
+import sys
+import time
+
+from benchmark_case.keypair import keypair
+from smpcp.circuit import adder_circuit, comparison_circuit, equality_circuit
+from smpcp.metrics import ProtocolMetrics
+from smpcp.smpcp import CloudPlatform, CloudPlatformThird
+
+KEY_LENGTH = 2048  # TODO 密钥长度
+BITS = [int(v) for v in sys.argv[1:]] or [8, 16, 32]  # TODO 位数
+
+
+def gate_by_gate(circuit, c1, c2, inputs):
+    """
+    逐门计算 每个异或/与/或门调用一次对应的安全二进制协议
+    :param circuit: 布尔电路
+    :param c1: 云服务器
+    :param c2: 第三方云服务器
+    :param inputs: 加密比特列表
+    :return: 输出加密比特列表
+    """
+    values, count = [], 0
+    for op, *operands in circuit.netlist:
+        if op == 'input':
+            values.append(inputs[count])
+            count += 1
+        elif op == 'const':
+            values.append(c1.public_key.encrypt(operands[0]))
+        elif op == 'not':
+            values.append(c1.bit_not(values[operands[0]]))
+        else:
+            protocol = {'xor': c1.bit_xor, 'and': c1.bit_and, 'or': c1.bit_or}[op]
+            values.append(protocol(values[operands[0]], values[operands[1]], c2))
+
+    return [values[v] for v in circuit.outputs]
+
+
+def measure(name, evaluate, circuit, inputs):
+    """
+    计时
+    :param name: 名称
+    :param evaluate: 计算方式 evaluate(circuit, inputs)
+    :param circuit: 布尔电路
+    :param inputs: 加密比特列表
+    """
+    with ProtocolMetrics() as metrics:
+        start = time.perf_counter()
+        evaluate(circuit, inputs)
+        elapsed = time.perf_counter() - start
+    print("{0:<28}{1:>8} rounds{2:>10} decrypt{3:>10.3f} s".format(
+        name, metrics.totals['rounds'], metrics.totals['c2']['decrypt'], elapsed))
+
+
+if __name__ == '__main__':
+    public_key, secret_key = keypair(KEY_LENGTH)
+    cloud1 = CloudPlatform(public_key=public_key)
+    cloud2 = CloudPlatformThird(public_key=public_key, secret_key=secret_key)
+
+    print("key: {0} bits".format(KEY_LENGTH))
+    for bit in BITS:
+        a, b = random.getrandbits(bit), random.getrandbits(bit)
+        bits = [public_key.encrypt(v >> i & 1) for v in (a, b) for i in reversed(range(bit))]
+        for name, builder in (('gt', comparison_circuit), ('eq', equality_circuit), ('add', adder_circuit)):
+            circuit = builder(bit)
+            measure('{0}{1} (batched)'.format(name, bit), lambda c, x: c.evaluate(cloud1, cloud2, x), circuit, bits)
+            measure('{0}{1} (gate by gate)'.format(name, bit), lambda c, x: gate_by_gate(c, cloud1, cloud2, x),
+                    circuit, bits)
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/19 03:20
+@File: bench_division.py
+@License: MIT
+"""
+import random
+import time
+
+from benchmark_case.keypair import keypair
+from smpcp.smpcp import CloudPlatform, CloudPlatformThird
+
+KEY_LENGTH = 2048  # TODO 密钥长度
+COUNT = 200  # TODO 批量大小
+
+
+def measure(name, protocol, x, y):
+    """
+    计时
+    :param name: 名称
+    :param protocol: 批量协议 protocol(x, y)
+    :param x: 被除数密文列表
+    :param y: 除数密文 or 明文列表
+    """
+    start = time.perf_counter()
+    protocol(x, y)
+    print("{0:<24}{1:>12.1f} ops/s".format(name, len(x) / (time.perf_counter() - start)))
+
+
+if __name__ == '__main__':
+    public_key, secret_key = keypair(KEY_LENGTH)
+    cloud1 = CloudPlatform(public_key=public_key)
+    cloud2 = CloudPlatformThird(public_key=public_key, secret_key=secret_key)
+    a = [random.randint(-10 ** 9, 10 ** 9) for _ in range(COUNT)]
+    b = [random.randint(1, 10 ** 6) for _ in range(COUNT)]
+    x = [public_key.encrypt(v) for v in a]
+    y = [public_key.encrypt(v) for v in b]
+
+    print("key: {0} bits, batch: {1}".format(KEY_LENGTH, COUNT))
+    for divisor, name in ((y, 'encrypted'), (b, 'public')):
+        measure('truediv ({0})'.format(name), lambda p, q: cloud1.truediv_batch(p, q, cloud2), x, divisor)
+        measure('floordiv ({0})'.format(name), lambda p, q: cloud1.floordiv_batch(p, q, cloud2), x, divisor)
+        measure('mod ({0})'.format(name), lambda p, q: cloud1.mod_batch(p, q, cloud2), x, divisor)
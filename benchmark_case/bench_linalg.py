@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/19 01:10
+@File: bench_linalg.py
+@License: MIT
+"""
+import random
+import sys
+import time
+
+from benchmark_case.keypair import keypair
+from smpcp.linalg import secure_matmul
+from smpcp.metrics import ProtocolMetrics
+from smpcp.smpcp import CloudPlatform, CloudPlatformThird
+from smpcp.vector import EncryptedVector
+
+KEY_LENGTH = 2048  # TODO 密钥长度
+SIZES = (10, 50, 100)  # TODO 方阵边长 可由命令行参数覆盖
+SAMPLES = 20  # TODO 逐元素乘法的采样次数
+
+
+def encrypt_matrix(vector, size):
+    """
+    加密随机方阵
+    ! 使用r_value=1加密以缩短准备时间, 不影响协议开销
+    :param vector: 加密向量
+    :param size: 边长
+    :return: 加密向量列表
+    """
+    return [vector.encode([vector.c1.public_key.encrypt(random.randint(-1000, 1000), r_value=1) for _ in range(size)])
+            for _ in range(size)]
+
+
+if __name__ == '__main__':
+    sizes = [int(v) for v in sys.argv[1:]] or SIZES
+    public_key, secret_key = keypair(KEY_LENGTH)
+    cloud1 = CloudPlatform(public_key=public_key)
+    cloud2 = CloudPlatformThird(public_key=public_key, secret_key=secret_key)
+    vector = EncryptedVector(c1=cloud1, c2=cloud2)
+
+    # 逐元素方式: 每个标量乘积一轮安全乘法协议
+    x, y = public_key.encrypt(3), public_key.encrypt(4)
+    start = time.perf_counter()
+    for _ in range(SAMPLES):
+        cloud1.mul(x, y, cloud2)
+    per_mul = (time.perf_counter() - start) / SAMPLES
+
+    print("key: {0} bits".format(KEY_LENGTH))
+    print("{0:>6}{1:>10}{2:>14}{3:>12}{4:>22}".format(
+        'size', 'rounds', 'decryptions', 'matmul s', 'per-element est. s'))
+    for size in sizes:
+        a, b = encrypt_matrix(vector, size), encrypt_matrix(vector, size)
+        with ProtocolMetrics() as metrics:
+            secure_matmul(a, b)
+        print("{0:>6}{1:>10}{2:>14}{3:>12.2f}{4:>22.0f}".format(
+            size, metrics.totals['rounds'], metrics.totals['c2']['decrypt'], metrics.totals['wall_time'],
+            per_mul * size ** 3))
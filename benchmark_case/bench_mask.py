@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 13:04
+@File: bench_mask.py
+@License: MIT
+"""
+import random
+import time
+
+import gmpy2
+from benchmark_case.keypair import keypair
+from smpcp.mask import MaskGenerator
+
+KEY_LENGTH = 2048  # TODO 密钥长度
+COUNT = 2000  # TODO 掩码数量
+
+
+def legacy(bound, count):
+    """
+    原随机数生成方式: 每个掩码重新播种gmpy2随机状态
+    :param bound: 上界
+    :param count: 数量
+    :return: 随机数列表
+    """
+    return [int(gmpy2.mpz_random(gmpy2.random_state(random.SystemRandom().randint(1, 0xffffffff)), bound))
+            for _ in range(count)]
+
+
+def measure(name, func, count):
+    """
+    计时
+    :param name: 名称
+    :param func: 被测函数
+    :param count: 掩码数量
+    """
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print("{0:<32}{1:>12.3f} ms{2:>14.0f} masks/s".format(name, elapsed * 1e3, count / elapsed))
+
+
+if __name__ == '__main__':
+    public_key, _ = keypair(KEY_LENGTH)
+    generator = MaskGenerator()
+    for bound in (len(str(public_key.n)), 1 << 104, public_key.n):
+        print("bound: {0} bits, {1} masks".format(bound.bit_length(), COUNT))
+        measure('gmpy2 random_state', lambda: legacy(bound, COUNT), COUNT)
+        measure('MaskGenerator.randbelow', lambda: [generator.randbelow(bound) for _ in range(COUNT)], COUNT)
+        measure('MaskGenerator.randbelow_batch', lambda: generator.randbelow_batch(bound, COUNT), COUNT)
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 23:40
+@File: bench_parallel.py
+@License: MIT
+"""
+import os
+import time
+
+from benchmark_case.keypair import keypair
+from smpcp.parallel import ParallelCloudPlatformThird
+from smpcp.smpcp import CloudPlatform, CloudPlatformThird
+
+KEY_LENGTH = 2048  # TODO 密钥长度
+COUNT = 256  # TODO 批量大小
+
+
+def measure(name, c1, c2, x, y):
+    """
+    计时
+    :param name: 名称
+    :param c1: 云服务器
+    :param c2: 第三方云服务器
+    :param x: 密文列表
+    :param y: 密文列表
+    :return: 吞吐量 ops/s
+    """
+    start = time.perf_counter()
+    c1.mul_batch(x, y, c2)
+    throughput = len(x) / (time.perf_counter() - start)
+    print("{0:<12}{1:>12.1f} ops/s".format(name, throughput))
+
+    return throughput
+
+
+if __name__ == '__main__':
+    public_key, secret_key = keypair(KEY_LENGTH)
+    cloud1 = CloudPlatform(public_key=public_key)
+    x = [public_key.encrypt(v) for v in range(COUNT)]
+    y = [public_key.encrypt(v) for v in range(COUNT)]
+    print("key: {0} bits, batch: {1}, cpus: {2}".format(KEY_LENGTH, COUNT, os.cpu_count()))
+    serial = measure('serial', cloud1, CloudPlatformThird(public_key, secret_key), x, y)
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        with ParallelCloudPlatformThird(public_key, secret_key, workers=workers) as cloud2:
+            cloud2.mul_batch(x[:workers * 2], y[:workers * 2])  # 预热: 启动工作进程并加载密钥
+            print("  speedup x{0:.2f}".format(measure('{0} workers'.format(workers), cloud1, cloud2, x, y) / serial))
+        workers *= 2
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 17:50
+@File: bench_protocol.py
+@License: MIT
+"""
+import random
+import time
+
+from benchmark_case.keypair import keypair
+from smpcp.smpcp import CloudPlatform, CloudPlatformThird
+
+KEY_LENGTH = 2048  # TODO 密钥长度
+BATCH = 100  # TODO 批量大小
+BIT = 16  # TODO 明文位数
+
+# 协议名称 -> 批量协议调用 (云服务器, 第三方云服务器, 操作数)
+PROTOCOLS = {
+    'mul': lambda c1, c2, x: c1.mul_batch(x['a'], x['b'], c2),
+    'truediv': lambda c1, c2, x: c1.truediv_batch(x['a'], x['b'], c2),
+    'optimum': lambda c1, c2, x: c1.optimum_batch(x['a'], x['b'], c2, 'max'),
+    'parity': lambda c1, c2, x: c1.parity_batch(x['a'], c2),
+    'bit_dec': lambda c1, c2, x: c1.bit_dec_batch(x['a'], BIT, c2),
+    'bit_and': lambda c1, c2, x: c1.bit_and_batch(x['p'], x['q'], c2),
+    'bit_or': lambda c1, c2, x: c1.bit_or_batch(x['p'], x['q'], c2),
+    'bit_xor': lambda c1, c2, x: c1.bit_xor_batch(x['p'], x['q'], c2),
+    'bit_not': lambda c1, c2, x: c1.bit_not_batch(x['p']),
+    'eq': lambda c1, c2, x: c1.eq_batch(x['a'], x['b'], c2),
+    'ne': lambda c1, c2, x: c1.ne_batch(x['a'], x['b'], c2),
+    'gt': lambda c1, c2, x: c1.gt_batch(x['a'], x['b'], c2),
+    'ge': lambda c1, c2, x: c1.ge_batch(x['a'], x['b'], c2),
+    'lt': lambda c1, c2, x: c1.lt_batch(x['a'], x['b'], c2),
+    'le': lambda c1, c2, x: c1.le_batch(x['a'], x['b'], c2),
+}
+
+
+def setup(key_length):
+    """
+    加载缓存的密钥对并创建云服务器
+    :param key_length: 密钥长度
+    :return: (公钥, 云服务器, 第三方云服务器)
+    """
+    public_key, secret_key = keypair(key_length)
+
+    return public_key, CloudPlatform(public_key=public_key), CloudPlatformThird(public_key, secret_key)
+
+
+def operands(public_key, size):
+    """
+    生成加密操作数
+    :param public_key: 公钥
+    :param size: 数量
+    :return: {'a': 整数, 'b': 非零整数, 'p': 比特, 'q': 比特}
+    """
+    rand = random.SystemRandom()
+
+    return {
+        'a': [public_key.encrypt(rand.randrange(1 << BIT)) for _ in range(size)],
+        'b': [public_key.encrypt(rand.randrange(1, 1 << BIT)) for _ in range(size)],
+        'p': [public_key.encrypt(rand.randint(0, 1)) for _ in range(size)],
+        'q': [public_key.encrypt(rand.randint(0, 1)) for _ in range(size)],
+    }
+
+
+def sample(name, c1, c2, x):
+    """
+    单次计时
+    :param name: 协议名称
+    :param c1: 云服务器
+    :param c2: 第三方云服务器
+    :param x: 操作数
+    :return: 耗时(秒)
+    """
+    start = time.perf_counter()
+    PROTOCOLS[name](c1, c2, x)
+
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    public_key, cloud1, cloud2 = setup(KEY_LENGTH)
+    x = operands(public_key, BATCH)
+    print("key: {0} bits, batch: {1}".format(KEY_LENGTH, BATCH))
+    for name in PROTOCOLS:
+        elapsed = sample(name, cloud1, cloud2, x)
+        print("{0:<12}{1:>12.3f} ms{2:>14.0f} ops/s".format(name, elapsed * 1e3, BATCH / elapsed))
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 19:55
+@File: bench_wire.py
+@License: MIT
+"""
+import json
+import pickle
+import random
+import time
+
+import phe
+
+from benchmark_case.keypair import keypair
+from smpcp import wire
+from smpcp.transport import _pack, _unpack
+
+KEY_LENGTH = 2048  # TODO 密钥长度
+COUNT = 10000  # TODO 密文数量
+
+
+def measure(name, encode, decode, count):
+    """
+    计时
+    :param name: 名称
+    :param encode: 编码函数
+    :param decode: 解码函数 decode(编码结果)
+    :param count: 密文数量
+    """
+    start = time.perf_counter()
+    data = encode()
+    encoded = time.perf_counter() - start
+    start = time.perf_counter()
+    decode(data)
+    decoded = time.perf_counter() - start
+    print("{0:<12}{1:>12} B{2:>14.0f} enc/s{3:>14.0f} dec/s".format(
+        name, len(data), count / encoded, count / decoded))
+
+
+if __name__ == '__main__':
+    public_key, _ = keypair(KEY_LENGTH)
+    # 直接构造随机密文, 避免加密耗时
+    numbers = [phe.EncryptedNumber(public_key, random.SystemRandom().randrange(public_key.nsquare), 0)
+               for _ in range(COUNT)]
+    print("key: {0} bits, {1} ciphertexts".format(KEY_LENGTH, COUNT))
+    measure('wire', lambda: wire.encode_batch(public_key, numbers),
+            lambda data: wire.decode_batch(public_key, data), COUNT)
+    measure('wire view', lambda: wire.encode_batch(public_key, numbers),
+            lambda data: wire.BatchView(public_key, memoryview(data)), COUNT)
+    measure('transport', lambda: _pack(numbers), lambda data: _unpack(data, public_key), COUNT)
+    measure('json', lambda: json.dumps([{'c': format(v.ciphertext(be_secure=False), 'x'), 'e': v.exponent}
+                                        for v in numbers]).encode(),
+            lambda data: [phe.EncryptedNumber(public_key, int(v['c'], 16), v['e']) for v in json.loads(data)],
+            COUNT)
+    measure('pickle', lambda: pickle.dumps(numbers), pickle.loads, COUNT)
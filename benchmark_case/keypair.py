@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/19 05:10
+@File: keypair.py
+@License: MIT
+"""
+import functools
+import os
+
+from smpcp.keystore import cached_keypair
+
+# 密钥缓存目录 可通过环境变量SMPCP_KEYSTORE指定
+KEYSTORE_PATH = os.environ.get('SMPCP_KEYSTORE', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.keystore'))
+
+
+@functools.lru_cache(maxsize=None)
+def keypair(key_length=2048):
+    """
+    基准测试用密钥对 首次运行时生成并缓存, 之后各基准测试直接加载
+    :param key_length: 密钥长度
+    :return: (公钥, 私钥)
+    """
+    return cached_keypair(os.path.join(KEYSTORE_PATH, 'paillier-{0}.json'.format(key_length)), n_length=key_length)
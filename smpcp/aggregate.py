@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/19 01:40
+@File: aggregate.py
+@License: MIT
+"""
+from phe import EncryptedNumber
+
+
+def _is_plaintext(value):
+    """
+    明文判断
+    :param value: 密文 or 明文
+    :return: 是否为明文
+    """
+    return isinstance(value, (int, float))
+
+
+def _total(public_key, ciphers):
+    """
+    流式同态求和
+    ! 同指数的密文直接模乘累积, 不构造中间加密数字, 只保留每个指数的一个累积值
+    :param public_key: 公钥
+    :param ciphers: 密文可迭代对象
+    :return: E(sum(ciphers))
+    """
+    nsquare, totals = public_key.nsquare, {}
+    for v in ciphers:
+        totals[v.exponent] = totals.get(v.exponent, 1) * v.ciphertext(be_secure=False) % nsquare
+    result = public_key.encrypt(0, r_value=1)
+    for exponent, cipher in totals.items():
+        result = result + EncryptedNumber(public_key, cipher, exponent)
+
+    return result
+
+
+def _moments(vector, other):
+    """
+    一轮交互同时计算 sum(x * y) 与 sum(x) * sum(y)
+    ! 合并为一次安全矩阵乘法 [[x, 0], [0, sum(x)]] * [y, sum(y)], 第三方云服务器只需加密两个结果
+    :param vector: 加密向量 x
+    :param other: 加密向量 y
+    :return: (E(sum(x)), E(sum(y)), E(sum(x * y)), E(sum(x) * sum(y)))
+    """
+    if len(vector) != len(other):
+        raise ValueError("Vector length mismatch: {0} != {1}".format(len(vector), len(other)))
+    if not len(vector):
+        raise ValueError("Cannot aggregate an empty vector")
+    x, y = list(vector), list(other)
+    sx = _total(vector.c1.public_key, x)
+    sy = sx if other is vector else _total(vector.c1.public_key, y)
+    zero = vector.c1.public_key.encrypt(0, r_value=1)
+
+    (sxy,), (sxsy,) = vector.c1.matmul([x + [zero], [zero] * len(x) + [sx]], [[v] for v in y] + [[sy]], vector.c2)
+
+    return sx, sy, sxy, sxsy
+
+
+def secure_sum(vector):
+    """
+    TODO 安全求和协议
+    ! 本地同态加法, 无需交互
+    :param vector: 加密向量
+    :return: 安全求和协议结果 E(sum(vector))
+    """
+    return _total(vector.c1.public_key, vector)
+
+
+def secure_mean(vector, weights=None, count=None):
+    """
+    TODO 安全均值协议
+    ! 公开的计数与明文权重本地计算; 加密权重一轮安全内积; 加密计数或加密权重一轮安全除法
+    :param vector: 加密向量
+    :param weights: 权重 明文 or 密文列表 None: 等权
+    :param count: 计数 明文 or 密文 None: len(vector) 仅在不指定权重时生效
+    :return: 安全均值协议结果 E(sum(weights * vector) / sum(weights))
+    """
+    if not len(vector):
+        raise ValueError("Cannot aggregate an empty vector")
+    if weights is None:
+        total, count = secure_sum(vector), len(vector) if count is None else count
+    else:
+        if len(weights) != len(vector):
+            raise ValueError("Weight length mismatch: {0} != {1}".format(len(weights), len(vector)))
+        weights = list(weights)
+        if all(_is_plaintext(w) for w in weights):
+            total, count = _total(vector.c1.public_key, (v * w for v, w in zip(vector, weights))), sum(weights)
+        else:
+            total = vector.c1.dot(list(vector), weights, vector.c2)
+            count = _total(vector.c1.public_key, (vector.c1.public_key.encrypt(w, r_value=1) if _is_plaintext(w)
+                                                 else w for w in weights))
+
+    return total / count if _is_plaintext(count) else vector.c1.truediv(total, count, vector.c2)
+
+
+def secure_variance(vector, ddof=0):
+    """
+    TODO 安全方差协议
+    ! 平方和与和的平方合并为一轮交互, 除以公开计数本地完成
+    :param vector: 加密向量
+    :param ddof: 自由度修正 0: 总体方差 1: 样本方差
+    :return: 安全方差协议结果 E((n * sum(x^2) - sum(x)^2) / (n * (n - ddof)))
+    """
+    return secure_covariance(vector, vector, ddof)
+
+
+def secure_covariance(vector, other, ddof=0):
+    """
+    TODO 安全协方差协议
+    ! 乘积和与和的乘积合并为一轮交互, 除以公开计数本地完成
+    :param vector: 加密向量 x
+    :param other: 加密向量 y
+    :param ddof: 自由度修正 0: 总体协方差 1: 样本协方差
+    :return: 安全协方差协议结果 E((n * sum(x * y) - sum(x) * sum(y)) / (n * (n - ddof)))
+    """
+    n = len(vector)
+    if n <= ddof:
+        raise ValueError("Need more than {0} elements, got {1}".format(ddof, n))
+    _, _, sxy, sxsy = _moments(vector, other)
+
+    return (sxy * n - sxsy) / (n * (n - ddof))
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 20:10
+@File: array.py
+@License: MIT
+"""
+import sys
+
+from phe import EncryptedNumber
+
+from smpcp import wire
+from smpcp.smpcp import SecureMultiPartyComputationProtocol
+from smpcp.vector import EncryptedVector
+
+
+class CipherArray:
+    """
+    密文数组类
+    ! 密文以定长大端字节连续存放, 整个数组共用一个公钥与指数, 取出元素时才构造加密数字
+    """
+
+    def __init__(self, public_key, exponent=0, data=None):
+        """
+        密文数组类 定义
+        :param public_key: 公钥
+        :param exponent: 共用指数
+        :param data: 密文数据 定长大端字节 长度为密文宽度的整数倍
+        """
+        self.public_key = public_key
+        self.exponent = exponent
+        self.width = wire.width(public_key)
+        self._data = bytearray(data) if data is not None else bytearray()
+        if len(self._data) % self.width:
+            raise ValueError("Data length {0} is not a multiple of {1}".format(len(self._data), self.width))
+
+    @classmethod
+    def from_numbers(cls, public_key, encrypted_numbers):
+        """
+        密文数组类 由加密数字列表构造
+        ! 指数不一致时统一降低到最小指数
+        :param public_key: 公钥
+        :param encrypted_numbers: 加密数字列表
+        :return: 密文数组
+        """
+        encrypted_numbers = list(encrypted_numbers)
+        array = cls(public_key, min((v.exponent for v in encrypted_numbers), default=0))
+        array._data = bytearray(b''.join(array._pack(v) for v in encrypted_numbers))
+
+        return array
+
+    @classmethod
+    def from_vector(cls, vector):
+        """
+        密文数组类 由加密向量构造
+        :param vector: 加密向量
+        :return: 密文数组
+        """
+        return cls.from_numbers(vector.c1.public_key, vector.ciphers)
+
+    @classmethod
+    def from_protocols(cls, public_key, protocols):
+        """
+        密文数组类 由安全多方计算协议对象列表构造
+        :param public_key: 公钥
+        :param protocols: 安全多方计算协议对象列表
+        :return: 密文数组
+        """
+        return cls.from_numbers(public_key, [v.decode() for v in protocols])
+
+    @classmethod
+    def from_wire(cls, public_key, data):
+        """
+        密文数组类 由二进制格式构造
+        :param public_key: 公钥
+        :param data: wire.encode_batch编码结果
+        :return: 密文数组
+        """
+        view = wire.BatchView(public_key, data)
+        if len(set(view.exponents)) > 1:
+            return cls.from_numbers(public_key, view)
+
+        return cls(public_key, view.exponents[0] if view.exponents else 0, view.ciphertexts)
+
+    def to_wire(self):
+        """
+        密文数组类 编码为二进制格式
+        :return: wire格式编码结果
+        """
+        return wire.encode_batch(self.public_key, self.to_list())
+
+    def to_list(self):
+        """
+        密文数组类 转为加密数字列表
+        :return: 加密数字列表
+        """
+        return list(self)
+
+    def to_vector(self, c1, c2):
+        """
+        密文数组类 转为加密向量
+        :param c1: 云服务器
+        :param c2: 第三方云服务器
+        :return: 加密向量
+        """
+        return EncryptedVector(c1=c1, c2=c2, ciphers=self)
+
+    def to_protocols(self, c1, c2):
+        """
+        密文数组类 转为安全多方计算协议对象列表
+        :param c1: 云服务器
+        :param c2: 第三方云服务器
+        :return: 安全多方计算协议对象列表
+        """
+        return [SecureMultiPartyComputationProtocol(c1=c1, c2=c2, cipher=v) for v in self]
+
+    def _pack(self, encrypted_number):
+        """
+        密文数组类 密文转定长字节
+        :param encrypted_number: 加密数字
+        :return: 定长大端字节
+        """
+        if encrypted_number.public_key != self.public_key:
+            raise ValueError("Encrypted number was encrypted under a different key")
+        if encrypted_number.exponent != self.exponent:
+            encrypted_number = encrypted_number.decrease_exponent_to(self.exponent)
+
+        return encrypted_number.ciphertext(be_secure=False).to_bytes(self.width, 'big')
+
+    def append(self, encrypted_number):
+        """
+        密文数组类 追加
+        :param encrypted_number: 加密数字
+        """
+        self._data += self._pack(encrypted_number)
+
+    def extend(self, encrypted_numbers):
+        """
+        密文数组类 批量追加
+        :param encrypted_numbers: 加密数字列表
+        """
+        self._data += b''.join(self._pack(v) for v in encrypted_numbers)
+
+    @property
+    def nbytes(self):
+        """
+        密文数组类 占用内存
+        :return: 字节数
+        """
+        return sys.getsizeof(self._data) + sys.getsizeof(self)
+
+    def memory_per_element(self):
+        """
+        密文数组类 每个元素平均占用内存
+        :return: 字节数
+        """
+        return self.nbytes / len(self) if len(self) else 0.0
+
+    def __len__(self):
+        return len(self._data) // self.width
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            start, stop, step = item.indices(len(self))
+            if step == 1:
+                return CipherArray(self.public_key, self.exponent, self._data[start * self.width:stop * self.width])
+            return CipherArray.from_numbers(self.public_key, [self[i] for i in range(start, stop, step)])
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError("CipherArray index out of range")
+        start = item * self.width
+
+        return EncryptedNumber(self.public_key, int.from_bytes(self._data[start:start + self.width], 'big'),
+                               self.exponent)
+
+    def __iter__(self):
+        for start in range(0, len(self._data), self.width):
+            yield EncryptedNumber(self.public_key, int.from_bytes(self._data[start:start + self.width], 'big'),
+                                  self.exponent)
@@ -0,0 +1,321 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/19 03:50
+@File: circuit.py
+@License: MIT
+"""
+from smpcp.graph import _Round
+
+# 需要与第三方云服务器交互的节点: 与/或为一次安全乘法, norm为一次安全奇偶性判断
+_INTERACTIVE = ('and', 'or', 'norm')
+
+
+class Circuit:
+    """
+    布尔电路类
+    ! 导线以奇偶性表示比特 (值 mod 2): 异或为同态加法, 非为加1, 均在本地完成
+    ! 与/或各需一次安全乘法, 同一乘法深度的门合并为一轮批量调用
+    ! 导线值随深度增长, 将超出2^bit_length时先经一轮批量安全奇偶性判断协议归一化
+    ! 输出统一归一化为 E(0) or E(1)
+    """
+
+    def __init__(self, netlist=None, outputs=None):
+        """
+        布尔电路类 定义
+        :param netlist: 网表 [(op, *operands), ...] 导线编号即下标
+                        op: 'input', 'const', 'xor', 'and', 'or', 'not'
+        :param outputs: 输出导线列表
+        """
+        self.netlist = list(netlist) if netlist is not None else []
+        self.outputs = list(outputs) if outputs is not None else []
+
+    def _gate(self, op, *operands):
+        """
+        布尔电路类 添加门
+        :param op: 门类型
+        :param operands: 输入导线 or 常量
+        :return: 输出导线
+        """
+        self.netlist.append((op,) + operands)
+
+        return len(self.netlist) - 1
+
+    def input(self):
+        """
+        布尔电路类 添加输入
+        :return: 输入导线
+        """
+        return self._gate('input')
+
+    def inputs(self, count):
+        """
+        布尔电路类 批量添加输入
+        :param count: 输入数量
+        :return: 输入导线列表
+        """
+        return [self.input() for _ in range(count)]
+
+    def constant(self, bit):
+        """
+        布尔电路类 添加常量
+        :param bit: 0 or 1
+        :return: 常量导线
+        """
+        return self._gate('const', bit)
+
+    def bit_xor(self, a, b):
+        return self._gate('xor', a, b)
+
+    def bit_and(self, a, b):
+        return self._gate('and', a, b)
+
+    def bit_or(self, a, b):
+        return self._gate('or', a, b)
+
+    def bit_not(self, a):
+        return self._gate('not', a)
+
+    def output(self, *wires):
+        """
+        布尔电路类 添加输出
+        :param wires: 输出导线
+        """
+        self.outputs.extend(wires)
+
+    def _compile(self, limit):
+        """
+        布尔电路类 编译
+        ! 剔除不影响输出的门, 按上界插入归一化节点, 计算每个节点的乘法深度
+        :param limit: 导线值上界
+        :return: (节点列表 [(op, operands, param)], 节点深度列表, 输出节点列表)
+        """
+        live, stack = set(), list(self.outputs)
+        while stack:
+            wire = stack.pop()
+            if not 0 <= wire < len(self.netlist):
+                raise ValueError("Undefined wire: {0}".format(wire))
+            if wire not in live:
+                live.add(wire)
+                op, *operands = self.netlist[wire]
+                if op in ('xor', 'and', 'or', 'not'):
+                    if any(v >= wire for v in operands):
+                        raise ValueError("Wire {0} is used before it is defined".format(max(operands)))
+                    stack.extend(operands)
+
+        nodes, depth, bound, wires, normalized = [], [], [], {}, {}
+
+        def add(op, operands, param, node_bound, level=None):
+            nodes.append((op, operands, param))
+            depth.append(level if level is not None else
+                         max((depth[v] for v in operands), default=0) + (op in _INTERACTIVE))
+            bound.append(node_bound)
+            return len(nodes) - 1
+
+        def constant(v):
+            return nodes[v][0] == 'const'
+
+        def normalize(v):
+            if constant(v) or bound[v] <= 1:
+                return v
+            if v not in normalized:
+                normalized[v] = add('norm', (v,), None, 1)
+            return normalized[v]
+
+        def fit(a, b, combine):
+            while combine(bound[a], bound[b]) > limit:
+                if bound[a] >= bound[b] and bound[a] > 1:
+                    a = normalize(a)
+                elif bound[b] > 1:
+                    b = normalize(b)
+                else:
+                    raise ValueError("Wire bound exceeds the plaintext limit")
+            return a, b
+
+        count = 0
+        for wire, (op, *operands) in enumerate(self.netlist):
+            if op == 'input':
+                wires[wire] = add('input', (), count, 1)
+                count += 1
+            elif wire not in live:
+                continue
+            elif op == 'const':
+                if operands[0] not in (0, 1):
+                    raise ValueError("Constant must be 0 or 1, got {0}".format(operands[0]))
+                wires[wire] = add('const', (), operands[0], operands[0])
+            elif op in ('xor', 'and', 'or', 'not') and all(constant(wires[v]) for v in operands):
+                # 常量折叠: 输入均为常量的门直接求值
+                bits = [nodes[wires[v]][2] for v in operands]
+                value = {'xor': lambda x, y: x ^ y, 'and': lambda x, y: x & y, 'or': lambda x, y: x | y,
+                         'not': lambda x: 1 - x}[op](*bits)
+                wires[wire] = add('const', (), value % 2, value % 2)
+            elif op == 'not':
+                a, _ = fit(wires[operands[0]], wires[operands[0]], lambda x, y: x + 1)
+                wires[wire] = add('not', (a,), None, bound[a] + 1)
+            elif op == 'xor':
+                a, b = fit(wires[operands[0]], wires[operands[1]], lambda x, y: x + y)
+                wires[wire] = add('xor', (a, b), None, bound[a] + bound[b])
+            elif op in ('and', 'or'):
+                a, b = wires[operands[0]], wires[operands[1]]
+                combine = (lambda x, y: x * y) if op == 'and' else (lambda x, y: x + y + x * y)
+                if constant(a) or constant(b):
+                    op = 'and_local' if op == 'and' else 'or_local'
+                else:
+                    a, b = fit(a, b, combine)
+                wires[wire] = add(op, (a, b), None, combine(bound[a], bound[b]))
+            else:
+                raise ValueError("Unsupported gate: {0}".format(op))
+
+        # 输出归一化统一推迟到最后一层, 合并为一次批量调用
+        outputs = [wires[wire] for wire in self.outputs]
+        pending = {v for v in outputs if not constant(v) and bound[v] > 1 and v not in normalized}
+        level = max((depth[v] for v in pending), default=0) + 1
+        for v in sorted(pending):
+            normalized[v] = add('norm', (v,), None, 1, level)
+
+        return nodes, depth, [normalize(v) for v in outputs]
+
+    def rounds(self, bit_length=64):
+        """
+        布尔电路类 交互轮数
+        :param bit_length: 导线值位宽上限 与CloudPlatform.bit_length一致
+        :return: 交互轮数 乘法深度 + 归一化轮次 (输出归一化至多一轮)
+        """
+        _, depth, _ = self._compile(1 << bit_length)
+
+        return max(depth, default=0)
+
+    def evaluate(self, c1, c2, inputs):
+        """
+        TODO 布尔电路类 安全电路计算
+        ! 同一深度的与/或门合并为一次批量安全乘法协议, 归一化节点合并为一次批量安全奇偶性判断协议, 两者同为一轮交互
+        :param c1: 云服务器
+        :param c2: 第三方云服务器
+        :param inputs: 加密比特列表 E(0) or E(1) 按输入导线顺序
+        :return: 输出加密比特列表 E(0) or E(1)
+        """
+        nodes, depth, outputs = self._compile(1 << c1.bit_length)
+        count = sum(op == 'input' for op, _, _ in nodes)
+        if len(inputs) != count:
+            raise ValueError("Expected {0} inputs, got {1}".format(count, len(inputs)))
+
+        levels = {}
+        for i, d in enumerate(depth):
+            levels.setdefault(d, []).append(i)
+
+        values = [None] * len(nodes)
+        for d in sorted(levels):
+            products = [i for i in levels[d] if nodes[i][0] in ('and', 'or')]
+            norms = [i for i in levels[d] if nodes[i][0] == 'norm']
+            protocols = []
+            if products:
+                protocols.append(lambda proxy: c1.mul_batch([values[nodes[i][1][0]] for i in products],
+                                                            [values[nodes[i][1][1]] for i in products], proxy))
+            if norms:
+                protocols.append(lambda proxy: c1.parity_batch([values[nodes[i][1][0]] for i in norms], proxy))
+            results = _Round(c2).run(protocols) if protocols else []
+            if products:
+                for i, v in zip(products, results[0]):
+                    a, b = nodes[i][1]
+                    values[i] = v if nodes[i][0] == 'and' else values[a] + values[b] + v
+            if norms:
+                for i, v in zip(norms, results[-1]):
+                    values[i] = v
+            for i in levels[d]:
+                op, operands, param = nodes[i]
+                if op not in _INTERACTIVE:
+                    values[i] = _local(op, [values[v] for v in operands], param, inputs)
+
+        return [c1.public_key.encrypt(values[i]) if isinstance(values[i], int) else values[i] for i in outputs]
+
+
+def _local(op, operands, param, inputs):
+    """
+    本地门计算
+    :param op: 节点类型
+    :param operands: 输入值
+    :param param: 节点参数
+    :param inputs: 电路输入
+    :return: 输出值
+    """
+    if op == 'input':
+        return inputs[param]
+    if op == 'const':
+        return param
+    if op == 'not':
+        return operands[0] + 1
+    if op == 'xor':
+        return operands[0] + operands[1]
+    a, b = operands
+    if isinstance(a, int):
+        a, b = b, a
+
+    return a * b if op == 'and_local' else a + b + a * b
+
+
+def comparison_circuit(bit):
+    """
+    比较电路 a > b
+    ! 逐位计算 (大于, 相等) 后按二叉树合并, 乘法深度 1 + ceil(log2(bit)), 另加一轮输出归一化
+    :param bit: 位数
+    :return: 布尔电路 输入: a, b 各bit位 高位在前 输出: [a > b]
+    """
+    circuit = Circuit()
+    a, b = circuit.inputs(bit), circuit.inputs(bit)
+    pairs = [(circuit.bit_and(x, circuit.bit_not(y)), circuit.bit_not(circuit.bit_xor(x, y))) for x, y in zip(a, b)]
+    while len(pairs) > 1:
+        merged = []
+        for (g1, e1), (g2, e2) in zip(pairs[0::2], pairs[1::2]):
+            # 高位相等时取低位结果, 两项互斥, 或等价于异或
+            merged.append((circuit.bit_xor(g1, circuit.bit_and(e1, g2)), circuit.bit_and(e1, e2)))
+        pairs = merged + pairs[len(merged) * 2:]
+    circuit.output(pairs[0][0])
+
+    return circuit
+
+
+def equality_circuit(bit):
+    """
+    相等电路 a == b
+    ! 逐位同或后按二叉树求与, 乘法深度 ceil(log2(bit)), 另加一轮输出归一化
+    :param bit: 位数
+    :return: 布尔电路 输入: a, b 各bit位 高位在前 输出: [a == b]
+    """
+    circuit = Circuit()
+    a, b = circuit.inputs(bit), circuit.inputs(bit)
+    terms = [circuit.bit_not(circuit.bit_xor(x, y)) for x, y in zip(a, b)]
+    while len(terms) > 1:
+        merged = [circuit.bit_and(x, y) for x, y in zip(terms[0::2], terms[1::2])]
+        terms = merged + terms[len(merged) * 2:]
+    circuit.output(terms[0])
+
+    return circuit
+
+
+def adder_circuit(bit):
+    """
+    加法电路 a + b
+    ! Kogge-Stone并行前缀进位, 乘法深度 1 + ceil(log2(bit)), 另加一轮输出归一化
+    :param bit: 位数
+    :return: 布尔电路 输入: a, b 各bit位 高位在前 输出: bit + 1位和 高位在前
+    """
+    circuit = Circuit()
+    a, b = circuit.inputs(bit), circuit.inputs(bit)
+    a, b = a[::-1], b[::-1]  # 低位在前
+    p = [circuit.bit_xor(x, y) for x, y in zip(a, b)]
+    g = [circuit.bit_and(x, y) for x, y in zip(a, b)]
+    propagate, generate, distance = list(p), list(g), 1
+    while distance < bit:
+        generate = generate[:distance] + [
+            circuit.bit_xor(generate[i], circuit.bit_and(propagate[i], generate[i - distance]))
+            for i in range(distance, bit)]
+        propagate = propagate[:distance] + [circuit.bit_and(propagate[i], propagate[i - distance])
+                                            for i in range(distance, bit)]
+        distance <<= 1
+    total = [p[0]] + [circuit.bit_xor(p[i], generate[i - 1]) for i in range(1, bit)]
+    circuit.output(generate[-1], *total[::-1])
+
+    return circuit
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/19 02:30
+@File: condition.py
+@License: MIT
+"""
+from smpcp.smpcp import SecureMultiPartyComputationProtocol
+
+
+def _decode(value):
+    """
+    操作数解码
+    :param value: 安全多方计算协议对象 or 密文 or 明文
+    :return: 密文 or 明文
+    """
+    return value.decode() if isinstance(value, SecureMultiPartyComputationProtocol) else value
+
+
+def secure_select(cond, a, b):
+    """
+    TODO 安全选择协议
+    ! 只能用于二进制条件, 一轮交互
+    :param cond: 安全多方计算协议对象 加密条件 E(1) or E(0)
+    :param a: 安全多方计算协议对象 or 密文 or 明文 条件为1时的结果
+    :param b: 安全多方计算协议对象 or 密文 or 明文 条件为0时的结果
+    :return: 安全选择协议结果 E(cond ? a : b)
+    """
+    return cond.c1.select(cond.decode(), _decode(a), _decode(b), cond.c2)
+
+
+def secure_where(conds, a, b):
+    """
+    TODO 批量安全选择协议
+    ! 只能用于二进制条件, 所有选择合并为一轮交互
+    :param conds: 加密向量 加密条件
+    :param a: 加密向量 or 密文列表 or 明文 条件为1时的结果
+    :param b: 加密向量 or 密文列表 or 明文 条件为0时的结果
+    :return: 批量安全选择协议结果 [E(conds[i] ? a[i] : b[i]), ...]
+    """
+    return conds.c1.select_batch(conds.decode(), conds._operand(a), conds._operand(b), conds.c2)
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 21:10
+@File: fixed.py
+@License: MIT
+"""
+
+
+def encode_fixed(value, precision):
+    """
+    定点数编码
+    :param value: 明文
+    :param precision: 小数位数(二进制)
+    :return: 整数编码 round(value * 2^precision)
+    """
+    return round(value * (1 << precision))
+
+
+def decode_fixed(value, precision):
+    """
+    定点数解码
+    :param value: 整数编码
+    :param precision: 小数位数(二进制)
+    :return: 明文
+    """
+    return value / (1 << precision)
+
+
+class EncryptedFixed:
+    """
+    加密定点数类
+    ! 密文统一为指数为0的整数编码 x * 2^precision, 加减无需对齐指数, 乘法后由安全截断协议恢复精度
+    """
+
+    def __init__(self, c1, c2, cipher=None, precision=16):
+        """
+        加密定点数类 定义
+        :param c1: 云服务器
+        :param c2: 第三方云服务器
+        :param cipher: 密文 整数编码
+        :param precision: 小数位数(二进制)
+        """
+        self.c1 = c1
+        self.c2 = c2
+        self.cipher = cipher
+        self.precision = precision
+
+    def encode(self, encrypted_number):
+        """
+        加密定点数类 编码
+        :param encrypted_number: 加密数字 整数编码
+        :return: 编码后的加密定点数
+        """
+        return EncryptedFixed(c1=self.c1, c2=self.c2, cipher=encrypted_number, precision=self.precision)
+
+    def decode(self):
+        """
+        加密定点数类 解码
+        :return: 解码后的加密数字 整数编码
+        """
+        return self.cipher
+
+    def encrypt(self, value):
+        """
+        加密定点数类 加密
+        :param value: 明文
+        :return: 加密定点数
+        """
+        return self.encode(self.c1.public_key.encrypt(encode_fixed(value, self.precision)))
+
+    def decrypt(self, secret_key):
+        """
+        加密定点数类 解密
+        :param secret_key: 私钥
+        :return: 明文
+        """
+        return decode_fixed(secret_key.decrypt(self.cipher), self.precision)
+
+    def _operand(self, other):
+        """
+        加密定点数类 操作数转换
+        :param other: 加密定点数 or 明文
+        :return: 密文 or 整数编码
+        """
+        if isinstance(other, EncryptedFixed):
+            if other.precision != self.precision:
+                raise ValueError("Precision mismatch: {0} != {1}".format(self.precision, other.precision))
+            return other.cipher
+
+        return encode_fixed(other, self.precision)
+
+    def __add__(self, other):
+        return self.encode(self.cipher + self._operand(other))
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        return self.encode(self.cipher - self._operand(other))
+
+    def __rsub__(self, other):
+        return self.encode(self._operand(other) - self.cipher)
+
+    def __neg__(self):
+        return self.encode(self.cipher * -1)
+
+    def __mul__(self, other):
+        """
+        TODO 加密定点数类 安全乘法协议
+        ! 整数明文本地计算; 小数明文一轮截断; 密文一轮乘法加一轮截断
+        :param other: 加密定点数 or 明文
+        :return: 加密定点数 E(self * other)
+        """
+        if isinstance(other, int):
+            return self.encode(self.cipher * other)
+
+        return mul_batch([self], [other])[0]
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def optimum(self, other, mode):
+        """
+        TODO 加密定点数类 安全最值计算协议
+        :param other: 加密定点数 or 明文
+        :param mode: 'max' or 'min'
+        :return: 加密定点数 E(max(self, other)) or E(min(self, other))
+        """
+        return self.encode(self.c1.optimum(self.cipher, self._operand(other), self.c2, mode))
+
+    def __eq__(self, other):
+        """
+        TODO 加密定点数类 安全相等协议
+        :param other: 加密定点数 or 明文
+        :return: 安全相等协议结果 E(self == other)
+        """
+        return self.c1.eq(self.cipher, self._operand(other), self.c2)
+
+    def __ne__(self, other):
+        """
+        TODO 加密定点数类 安全不相等协议
+        :param other: 加密定点数 or 明文
+        :return: 安全不相等协议结果 E(self != other)
+        """
+        return self.c1.ne(self.cipher, self._operand(other), self.c2)
+
+    def __gt__(self, other):
+        """
+        TODO 加密定点数类 安全大于协议
+        :param other: 加密定点数 or 明文
+        :return: 安全大于协议结果 E(self > other)
+        """
+        return self.c1.gt(self.cipher, self._operand(other), self.c2)
+
+    def __ge__(self, other):
+        """
+        TODO 加密定点数类 安全大于等于协议
+        :param other: 加密定点数 or 明文
+        :return: 安全大于等于协议结果 E(self >= other)
+        """
+        return self.c1.ge(self.cipher, self._operand(other), self.c2)
+
+    def __lt__(self, other):
+        """
+        TODO 加密定点数类 安全小于协议
+        :param other: 加密定点数 or 明文
+        :return: 安全小于协议结果 E(self < other)
+        """
+        return self.c1.lt(self.cipher, self._operand(other), self.c2)
+
+    def __le__(self, other):
+        """
+        TODO 加密定点数类 安全小于等于协议
+        :param other: 加密定点数 or 明文
+        :return: 安全小于等于协议结果 E(self <= other)
+        """
+        return self.c1.le(self.cipher, self._operand(other), self.c2)
+
+
+def mul_batch(x, y):
+    """
+    TODO 批量定点数安全乘法协议
+    ! 所有密文乘法合并为一轮, 所有截断合并为一轮
+    :param x: 加密定点数列表
+    :param y: 加密定点数 or 明文列表
+    :return: 加密定点数列表 [E(x[i] * y[i]), ...]
+    """
+    if not x:
+        return []
+    head = x[0]
+    encrypted = [i for i, b in enumerate(y) if isinstance(b, EncryptedFixed)]
+    products = [None if isinstance(b, EncryptedFixed) else a.cipher * a._operand(b) for a, b in zip(x, y)]
+    if encrypted:
+        result = head.c1.mul_batch([x[i].cipher for i in encrypted], [x[i]._operand(y[i]) for i in encrypted], head.c2)
+        for i, v in zip(encrypted, result):
+            products[i] = v
+
+    return [head.encode(v) for v in head.c1.truncate_batch(products, head.precision, head.c2)]
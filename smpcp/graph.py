@@ -0,0 +1,496 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 16:20
+@File: graph.py
+@License: MIT
+"""
+import functools
+import threading
+
+from phe import EncryptedNumber
+
+# 本地运算: 无需与第三方云服务器交互
+_LOCAL = {
+    'add': lambda c1, c2, a, b: a + b,
+    'sub': lambda c1, c2, a, b: a - b,
+    'neg': lambda c1, c2, a: a * -1,
+    'scale': lambda c1, c2, a, b: c1.mul(a, b, c2),
+    'div': lambda c1, c2, a, b: c1.truediv(a, b, c2),
+    'item': lambda c1, c2, a, b: a[b],
+}
+
+# 协议运算: 同时可用的同类节点合并为一次批量协议调用
+_BATCH = {
+    'mul': lambda c1, c2, a, b: c1.mul_batch(a, b, c2),
+    'truediv': lambda c1, c2, a, b: c1.truediv_batch(a, b, c2),
+    'optimum': lambda c1, c2, a, b, mode: c1.optimum_batch(a, b, c2, mode),
+    'parity': lambda c1, c2, a: c1.parity_batch(a, c2),
+    'bit_dec': lambda c1, c2, a, bit: c1.bit_dec_batch(a, bit, c2),
+    'lt': lambda c1, c2, a, b: c1.lt_batch(a, b, c2),
+    'eq': lambda c1, c2, a, b, plaintext: c1.eq_batch(a, b, c2),
+}
+
+# 交换律运算: 去重时忽略操作数顺序
+_COMMUTATIVE = ('add', 'mul', 'eq')
+
+
+def _is_plaintext(value):
+    """
+    明文判断
+    :param value: 节点 or 明文
+    :return: 是否为明文
+    """
+    return isinstance(value, (int, float))
+
+
+class _Round:
+    """
+    轮次调度类
+    ! 每组批量协议在独立线程中执行, 以本对象代替第三方云服务器;
+    ! 所有线程都在等待第三方云服务器或已结束时, 本轮请求合并为一次多协议批量调用
+    """
+
+    def __init__(self, c2):
+        """
+        轮次调度类 定义
+        :param c2: 第三方云服务器
+        """
+        self.c2 = c2
+        self.error = None
+        self._condition = threading.Condition()
+        self._running = 0
+        self._requests = []
+        self._done = []
+
+    @property
+    def failed(self):
+        return self.error is not None
+
+    def __getattr__(self, name):
+        if name.startswith('_') or not callable(getattr(self.c2, name, None)):
+            raise AttributeError(name)
+
+        return functools.partial(self._call, name)
+
+    def _call(self, method, *args):
+        """
+        轮次调度 协议线程发起第三方云服务器请求 等待本轮合并调用返回
+        :param method: 协议方法名
+        :param args: 位置参数
+        :return: 协议结果
+        """
+        slot = []
+        with self._condition:
+            self._requests.append((method, list(args), slot))
+            self._running -= 1
+            self._condition.notify_all()
+            while not slot:
+                self._condition.wait()
+        succeeded, value = slot[0]
+        if not succeeded:
+            raise value
+
+        return value
+
+    def run(self, protocols):
+        """
+        轮次调度 并行执行一组互不依赖的批量协议
+        :param protocols: 批量协议列表 protocol(c2) -> 结果列表
+        :return: 各批量协议结果列表
+        """
+        if len(protocols) == 1:
+            return [protocols[0](self.c2)]
+
+        results = [None] * len(protocols)
+        for i, protocol in enumerate(protocols):
+            self.start(i, protocol)
+        while True:
+            for i, result in self.wait():
+                results[i] = result
+            if not self.flush():
+                break
+        if self.failed:
+            raise self.error
+
+        return results
+
+    def start(self, group, protocol):
+        """
+        轮次调度 在新线程中执行批量协议
+        :param group: 节点列表
+        :param protocol: 批量协议 protocol(c2) -> 结果列表
+        """
+        def run():
+            result, error = None, None
+            try:
+                result = protocol(self)
+            except Exception as e:
+                error = e
+            with self._condition:
+                self._running -= 1
+                if error is None:
+                    self._done.append((group, result))
+                elif self.error is None:
+                    self.error = error
+                self._condition.notify_all()
+
+        with self._condition:
+            self._running += 1
+        threading.Thread(target=run, daemon=True).start()
+
+    def wait(self):
+        """
+        轮次调度 等待所有线程等待第三方云服务器或结束
+        :return: 已完成的 (节点列表, 结果列表) 列表
+        """
+        with self._condition:
+            while self._running:
+                self._condition.wait()
+            done, self._done = self._done, []
+
+        return done
+
+    def flush(self):
+        """
+        轮次调度 本轮请求合并为一次多协议批量调用 出错后不再调用, 各请求以同一异常结束
+        :return: 是否有请求
+        """
+        with self._condition:
+            requests, self._requests = self._requests, []
+        if not requests:
+            return False
+
+        if self.error is None:
+            try:
+                results = [(True, v) for v in self.c2.batch([(method, args) for method, args, _ in requests])]
+            except Exception as e:
+                self.error = e
+        if self.error is not None:
+            results = [(False, self.error)] * len(requests)
+        with self._condition:
+            self._running += len(requests)
+            for (_, _, slot), result in zip(requests, results):
+                slot.append(result)
+            self._condition.notify_all()
+
+        return True
+
+
+class ProtocolGraph:
+    """
+    惰性协议计算图类
+    ! 运算只记录节点, evaluate() 时同一轮次的协议合并为一次第三方云服务器调用, 相同子表达式只计算一次
+    """
+
+    def __init__(self, c1, c2):
+        """
+        惰性协议计算图类 定义
+        :param c1: 云服务器
+        :param c2: 第三方云服务器
+        """
+        self.c1 = c1
+        self.c2 = c2
+        self._nodes = {}
+
+    def encode(self, encrypted_number):
+        """
+        惰性协议计算图类 编码
+        :param encrypted_number: 加密数字
+        :return: 叶子节点
+        """
+        return self._node('leaf', (), (encrypted_number,))
+
+    def _node(self, op, operands, params=()):
+        """
+        惰性协议计算图类 创建节点 相同子表达式返回已有节点
+        :param op: 运算
+        :param operands: 操作数 节点 or 明文
+        :param params: 附加参数
+        :return: 节点
+        """
+        operands = tuple(self._operand(v) for v in operands)
+        keys = [('node', id(v)) if isinstance(v, LazyNode) else (type(v).__name__, v) for v in operands]
+        if op in _COMMUTATIVE:
+            keys.sort()
+        key = (op, tuple(keys), tuple(id(v) if isinstance(v, EncryptedNumber) else v for v in params))
+        if key not in self._nodes:
+            self._nodes[key] = LazyNode(self, op, operands, params)
+
+        return self._nodes[key]
+
+    def _operand(self, value):
+        """
+        惰性协议计算图类 操作数转换
+        :param value: 节点 or 密文 or 明文
+        :return: 节点 or 明文
+        """
+        if isinstance(value, LazyNode):
+            if value.graph is not self:
+                raise ValueError("Cannot combine nodes from different graphs")
+            return value
+        if isinstance(value, EncryptedNumber):
+            return self.encode(value)
+        if _is_plaintext(value):
+            return value
+
+        raise TypeError("Unsupported operand type: {0}".format(type(value).__name__))
+
+    def evaluate(self, *nodes):
+        """
+        惰性协议计算图类 计算
+        ! 操作数可用的同类协议节点合并为一次批量协议, 各批量协议并行执行;
+        ! 每一轮所有协议发往第三方云服务器的请求合并为一次多协议批量调用, 多轮协议的后续轮次同样与其他协议合并
+        :param nodes: 待计算节点
+        :return: 计算结果列表
+        """
+        pending, stack, seen = [], list(nodes), set()
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, LazyNode) or id(node) in seen or node.computed:
+                continue
+            seen.add(id(node))
+            pending.append(node)
+            stack.extend(node.operands)
+
+        pending = [node for node in reversed(pending) if node.op in _BATCH]
+        scheduler = _Round(self.c2)
+        while True:
+            if not scheduler.failed:
+                groups, waiting = {}, []
+                for node in pending:
+                    if all(self._available(v) for v in node.operands):
+                        groups.setdefault((node.op, node.params), []).append(node)
+                    else:
+                        waiting.append(node)
+                pending = waiting
+                for (op, params), group in groups.items():
+                    args = [[self._value(node.operands[i]) for node in group] for i in range(len(group[0].operands))]
+                    scheduler.start(group, lambda c2, op=op, args=args, params=params:
+                                    _BATCH[op](self.c1, c2, *args, *params))
+
+            done = scheduler.wait()
+            for group, values in done:
+                for node, value in zip(group, values):
+                    node.set_value(value)
+            if not done and not scheduler.flush():
+                break
+
+        if scheduler.failed:
+            raise scheduler.error
+
+        return [self._value(node) for node in nodes]
+
+    def _available(self, node):
+        """
+        惰性协议计算图类 节点可用判断 本地运算的操作数均可用时可用
+        :param node: 节点 or 明文
+        :return: 是否可用
+        """
+        if not isinstance(node, LazyNode) or node.computed:
+            return True
+
+        return node.op in _LOCAL and all(self._available(v) for v in node.operands)
+
+    def _value(self, node):
+        """
+        惰性协议计算图类 节点取值 本地运算按需计算
+        :param node: 节点 or 明文
+        :return: 节点结果
+        """
+        if not isinstance(node, LazyNode):
+            return node
+        if not node.computed:
+            node.set_value(_LOCAL[node.op](self.c1, self.c2, *(self._value(v) for v in node.operands), *node.params))
+
+        return node.value
+
+
+class LazyNode:
+    """
+    惰性协议计算节点类
+    """
+
+    def __init__(self, graph, op, operands, params):
+        """
+        惰性协议计算节点类 定义
+        :param graph: 所属计算图
+        :param op: 运算
+        :param operands: 操作数 节点 or 明文
+        :param params: 附加参数
+        """
+        self.graph = graph
+        self.op = op
+        self.operands = operands
+        self.params = params
+        self.computed = op == 'leaf'
+        self.value = params[0] if self.computed else None
+
+    def set_value(self, value):
+        """
+        惰性协议计算节点类 写入结果
+        :param value: 结果
+        """
+        self.value = value
+        self.computed = True
+
+    def evaluate(self):
+        """
+        惰性协议计算节点类 计算
+        :return: 计算结果
+        """
+        return self.graph.evaluate(self)[0]
+
+    def __add__(self, other):
+        return self.graph._node('add', (self, other))
+
+    def __radd__(self, other):
+        return self.graph._node('add', (other, self))
+
+    def __sub__(self, other):
+        return self.graph._node('sub', (self, other))
+
+    def __rsub__(self, other):
+        return self.graph._node('sub', (other, self))
+
+    def __neg__(self):
+        return self.graph._node('neg', (self,))
+
+    def __mul__(self, other):
+        """
+        TODO 惰性协议计算节点类 安全乘法协议
+        :param other: 节点 or 密文 or 明文
+        :return: 节点 E(self * other)
+        """
+        if _is_plaintext(other):
+            return self.graph._node('scale', (self,), (other,))
+
+        return self.graph._node('mul', (self, other))
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        """
+        TODO 惰性协议计算节点类 安全除法协议
+        :param other: 节点 or 密文 or 明文
+        :return: 节点 E(self / other)
+        """
+        if _is_plaintext(other):
+            return self.graph._node('div', (self,), (other,))
+
+        return self.graph._node('truediv', (self, other))
+
+    def optimum(self, other, mode):
+        """
+        TODO 惰性协议计算节点类 安全最值计算协议
+        :param other: 节点 or 密文 or 明文
+        :param mode: 'max' or 'min'
+        :return: 节点 E(max(self, other)) or E(min(self, other))
+        """
+        return self.graph._node('optimum', (self, other), (mode,))
+
+    def parity(self):
+        """
+        TODO 惰性协议计算节点类 安全奇偶性判断协议
+        :return: 节点 奇数: E(1) 偶数: E(0)
+        """
+        return self.graph._node('parity', (self,))
+
+    def bit_dec(self, bit):
+        """
+        TODO 惰性协议计算节点类 安全二进制分解协议
+        :param bit: 位数
+        :return: 节点列表 [E(1) or E(0), ...] 高位在前 长度为bit
+        """
+        node = self.graph._node('bit_dec', (self,), (bit,))
+
+        return [self.graph._node('item', (node,), (i,)) for i in range(bit)]
+
+    def __and__(self, other):
+        """
+        TODO 惰性协议计算节点类 安全二进制与协议
+        ! 只能用于二进制数
+        :param other: 节点 or 密文 or 明文
+        :return: 节点 E(self & other)
+        """
+        return self * other
+
+    def __or__(self, other):
+        """
+        TODO 惰性协议计算节点类 安全二进制或协议
+        ! 只能用于二进制数
+        :param other: 节点 or 密文 or 明文
+        :return: 节点 E(self | other)
+        """
+        return self + other - self * other
+
+    def bit_not(self):
+        """
+        TODO 惰性协议计算节点类 安全二进制非协议
+        ! 只能用于二进制数
+        :return: 节点 E(!self)
+        """
+        return 1 - self
+
+    def __xor__(self, other):
+        """
+        TODO 惰性协议计算节点类 安全二进制异或协议
+        ! 只能用于二进制数
+        :param other: 节点 or 密文 or 明文
+        :return: 节点 E(self ^ other)
+        """
+        return self + other - self * other * 2
+
+    def __eq__(self, other):
+        """
+        TODO 惰性协议计算节点类 安全相等协议
+        :param other: 节点 or 密文 or 明文
+        :return: 节点 E(self == other)
+        """
+        return self.graph._node('eq', (self, other), (_is_plaintext(other),))
+
+    def __ne__(self, other):
+        """
+        TODO 惰性协议计算节点类 安全不相等协议
+        :param other: 节点 or 密文 or 明文
+        :return: 节点 E(self != other)
+        """
+        return 1 - (self == other)
+
+    def __gt__(self, other):
+        """
+        TODO 惰性协议计算节点类 安全大于协议
+        :param other: 节点 or 密文 or 明文
+        :return: 节点 E(self > other)
+        """
+        return self.graph._node('lt', (other, self))
+
+    def __ge__(self, other):
+        """
+        TODO 惰性协议计算节点类 安全大于等于协议
+        :param other: 节点 or 密文 or 明文
+        :return: 节点 E(self >= other)
+        """
+        return 1 - (self < other)
+
+    def __lt__(self, other):
+        """
+        TODO 惰性协议计算节点类 安全小于协议
+        :param other: 节点 or 密文 or 明文
+        :return: 节点 E(self < other)
+        """
+        return self.graph._node('lt', (self, other))
+
+    def __le__(self, other):
+        """
+        TODO 惰性协议计算节点类 安全小于等于协议
+        :param other: 节点 or 密文 or 明文
+        :return: 节点 E(self <= other)
+        """
+        return 1 - (self > other)
+
+    __hash__ = object.__hash__
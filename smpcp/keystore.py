@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 18:30
+@File: keystore.py
+@License: MIT
+"""
+import json
+import os
+import tempfile
+
+import phe
+from phe import PaillierPrivateKey, PaillierPublicKey
+
+VERSION = 1  # 密钥文件格式版本
+
+# 私钥中预计算的CRT参数, 加载时直接恢复, 无需重新计算
+_PRIVATE = ('p', 'q', 'psquare', 'qsquare', 'p_inverse', 'hp', 'hq')
+
+
+def dump_keypair(public_key, secret_key=None):
+    """
+    序列化密钥对
+    :param public_key: 公钥
+    :param secret_key: 私钥 None: 只序列化公钥
+    :return: 可JSON编码的密钥对
+    """
+    data = {'version': VERSION, 'n': format(public_key.n, 'x')}
+    if secret_key is not None:
+        data.update((name, format(getattr(secret_key, name), 'x')) for name in _PRIVATE)
+
+    return data
+
+
+def load_keypair(data):
+    """
+    反序列化密钥对
+    :param data: JSON解码后的密钥对
+    :return: (公钥, 私钥 or None)
+    """
+    if data.get('version') != VERSION:
+        raise ValueError("Unsupported keystore version: {0}".format(data.get('version')))
+    public_key = PaillierPublicKey(n=int(data['n'], 16))
+    if 'p' not in data:
+        return public_key, None
+
+    secret_key = PaillierPrivateKey.__new__(PaillierPrivateKey)
+    secret_key.public_key = public_key
+    for name in _PRIVATE:
+        setattr(secret_key, name, int(data[name], 16))
+    if secret_key.p * secret_key.q != public_key.n:
+        raise ValueError("Private key does not match the public key")
+
+    return public_key, secret_key
+
+
+def save(path, public_key, secret_key=None):
+    """
+    保存密钥对到文件
+    ! 先写临时文件再原子替换, 并发读取不会读到不完整的文件; 含私钥时文件权限为0600
+    :param path: 文件路径
+    :param public_key: 公钥
+    :param secret_key: 私钥 None: 只保存公钥
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp = tempfile.mkstemp(dir=directory, prefix='.keystore-')
+    try:
+        if secret_key is None:
+            os.chmod(temp, 0o644)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(dump_keypair(public_key, secret_key), f)
+        os.replace(temp, path)
+    except BaseException:
+        os.remove(temp)
+        raise
+
+
+def load(path):
+    """
+    从文件加载密钥对
+    :param path: 文件路径
+    :return: (公钥, 私钥 or None)
+    """
+    with open(path, encoding='utf-8') as f:
+        return load_keypair(json.load(f))
+
+
+def cached_keypair(path, n_length=2048):
+    """
+    加载缓存的密钥对, 不存在或长度不符时生成并保存
+    :param path: 文件路径
+    :param n_length: 密钥长度
+    :return: (公钥, 私钥)
+    """
+    if os.path.exists(path):
+        public_key, secret_key = load(path)
+        if secret_key is not None and public_key.n.bit_length() == n_length:
+            return public_key, secret_key
+
+    public_key, secret_key = phe.generate_paillier_keypair(n_length=n_length)
+    save(path, public_key, secret_key)
+
+    return public_key, secret_key
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/19 00:40
+@File: linalg.py
+@License: MIT
+"""
+
+
+def secure_dot(u, v):
+    """
+    TODO 安全内积协议
+    ! 所有元素一次掩码, 一轮交互
+    :param u: 加密向量
+    :param v: 加密向量 or 密文/明文列表
+    :return: 安全内积协议结果 E(sum(u[i] * v[i]))
+    """
+    if len(u) != len(v):
+        raise ValueError("Vector length mismatch: {0} != {1}".format(len(u), len(v)))
+
+    return u.c1.dot(list(u), list(v), u.c2)
+
+
+def secure_matmul(a, b):
+    """
+    TODO 安全矩阵乘法协议
+    ! 两个矩阵的每个元素只掩码一次, 一轮交互, 第三方云服务器解密 m * k + k * n 次, 加密 m * n 次
+    :param a: 加密矩阵 加密向量列表 每个加密向量为一行
+    :param b: 加密矩阵 加密向量 or 密文/明文列表的列表 每项为一行
+    :return: 安全矩阵乘法协议结果 加密向量列表 每个加密向量为一行
+    """
+    if not a:
+        raise ValueError("Cannot multiply an empty matrix")
+    head = a[0]
+
+    return [head.encode(row) for row in head.c1.matmul([list(row) for row in a], [list(row) for row in b], head.c2)]
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 12:30
+@File: mask.py
+@License: MIT
+"""
+import os
+import threading
+
+
+class MaskGenerator:
+    """
+    随机掩码生成器类
+    ! 一次读取大块系统熵并缓存, 按需切分出指定位宽的随机数
+    """
+
+    def __init__(self, block_size=65536):
+        """
+        随机掩码生成器类 定义
+        :param block_size: 每次读取的系统熵字节数
+        """
+        self.block_size = block_size
+        self._buffer = memoryview(b'')
+        self._offset = 0
+        self._lock = threading.Lock()
+
+    def _read(self, size):
+        """
+        随机掩码生成器 读取随机字节
+        :param size: 字节数
+        :return: 随机字节
+        """
+        with self._lock:
+            if self._offset + size > len(self._buffer):
+                self._buffer = memoryview(os.urandom(max(self.block_size, size)))
+                self._offset = 0
+            data = self._buffer[self._offset:self._offset + size]
+            self._offset += size
+
+        return data
+
+    def getrandbits(self, bits):
+        """
+        随机掩码生成器 生成随机数
+        :param bits: 位宽
+        :return: [0, 2^bits) 内的随机数
+        """
+        return self.getrandbits_batch(bits, 1)[0]
+
+    def getrandbits_batch(self, bits, count):
+        """
+        随机掩码生成器 批量生成随机数
+        :param bits: 位宽
+        :param count: 数量
+        :return: [0, 2^bits) 内的随机数列表
+        """
+        if bits <= 0:
+            return [0] * count
+        size = (bits + 7) // 8
+        shift = size * 8 - bits
+        data = self._read(size * count)
+
+        return [int.from_bytes(data[i:i + size], 'big') >> shift for i in range(0, size * count, size)]
+
+    def randbelow(self, bound):
+        """
+        随机掩码生成器 生成有界随机数
+        :param bound: 上界
+        :return: [0, bound) 内的随机数
+        """
+        return self.randbelow_batch(bound, 1)[0]
+
+    def randbelow_batch(self, bound, count):
+        """
+        随机掩码生成器 批量生成有界随机数
+        ! 拒绝采样, 保证均匀分布
+        :param bound: 上界
+        :param count: 数量
+        :return: [0, bound) 内的随机数列表
+        """
+        if bound <= 0:
+            raise ValueError("Bound must be positive")
+        bits = (bound - 1).bit_length()
+        result = []
+        while len(result) < count:
+            result.extend(v for v in self.getrandbits_batch(bits, count - len(result)) if v < bound)
+
+        return result
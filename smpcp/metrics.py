@@ -0,0 +1,273 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 17:05
+@File: metrics.py
+@License: MIT
+"""
+import inspect
+import json
+import threading
+import time
+
+from phe import EncryptedNumber, PaillierPrivateKey, PaillierPublicKey
+
+from smpcp.pool import ObfuscatorPool
+from smpcp.smpcp import CloudPlatform, CloudPlatformThird
+from smpcp.transport import METHODS, CloudPlatformThirdClient, _frame, _pack
+
+# 云服务器掩码生成方法 单个掩码同样经由批量方法生成
+_MASKS = ('_generate_random_batch', '_generate_factor_batch')
+
+# 混淆因子池的加密方法 以预计算的混淆因子构造密文, 不经过PaillierPublicKey.encrypt
+_POOL = ('encrypt', 'zero', 'one')
+
+_COUNTERS = ('encrypt', 'decrypt', 'scalar_mul', 'masks', 'obfuscators', 'bytes')
+
+
+def _counters():
+    """
+    各参与方计数器
+    :return: {'c1': {...}, 'c2': {...}}
+    """
+    return {party: dict.fromkeys(_COUNTERS, 0) for party in ('c1', 'c2')}
+
+
+def _subclasses(cls):
+    """
+    类及其全部子类 子类重写的协议方法同样需要替换
+    :param cls: 类
+    :return: 类列表
+    """
+    result = [cls]
+    for subclass in cls.__subclasses__():
+        result.extend(v for v in _subclasses(subclass) if v not in result)
+
+    return result
+
+
+class ProtocolMetrics:
+    """
+    协议开销统计类
+    ! 仅在with语句内临时替换相关类的方法, 退出后恢复; 同一时间只能启用一个实例
+    ! 按线程归属顶层调用, 在其他线程执行的第三方云服务器计算只计入总计
+    """
+
+    _active = None
+
+    def __init__(self):
+        """
+        协议开销统计类 定义
+        """
+        self.calls = []
+        self.totals = dict(_counters(), rounds=0, wall_time=0.0)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._patches = []
+
+    def __enter__(self):
+        if ProtocolMetrics._active is not None:
+            raise RuntimeError("ProtocolMetrics is already active")
+        ProtocolMetrics._active = self
+        for name in [k for k, v in vars(CloudPlatform).items() if not k.startswith('_') and self._callable(v)]:
+            self._patch(CloudPlatform, name, self._top_level)
+        for name in _MASKS:
+            self._patch(CloudPlatform, name, self._mask)
+        for cls in _subclasses(CloudPlatformThird) + [CloudPlatformThirdClient]:
+            for name in [v for v in METHODS if v in vars(cls)]:
+                self._patch(cls, name, self._round)
+        self._patch(PaillierPublicKey, 'encrypt', self._count('encrypt'))
+        for name in _POOL:
+            self._patch(ObfuscatorPool, name, self._count('encrypt'))
+        self._patch(ObfuscatorPool, '_generate', self._obfuscator)
+        self._patch(PaillierPrivateKey, 'decrypt', self._count('decrypt'))
+        self._patch(EncryptedNumber, '__mul__', self._count('scalar_mul'))
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        for cls, name, original in reversed(self._patches):
+            setattr(cls, name, original)
+        self._patches = []
+        ProtocolMetrics._active = None
+
+    @classmethod
+    def active(cls):
+        """
+        协议开销统计 当前启用的实例
+        :return: 协议开销统计 or None
+        """
+        return cls._active
+
+    def merge(self, party, counters):
+        """
+        协议开销统计 计入其他进程的计数
+        :param party: 'c1' or 'c2'
+        :param counters: {计数器: 增量}
+        """
+        for counter, value in counters.items():
+            self._add(party, counter, value)
+
+    @staticmethod
+    def _callable(value):
+        """
+        协议开销统计 方法判断 异步协议在线程池中调用同步协议, 不重复记录
+        :param value: 类属性
+        :return: 是否为方法
+        """
+        return isinstance(value, staticmethod) or callable(value) and not inspect.iscoroutinefunction(value)
+
+    def _patch(self, cls, name, wrapper):
+        """
+        协议开销统计 替换方法
+        :param cls: 类
+        :param name: 方法名
+        :param wrapper: 包装函数 wrapper(name, func) -> func
+        """
+        original = vars(cls)[name]
+        if isinstance(original, staticmethod):
+            setattr(cls, name, staticmethod(wrapper(name, original.__func__)))
+        else:
+            setattr(cls, name, wrapper(name, original))
+        self._patches.append((cls, name, original))
+
+    def _party(self):
+        """
+        协议开销统计 当前参与方
+        :return: 'c1' or 'c2'
+        """
+        return 'c2' if getattr(self._local, 'c2_depth', 0) else 'c1'
+
+    def _add(self, party, counter, value=1):
+        """
+        协议开销统计 计数
+        :param party: 参与方
+        :param counter: 计数器
+        :param value: 增量
+        """
+        record = getattr(self._local, 'record', None)
+        with self._lock:
+            self.totals[party][counter] += value
+            if record is not None:
+                record[party][counter] += value
+
+    def _top_level(self, name, func):
+        """
+        协议开销统计 云服务器协议方法 记录顶层调用
+        """
+        def wrapped(*args, **kwargs):
+            depth = getattr(self._local, 'c1_depth', 0)
+            if depth:
+                self._local.c1_depth = depth + 1
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self._local.c1_depth = depth
+
+            record = dict(_counters(), protocol=name, rounds=0, wall_time=0.0)
+            self._local.c1_depth, self._local.record = 1, record
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record['wall_time'] = time.perf_counter() - start
+                self._local.c1_depth, self._local.record = 0, None
+                with self._lock:
+                    self.calls.append(record)
+                    self.totals['wall_time'] += record['wall_time']
+
+        return wrapped
+
+    def _round(self, name, func):
+        """
+        协议开销统计 第三方云服务器方法 记录交互轮次与传输字节数
+        """
+        def wrapped(this, *args, **kwargs):
+            depth = getattr(self._local, 'c2_depth', 0)
+            self._local.c2_depth = depth + 1
+            try:
+                result = func(this, *args, **kwargs)
+            finally:
+                self._local.c2_depth = depth
+            if not depth:
+                arguments = list(args) + list(kwargs.values())
+                self._add('c1', 'bytes', len(_frame(_pack(arguments, id=0, method=name))))
+                self._add('c2', 'bytes', len(_frame(_pack(result, id=0))))
+                self._count_round()
+
+            return result
+
+        return wrapped
+
+    def _count_round(self):
+        """
+        协议开销统计 交互轮次计数
+        """
+        record = getattr(self._local, 'record', None)
+        with self._lock:
+            self.totals['rounds'] += 1
+            if record is not None:
+                record['rounds'] += 1
+
+    def _mask(self, name, func):
+        """
+        协议开销统计 掩码生成方法 记录掩码数量
+        """
+        def wrapped(*args, **kwargs):
+            result = func(*args, **kwargs)
+            self._add('c1', 'masks', len(result))
+
+            return result
+
+        return wrapped
+
+    def _obfuscator(self, name, func):
+        """
+        协议开销统计 混淆因子生成方法 记录第三方云服务器的混淆因子数量 含后台线程预计算
+        """
+        def wrapped(*args, **kwargs):
+            self._add('c2', 'obfuscators')
+
+            return func(*args, **kwargs)
+
+        return wrapped
+
+    def _count(self, counter):
+        """
+        协议开销统计 加密/解密/标量乘法计数
+        :param counter: 计数器
+        """
+        def wrapper(name, func):
+            def wrapped(*args, **kwargs):
+                self._add(self._party(), counter)
+
+                return func(*args, **kwargs)
+
+            return wrapped
+
+        return wrapper
+
+    def to_dict(self):
+        """
+        协议开销统计 导出
+        :return: {'totals': {...}, 'calls': [...]}
+        """
+        with self._lock:
+            return json.loads(json.dumps({'totals': self.totals, 'calls': self.calls}))
+
+    def to_json(self, path=None, indent=2):
+        """
+        协议开销统计 导出JSON
+        :param path: 文件路径 None: 不写入文件
+        :param indent: 缩进
+        :return: JSON字符串
+        """
+        text = json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
+        if path is not None:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+
+        return text
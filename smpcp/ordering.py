@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 15:10
+@File: ordering.py
+@License: MIT
+"""
+
+
+def sorting_network(n):
+    """
+    Batcher奇偶归并排序网络
+    ! 按不小于n的2的幂生成, 剔除涉及越界位置的比较器 (视为 +inf, 不影响结果)
+    :param n: 元素数量
+    :return: 比较器分层列表 [[(i, j), ...], ...] 同层比较器互不相交, i < j
+    """
+    size = 1
+    while size < n:
+        size <<= 1
+
+    layers = []
+    p = 1
+    while p < size:
+        k = p
+        while k >= 1:
+            layer = []
+            for j in range(k % p, size - k, 2 * k):
+                for i in range(min(k, size - j - k)):
+                    if (i + j) // (2 * p) == (i + j + k) // (2 * p) and i + j + k < n:
+                        layer.append((i + j, i + j + k))
+            if layer:
+                layers.append(layer)
+            k >>= 1
+        p <<= 1
+
+    return layers
+
+
+def secure_sort(vector, descending=False):
+    """
+    TODO 安全排序协议
+    ! 同层比较交换合并为一轮安全最值计算协议, 交互轮数为 O(log^2 n)
+    :param vector: 加密向量
+    :param descending: 是否降序
+    :return: 安全排序协议结果 [E(x_0), E(x_1), ...]
+    """
+    result = list(vector.ciphers)
+    for layer in sorting_network(len(result)):
+        a = [result[i] for i, _ in layer]
+        b = [result[j] for _, j in layer]
+        maximum = vector.c1.optimum_batch(a, b, vector.c2, 'max')
+        for (i, j), x, y, v in zip(layer, a, b, maximum):
+            minimum = x + y - v
+            result[i], result[j] = (v, minimum) if descending else (minimum, v)
+
+    return result
+
+
+def _tournament(vector, mode, index):
+    """
+    锦标赛树归约
+    ! 每一层的所有比较合并为一轮, 交互轮数为 ceil(log2 n)
+    :param vector: 加密向量
+    :param mode: 'max' or 'min'
+    :param index: 是否同时计算下标
+    :return: (加密最值, 加密下标 or None)
+    """
+    values = list(vector.ciphers)
+    if not values:
+        raise ValueError("Cannot reduce an empty vector")
+    indices = list(range(len(values)))
+    while len(values) > 1:
+        half = len(values) // 2
+        if index:
+            winners, winner_indices = vector.c1.arg_optimum_batch(
+                values[:half], values[half:2 * half], indices[:half], indices[half:2 * half], vector.c2, mode)
+            indices = winner_indices + indices[2 * half:]
+        else:
+            winners = vector.c1.optimum_batch(values[:half], values[half:2 * half], vector.c2, mode)
+        values = winners + values[2 * half:]
+
+    if not index:
+        return values[0], None
+
+    # 单元素向量未经比较, 下标仍为明文
+    return values[0], vector.c1.public_key.encrypt(indices[0]) if isinstance(indices[0], int) else indices[0]
+
+
+def _one_hot(vector, index):
+    """
+    加密下标转独热向量
+    :param vector: 加密向量
+    :param index: 加密下标
+    :return: [E(index == 0), E(index == 1), ...]
+    """
+    return vector.c1.eq_batch([index] * len(vector), list(range(len(vector))), vector.c2)
+
+
+def secure_max(vector):
+    """
+    TODO 安全最大值协议
+    :param vector: 加密向量
+    :return: 安全最大值协议结果 E(max(x))
+    """
+    return _tournament(vector, 'max', False)[0]
+
+
+def secure_min(vector):
+    """
+    TODO 安全最小值协议
+    :param vector: 加密向量
+    :return: 安全最小值协议结果 E(min(x))
+    """
+    return _tournament(vector, 'min', False)[0]
+
+
+def secure_argmax(vector, one_hot=False):
+    """
+    TODO 安全最大值下标协议
+    :param vector: 加密向量
+    :param one_hot: 是否返回独热向量 额外一轮
+    :return: 安全最大值下标协议结果 E(argmax(x)) or [E(0), ..., E(1), ...]
+    """
+    index = _tournament(vector, 'max', True)[1]
+
+    return _one_hot(vector, index) if one_hot else index
+
+
+def secure_argmin(vector, one_hot=False):
+    """
+    TODO 安全最小值下标协议
+    :param vector: 加密向量
+    :param one_hot: 是否返回独热向量 额外一轮
+    :return: 安全最小值下标协议结果 E(argmin(x)) or [E(0), ..., E(1), ...]
+    """
+    index = _tournament(vector, 'min', True)[1]
+
+    return _one_hot(vector, index) if one_hot else index
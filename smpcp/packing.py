@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 22:05
+@File: packing.py
+@License: MIT
+"""
+
+
+def slot_width(bit_length, sigma, product=False):
+    """
+    槽位宽度
+    ! 槽位按有符号数居中解码, 需容纳掩码后的值及符号位
+    :param bit_length: 操作数位宽
+    :param sigma: 统计安全参数(位)
+    :param product: 是否容纳两个掩码后的值的乘积
+    :return: 槽位宽度(位)
+    """
+    return 2 * (bit_length + sigma + 1) + 1 if product else bit_length + sigma + 3
+
+
+def slot_count(public_key, width):
+    """
+    每个密文的槽位数
+    :param public_key: 公钥
+    :param width: 槽位宽度
+    :return: 槽位数
+    """
+    count = (public_key.max_int.bit_length() - 1) // width
+    if count < 1:
+        raise ValueError("Slots of {0} bits do not fit a {1}-bit key".format(width, public_key.n.bit_length()))
+
+    return count
+
+
+def pack(values, width):
+    """
+    打包明文
+    :param values: 有符号整数列表
+    :param width: 槽位宽度
+    :return: sum(values[i] * 2^(i * width))
+    """
+    result = 0
+    for v in reversed(values):
+        result = (result << width) + v
+
+    return result
+
+
+def unpack(value, width, count):
+    """
+    解包明文
+    :param value: 打包后的整数
+    :param width: 槽位宽度
+    :param count: 槽位数
+    :return: 有符号整数列表
+    """
+    mask, half, result = (1 << width) - 1, 1 << (width - 1), []
+    for _ in range(count):
+        v = value & mask
+        v = v - (1 << width) if v >= half else v
+        result.append(v)
+        value = (value - v) >> width
+
+    return result
+
+
+def pack_encrypted(ciphers, width):
+    """
+    同态打包密文 秦九韶算法, 每个槽位一次width位的标量乘法
+    :param ciphers: 密文列表
+    :param width: 槽位宽度
+    :return: 打包后的密文
+    """
+    result = ciphers[-1]
+    for v in reversed(ciphers[:-1]):
+        result = result * (1 << width) + v
+
+    return result
+
+
+def chunks(values, count):
+    """
+    按槽位数分组
+    :param values: 列表
+    :param count: 槽位数
+    :return: 分组列表
+    """
+    return [values[i:i + count] for i in range(0, len(values), count)]
+
+
+class PackedNumber:
+    """
+    打包密文类
+    """
+
+    def __init__(self, cipher, width, count):
+        """
+        打包密文类 定义
+        :param cipher: 打包后的密文
+        :param width: 槽位宽度
+        :param count: 已用槽位数
+        """
+        self.cipher = cipher
+        self.width = width
+        self.count = count
+
+    def decrypt(self, secret_key):
+        """
+        打包密文类 解密
+        :param secret_key: 私钥
+        :return: 各槽位明文列表
+        """
+        return unpack(secret_key.decrypt(self.cipher), self.width, self.count)
+
+
+def decrypt_packed(secret_key, packed_numbers):
+    """
+    解密打包密文列表
+    :param secret_key: 私钥
+    :param packed_numbers: 打包密文列表
+    :return: 各槽位明文列表 按顺序拼接
+    """
+    return [v for packed in packed_numbers for v in packed.decrypt(secret_key)]
@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 23:05
+@File: parallel.py
+@License: MIT
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from smpcp import keystore
+from smpcp.metrics import ProtocolMetrics
+from smpcp.pool import ObfuscatorPool
+from smpcp.smpcp import CloudPlatformThird
+from smpcp.transport import _pack, _unpack
+
+# 工作进程返回给开销统计的计数器
+_COUNTERS = ('encrypt', 'decrypt', 'scalar_mul', 'obfuscators')
+
+_worker = None  # 工作进程内的第三方云服务器
+
+
+def _initialize(data, watermarks):
+    """
+    工作进程 初始化 每个工作进程只加载一次密钥对
+    :param data: keystore.dump_keypair序列化的密钥对
+    :param watermarks: 混淆因子池 (高水位, 低水位) None: 在线加密
+    """
+    global _worker
+    public_key, secret_key = keystore.load_keypair(data)
+    pool = ObfuscatorPool(public_key, *watermarks) if watermarks is not None else None
+    _worker = CloudPlatformThird(public_key, secret_key, pool=pool)
+
+
+def _run(method, args, measure):
+    """
+    工作进程 执行批量协议
+    :param method: 协议方法名
+    :param args: 位置参数 transport._pack编码后
+    :param measure: 是否统计开销
+    :return: (协议结果 transport._pack编码后, 第三方云服务器计数 or None)
+    """
+    args = _unpack(args, _worker.public_key)['value']
+    if not measure:
+        return _pack(getattr(_worker, method)(*args)), None
+    with ProtocolMetrics() as metrics:
+        result = getattr(_worker, method)(*args)
+
+    return _pack(result), {k: metrics.totals['c2'][k] for k in _COUNTERS}
+
+
+class ParallelCloudPlatformThird(CloudPlatformThird):
+    """
+    多进程第三方云服务器类
+    ! 批量协议按块分发到进程池, 解密, 计算与加密在各核心上并行; 单个协议仍在当前进程执行
+    ! 工作进程以spawn方式启动, 不继承开销统计替换的方法与父进程的线程
+    """
+
+    def __init__(self, public_key, secret_key, workers=None, chunk_size=None, pool=None):
+        """
+        多进程第三方云服务器类 定义
+        :param public_key: 公钥
+        :param secret_key: 私钥
+        :param workers: 工作进程数 None: CPU核心数
+        :param chunk_size: 每块元素数 None: 按工作进程数均分
+        :param pool: 混淆因子池 None: 在线加密 指定时各工作进程按相同水位各自维护一个混淆因子池
+        """
+        super().__init__(public_key, secret_key, pool=pool)
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        watermarks = (pool.high_watermark, pool.low_watermark) if pool is not None else None
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'),
+                                             initializer=_initialize,
+                                             initargs=(keystore.dump_keypair(public_key, secret_key), watermarks))
+
+    def close(self):
+        """
+        多进程第三方云服务器 关闭进程池
+        """
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _map(self, method, args, columns):
+        """
+        多进程第三方云服务器 分块执行批量协议
+        :param method: 协议方法名
+        :param args: 位置参数
+        :param columns: 按元素切分的参数下标 其余参数各块共用
+        :return: 协议结果列表 按块顺序拼接
+        """
+        size = len(args[columns[0]])
+        chunk_size = self.chunk_size or -(-size // self.workers)
+        if size <= chunk_size:
+            return getattr(super(), method)(*args)
+
+        metrics = ProtocolMetrics.active()
+        futures = [self._executor.submit(_run, method, _pack([v[j:j + chunk_size] if i in columns else v
+                                                              for i, v in enumerate(args)]), metrics is not None)
+                   for j in range(0, size, chunk_size)]
+
+        result = []
+        for future in futures:
+            chunk, counters = future.result()
+            result.extend(_unpack(chunk, self.public_key)['value'])
+            if counters is not None:
+                metrics.merge('c2', counters)
+
+        return result
+
+    def mul_batch(self, h1, h2):
+        """
+        TODO 多进程第三方云服务器类 批量安全乘法协议
+        :param h1: 参数1列表
+        :param h2: 参数2列表
+        :return: 批量安全乘法协议结果列表
+        """
+        return self._map('mul_batch', (h1, h2), (0, 1))
+
+    def truediv_batch(self, h1, h2):
+        """
+        TODO 多进程第三方云服务器类 批量安全除法协议
+        :param h1: 参数1列表
+        :param h2: 参数2列表
+        :return: 批量安全除法协议结果列表
+        """
+        return self._map('truediv_batch', (h1, h2), (0, 1))
+
+    def floordiv_batch(self, h1, h2):
+        """
+        TODO 多进程第三方云服务器类 批量安全整除协议
+        :param h1: 参数1列表
+        :param h2: 参数2列表
+        :return: 批量安全整除协议结果列表
+        """
+        return self._map('floordiv_batch', (h1, h2), (0, 1))
+
+    def mod_batch(self, h1, h2):
+        """
+        TODO 多进程第三方云服务器类 批量安全取模协议
+        :param h1: 参数1列表
+        :param h2: 参数2列表
+        :return: 批量安全取模协议结果列表
+        """
+        return self._map('mod_batch', (h1, h2), (0, 1))
+
+    def optimum_batch(self, h1, h2, h3, mode):
+        """
+        TODO 多进程第三方云服务器类 批量安全最值计算协议
+        :param h1: 参数列表
+        :param h2: 参数列表
+        :param h3: 参数列表
+        :param mode: 'max' or 'min'
+        :return: 批量安全最值计算协议结果列表
+        """
+        return self._map('optimum_batch', (h1, h2, h3, mode), (0, 1, 2))
+
+    def parity_batch(self, h):
+        """
+        TODO 多进程第三方云服务器类 批量安全奇偶性判断协议
+        :param h: 参数列表
+        :return: 批量安全奇偶性判断协议结果列表
+        """
+        return self._map('parity_batch', (h,), (0,))
+
+    def eq_batch(self, h):
+        """
+        TODO 多进程第三方云服务器类 批量安全相等协议
+        :param h: 参数列表
+        :return: 批量安全相等协议结果列表
+        """
+        return self._map('eq_batch', (h,), (0,))
+
+    def bit_dec_batch(self, h, bit):
+        """
+        TODO 多进程第三方云服务器类 批量安全二进制分解协议
+        :param h: 参数列表
+        :param bit: 位数
+        :return: 批量安全二进制分解协议结果列表 低位在前
+        """
+        return self._map('bit_dec_batch', (h, bit), (0,))
+
+    def truncate_batch(self, h, shift):
+        """
+        TODO 多进程第三方云服务器类 批量安全截断协议
+        :param h: 参数列表
+        :param shift: 截断位数
+        :return: 批量安全截断协议结果列表
+        """
+        return self._map('truncate_batch', (h, shift), (0,))
+
+    def mul_packed(self, h1, h2, width, counts):
+        """
+        TODO 多进程第三方云服务器类 打包安全乘法协议
+        :param h1: 打包参数1列表
+        :param h2: 打包参数2列表
+        :param width: 槽位宽度
+        :param counts: 各打包参数的槽位数
+        :return: 打包安全乘法协议结果列表
+        """
+        return self._map('mul_packed', (h1, h2, width, counts), (0, 1, 3))
+
+    def parity_packed(self, h, width, counts):
+        """
+        TODO 多进程第三方云服务器类 打包安全奇偶性判断协议
+        :param h: 打包参数列表
+        :param width: 槽位宽度
+        :param counts: 各打包参数的槽位数
+        :return: 打包安全奇偶性判断协议结果列表 逐槽位
+        """
+        return self._map('parity_packed', (h, width, counts), (0, 2))
+
+    def eq_packed(self, h, width, counts):
+        """
+        TODO 多进程第三方云服务器类 打包安全相等协议
+        :param h: 打包参数列表
+        :param width: 槽位宽度
+        :param counts: 各打包参数的槽位数
+        :return: 打包安全相等协议结果列表 逐槽位
+        """
+        return self._map('eq_packed', (h, width, counts), (0, 2))
+
+    def matmul(self, h1, h2):
+        """
+        TODO 多进程第三方云服务器类 安全矩阵乘法协议
+        ! 按行分块
+        :param h1: 参数1矩阵 m * k
+        :param h2: 参数2矩阵 k * n
+        :return: 安全矩阵乘法协议结果 m * n
+        """
+        return self._map('matmul', (h1, h2), (0,))
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 11:20
+@File: pool.py
+@License: MIT
+"""
+import collections
+import threading
+
+from phe import EncodedNumber, EncryptedNumber
+from phe.util import mulmod, powmod
+
+
+class ObfuscatorPool:
+    """
+    混淆因子池类
+    ! 离线预计算 r^n mod n^2, 在线加密只需一次模乘
+    ! E(0) = r^n, E(1) = (1 + n) * r^n
+    """
+
+    def __init__(self, public_key, high_watermark=1024, low_watermark=256, start=True):
+        """
+        混淆因子池类 定义
+        :param public_key: 公钥
+        :param high_watermark: 高水位 后台线程补充至该数量
+        :param low_watermark: 低水位 低于该数量时唤醒后台线程
+        :param start: 是否立即启动后台线程
+        """
+        if not 0 <= low_watermark < high_watermark:
+            raise ValueError("Watermarks must satisfy 0 <= low_watermark < high_watermark")
+        self.public_key = public_key
+        self.high_watermark = high_watermark
+        self.low_watermark = low_watermark
+        self._obfuscators = collections.deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = None
+        if start:
+            self.start()
+
+    def __len__(self):
+        return len(self._obfuscators)
+
+    def start(self):
+        """
+        混淆因子池 启动后台线程
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._fill, daemon=True)
+            self._thread.start()
+
+    def close(self):
+        """
+        混淆因子池 停止后台线程
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def fill(self, count=None):
+        """
+        混淆因子池 同步补充
+        :param count: 补充数量 None: 补充至高水位
+        """
+        count = self.high_watermark - len(self._obfuscators) if count is None else count
+        for _ in range(count):
+            self._obfuscators.append(self._generate())
+
+    def _generate(self):
+        """
+        混淆因子池 生成混淆因子
+        :return: r^n mod n^2
+        """
+        return powmod(self.public_key.get_random_lt_n(), self.public_key.n, self.public_key.nsquare)
+
+    def _fill(self):
+        """
+        混淆因子池 后台补充
+        """
+        while True:
+            with self._condition:
+                while not self._closed and len(self._obfuscators) > self.low_watermark:
+                    self._condition.wait()
+                if self._closed:
+                    return
+            while not self._closed and len(self._obfuscators) < self.high_watermark:
+                self._obfuscators.append(self._generate())
+
+    def obfuscator(self):
+        """
+        混淆因子池 取出混淆因子
+        ! 池为空时在线计算
+        :return: r^n mod n^2
+        """
+        try:
+            obfuscator = self._obfuscators.popleft()
+        except IndexError:
+            obfuscator = self._generate()
+        if len(self._obfuscators) <= self.low_watermark:
+            with self._condition:
+                self._condition.notify()
+
+        return obfuscator
+
+    def encrypt(self, value, precision=None):
+        """
+        混淆因子池 加密
+        :param value: 明文
+        :param precision: 浮点精度 同phe.PaillierPublicKey.encrypt
+        :return: 加密数字
+        """
+        encoding = value if isinstance(value, EncodedNumber) else EncodedNumber.encode(self.public_key, value,
+                                                                                        precision)
+        ciphertext = mulmod(self.public_key.raw_encrypt(encoding.encoding, r_value=1), self.obfuscator(),
+                            self.public_key.nsquare)
+
+        return self._encrypted(ciphertext, encoding.exponent)
+
+    def zero(self):
+        """
+        混淆因子池 加密0
+        :return: E(0)
+        """
+        return self._encrypted(self.obfuscator(), 0)
+
+    def one(self):
+        """
+        混淆因子池 加密1
+        :return: E(1)
+        """
+        return self._encrypted(mulmod(self.public_key.n + 1, self.obfuscator(), self.public_key.nsquare), 0)
+
+    def _encrypted(self, ciphertext, exponent):
+        """
+        混淆因子池 构造已混淆的加密数字
+        :param ciphertext: 密文
+        :param exponent: 指数
+        :return: 加密数字
+        """
+        encrypted_number = EncryptedNumber(self.public_key, ciphertext, exponent)
+        # 已乘以 r^n, 避免发送前再次混淆
+        encrypted_number._EncryptedNumber__is_obfuscated = True
+
+        return encrypted_number
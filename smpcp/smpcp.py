@@ -8,9 +8,17 @@
 @File: smpcp.py
 @License: MIT
 """
+import asyncio
+import functools
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-import gmpy2
+from phe import EncryptedNumber
+from phe.util import powmod
+
+from smpcp.mask import MaskGenerator
+from smpcp.packing import PackedNumber, chunks, pack, pack_encrypted, slot_count, slot_width, unpack
 
 
 class SecureMultiPartyComputationProtocol:
@@ -47,7 +55,7 @@ class SecureMultiPartyComputationProtocol:
     def __mul__(self, other):
         """
         TODO 安全多方计算协议类 安全乘法协议
-        :param other: 密文
+        :param other: 密文 or 明文
         :return: 安全乘法协议结果 E(self.cipher * other)
         """
         return self.c1.mul(self.cipher, other, self.c2)
@@ -55,15 +63,33 @@ class SecureMultiPartyComputationProtocol:
     def __truediv__(self, other):
         """
         TODO 安全多方计算协议类 安全除法协议
-        :param other: 密文
+        :param other: 密文 or 明文
         :return: 安全除法协议结果 E(self.cipher / other)
         """
         return self.c1.truediv(self.cipher, other, self.c2)
 
+    def __floordiv__(self, other):
+        """
+        TODO 安全多方计算协议类 安全整除协议
+        ! 只能用于整数
+        :param other: 密文 or 明文
+        :return: 安全整除协议结果 E(self.cipher // other)
+        """
+        return self.c1.floordiv(self.cipher, other, self.c2)
+
+    def __mod__(self, other):
+        """
+        TODO 安全多方计算协议类 安全取模协议
+        ! 只能用于整数
+        :param other: 密文 or 明文
+        :return: 安全取模协议结果 E(self.cipher % other)
+        """
+        return self.c1.mod(self.cipher, other, self.c2)
+
     def optimum(self, other, mode):
         """
         TODO 安全多方计算协议类 安全最值计算协议
-        :param other: 密文
+        :param other: 密文 or 明文
         :param mode: 'max' or 'min'
         :return: 安全最值计算协议结果 E(max(self.cipher, other)) or E(min(self.cipher, other))
         """
@@ -88,7 +114,7 @@ class SecureMultiPartyComputationProtocol:
         """
         TODO 安全多方计算协议类 安全二进制与协议
         ! 只能用于二进制数
-        :param other: 密文
+        :param other: 密文 or 明文
         :return: 安全二进制与协议结果 E(self.cipher & other)
         """
         return self.c1.bit_and(self.cipher, other, self.c2)
@@ -97,7 +123,7 @@ class SecureMultiPartyComputationProtocol:
         """
         TODO 安全多方计算协议类 安全二进制或协议
         ! 只能用于二进制数
-        :param other: 密文
+        :param other: 密文 or 明文
         :return: 安全二进制或协议结果 E(self.cipher | other)
         """
         return self.c1.bit_or(self.cipher, other, self.c2)
@@ -121,7 +147,7 @@ class SecureMultiPartyComputationProtocol:
     def __eq__(self, other):
         """
         TODO 安全多方计算协议类 安全相等协议
-        :param other: 密文
+        :param other: 密文 or 明文
         :return: 安全相等协议结果 E(self.cipher == other)
         """
         return self.c1.eq(self.cipher, other, self.c2)
@@ -129,7 +155,7 @@ class SecureMultiPartyComputationProtocol:
     def __ne__(self, other):
         """
         TODO 安全多方计算协议类 安全不相等协议
-        :param other: 密文
+        :param other: 密文 or 明文
         :return: 安全不相等协议结果 E(self.cipher != other)
         """
         return self.c1.ne(self.cipher, other, self.c2)
@@ -137,7 +163,7 @@ class SecureMultiPartyComputationProtocol:
     def __gt__(self, other):
         """
         TODO 安全多方计算协议类 安全大于协议
-        :param other: 密文
+        :param other: 密文 or 明文
         :return: 安全大于协议结果 E(self.cipher > other)
         """
         return self.c1.gt(self.cipher, other, self.c2)
@@ -145,7 +171,7 @@ class SecureMultiPartyComputationProtocol:
     def __ge__(self, other):
         """
         TODO 安全多方计算协议类 安全大于等于协议
-        :param other: 密文
+        :param other: 密文 or 明文
         :return: 安全大于等于协议结果 E(self.cipher >= other)
         """
         return self.c1.ge(self.cipher, other, self.c2)
@@ -153,7 +179,7 @@ class SecureMultiPartyComputationProtocol:
     def __lt__(self, other):
         """
         TODO 安全多方计算协议类 安全小于协议
-        :param other: 密文
+        :param other: 密文 or 明文
         :return: 安全小于协议结果 E(self.cipher < other)
         """
         return self.c1.lt(self.cipher, other, self.c2)
@@ -161,33 +187,182 @@ class SecureMultiPartyComputationProtocol:
     def __le__(self, other):
         """
         TODO 安全多方计算协议类 安全小于等于协议
-        :param other: 密文
+        :param other: 密文 or 明文
         :return: 安全小于等于协议结果 E(self.cipher <= other)
         """
         return self.c1.le(self.cipher, other, self.c2)
 
+    async def mul_async(self, other):
+        """
+        TODO 安全多方计算协议类 异步安全乘法协议
+        :param other: 密文 or 明文
+        :return: 安全乘法协议结果 E(self.cipher * other)
+        """
+        return await self.c1.mul_async(self.cipher, other, self.c2)
+
+    async def truediv_async(self, other):
+        """
+        TODO 安全多方计算协议类 异步安全除法协议
+        :param other: 密文 or 明文
+        :return: 安全除法协议结果 E(self.cipher / other)
+        """
+        return await self.c1.truediv_async(self.cipher, other, self.c2)
+
+    async def floordiv_async(self, other):
+        """
+        TODO 安全多方计算协议类 异步安全整除协议
+        :param other: 密文 or 明文
+        :return: 安全整除协议结果 E(self.cipher // other)
+        """
+        return await self.c1.floordiv_async(self.cipher, other, self.c2)
+
+    async def mod_async(self, other):
+        """
+        TODO 安全多方计算协议类 异步安全取模协议
+        :param other: 密文 or 明文
+        :return: 安全取模协议结果 E(self.cipher % other)
+        """
+        return await self.c1.mod_async(self.cipher, other, self.c2)
+
+    async def optimum_async(self, other, mode):
+        """
+        TODO 安全多方计算协议类 异步安全最值计算协议
+        :param other: 密文 or 明文
+        :param mode: 'max' or 'min'
+        :return: 安全最值计算协议结果 E(max(self.cipher, other)) or E(min(self.cipher, other))
+        """
+        return await self.c1.optimum_async(self.cipher, other, self.c2, mode)
+
+    async def parity_async(self):
+        """
+        TODO 安全多方计算协议类 异步安全奇偶性判断协议
+        :return: 安全奇偶性判断协议结果 奇数: E(1) 偶数: E(0)
+        """
+        return await self.c1.parity_async(self.cipher, self.c2)
+
+    async def bit_dec_async(self, bit):
+        """
+        TODO 安全多方计算协议类 异步安全二进制分解协议
+        :param bit: 位数
+        :return: 安全二进制分解协议结果 self.cipher的二进制数列 -> [E(1) or E(0), ...] 长度为bit
+        """
+        return await self.c1.bit_dec_async(self.cipher, bit, self.c2)
+
+    async def and_async(self, other):
+        """
+        TODO 安全多方计算协议类 异步安全二进制与协议
+        :param other: 密文 or 明文
+        :return: 安全二进制与协议结果 E(self.cipher & other)
+        """
+        return await self.c1.bit_and_async(self.cipher, other, self.c2)
+
+    async def or_async(self, other):
+        """
+        TODO 安全多方计算协议类 异步安全二进制或协议
+        :param other: 密文 or 明文
+        :return: 安全二进制或协议结果 E(self.cipher | other)
+        """
+        return await self.c1.bit_or_async(self.cipher, other, self.c2)
+
+    async def xor_async(self, other):
+        """
+        TODO 安全多方计算协议类 异步安全二进制异或协议
+        :return: 安全二进制异或协议结果 E(self.cipher ^ other)
+        """
+        return await self.c1.bit_xor_async(self.cipher, other, self.c2)
+
+    async def eq_async(self, other):
+        """
+        TODO 安全多方计算协议类 异步安全相等协议
+        :param other: 密文 or 明文
+        :return: 安全相等协议结果 E(self.cipher == other)
+        """
+        return await self.c1.eq_async(self.cipher, other, self.c2)
+
+    async def ne_async(self, other):
+        """
+        TODO 安全多方计算协议类 异步安全不相等协议
+        :param other: 密文 or 明文
+        :return: 安全不相等协议结果 E(self.cipher != other)
+        """
+        return await self.c1.ne_async(self.cipher, other, self.c2)
+
+    async def gt_async(self, other):
+        """
+        TODO 安全多方计算协议类 异步安全大于协议
+        :param other: 密文 or 明文
+        :return: 安全大于协议结果 E(self.cipher > other)
+        """
+        return await self.c1.gt_async(self.cipher, other, self.c2)
+
+    async def ge_async(self, other):
+        """
+        TODO 安全多方计算协议类 异步安全大于等于协议
+        :param other: 密文 or 明文
+        :return: 安全大于等于协议结果 E(self.cipher >= other)
+        """
+        return await self.c1.ge_async(self.cipher, other, self.c2)
+
+    async def lt_async(self, other):
+        """
+        TODO 安全多方计算协议类 异步安全小于协议
+        :param other: 密文 or 明文
+        :return: 安全小于协议结果 E(self.cipher < other)
+        """
+        return await self.c1.lt_async(self.cipher, other, self.c2)
+
+    async def le_async(self, other):
+        """
+        TODO 安全多方计算协议类 异步安全小于等于协议
+        :param other: 密文 or 明文
+        :return: 安全小于等于协议结果 E(self.cipher <= other)
+        """
+        return await self.c1.le_async(self.cipher, other, self.c2)
+
 
 class CloudPlatform:
     """
     云服务器类
     """
 
-    def __init__(self, public_key):
+    def __init__(self, public_key, mask_generator=None, sigma=None, bit_length=64, concurrency=16):
         """
         云服务器类 定义
+        ! sigma为None时沿用原掩码范围 [0, len(str(n))), 乘法掩码取非零值
+        ! sigma指定时 加法掩码为bit_length + sigma位, 乘法掩码为sigma位非零随机数
         :param public_key: 公钥
+        :param mask_generator: 随机掩码生成器 需实现randbelow与randbelow_batch None: MaskGenerator
+        :param sigma: 统计安全参数(位) 如40/80/128
+        :param bit_length: 操作数位宽 仅在sigma指定时生效
+        :param concurrency: 异步协议最大并发数
         """
         self.public_key = public_key
+        self.concurrency = concurrency
+        self._executor = None
+        self._executor_lock = threading.Lock()
         self.key_length = len(str(self.public_key.n))
+        self.mask_generator = mask_generator if mask_generator is not None else MaskGenerator()
+        self.sigma = sigma
+        self.bit_length = bit_length
+        if sigma is not None:
+            if sigma <= 0 or bit_length <= 0:
+                raise ValueError("sigma and bit_length must be positive")
+            # 乘法协议中 (x + r1) * (y + r2) 不能超出明文空间 n / 3
+            if 2 * (bit_length + sigma + 1) >= self.public_key.max_int.bit_length():
+                raise ValueError("Masks of {0} bits overflow the plaintext space of a {1}-bit key".format(
+                    bit_length + sigma, self.public_key.n.bit_length()))
 
     def mul(self, c1, c2, cloud_platform_third):
         """
         TODO 云服务器类 安全乘法协议
         :param c1: 密文1
-        :param c2: 密文2
+        :param c2: 密文2 or 明文
         :param cloud_platform_third: 第三方云服务器
         :return: 加密乘法结果
         """
+        if self._is_plaintext(c2):
+            return c1 * c2
+
         r1 = self._generate_random()
         r2 = self._generate_random()
 
@@ -200,11 +375,14 @@ class CloudPlatform:
         """
         TODO 云服务器类 安全除法协议
         :param c1: 密文1
-        :param c2: 密文2
+        :param c2: 密文2 or 明文
         :param cloud_platform_third: 第三方云服务器
         :return: 加密除法结果
         """
-        r1 = self._generate_random()
+        if self._is_plaintext(c2):
+            return c1 / c2
+
+        r1 = self._generate_factor()
         r2 = self._generate_random()
 
         h1 = c1 * r1 + c2 * r1 * r2
@@ -212,16 +390,39 @@ class CloudPlatform:
 
         return cloud_platform_third.truediv(h1, h2) - r2
 
+    def floordiv(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 安全整除协议
+        ! 只能用于整数
+        :param c1: 密文1
+        :param c2: 密文2 or 明文
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密整除结果 E(c1 // c2)
+        """
+        return self.floordiv_batch([c1], [c2], cloud_platform_third)[0]
+
+    def mod(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 安全取模协议
+        ! 只能用于整数
+        :param c1: 密文1
+        :param c2: 密文2 or 明文
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密取模结果 E(c1 % c2)
+        """
+        return self.mod_batch([c1], [c2], cloud_platform_third)[0]
+
     def optimum(self, c1, c2, cloud_platform_third, mode):
         """
         TODO 云服务器类 安全最值计算协议
         :param c1: 密文1
-        :param c2: 密文2
+        :param c2: 密文2 or 明文
         :param cloud_platform_third: 第三方云服务器
         :param mode: 'max' or 'min'
         :return: 加密最值计算结果
         """
-        r1 = self._generate_random()
+        c2 = self._encode_constant(c2)
+        r1 = self._generate_factor()
         r2 = self._generate_random()
         r3 = self._generate_random()
 
@@ -259,15 +460,7 @@ class CloudPlatform:
         :param cloud_platform_third: 第三方云服务器
         :return: 加密二进制分解结果
         """
-        sigma = 5e-1
-        result = []
-        for i in range(bit):
-            result.append(self.parity(c, cloud_platform_third))
-            zeta = c - result[i]
-            c = zeta * sigma
-        result.reverse()
-
-        return result
+        return self.bit_dec_batch([c], bit, cloud_platform_third)[0]
 
     def bit_and(self, c1, c2, cloud_platform_third):
         """
@@ -312,13 +505,16 @@ class CloudPlatform:
         """
         TODO 云服务器类 安全相等协议
         :param c1: 密文1
-        :param c2: 密文2
+        :param c2: 密文2 or 明文
         :param cloud_platform_third: 第三方云服务器
         :return: 加密相等结果
         """
+        if self._is_plaintext(c2):
+            return 1 - sum(self._sign_batch([c2 - c1, c1 - c2], 1, cloud_platform_third))
+
         sigma = -1 if random.random() > 5e-1 else 1
-        r1 = self._generate_random()
-        r2 = self._generate_random()
+        r1 = self._generate_factor()
+        r2 = self._generate_factor()
         if r2 > r1:
             r2, r1 = r1, r2
         alpha = r1 * sigma * self.mul(c1 - c2, c1 - c2, cloud_platform_third) - sigma * r2
@@ -344,8 +540,8 @@ class CloudPlatform:
         :return: 加密大于结果
         """
         sigma = -1 if random.random() > 5e-1 else 1
-        r1 = self._generate_random()
-        r2 = self._generate_random()
+        r1 = self._generate_factor()
+        r2 = self._generate_factor()
         (r2, r1) = (r1, r2) if r2 > r1 else (r2, r1)
         alpha = r1 * sigma * (c2 - c1) + sigma * r2
 
@@ -359,8 +555,7 @@ class CloudPlatform:
         :param cloud_platform_third: 第三方云服务器
         :return: 加密大于等于结果
         """
-        return self.bit_or(self.eq(c1, c2, cloud_platform_third), self.gt(c1, c2, cloud_platform_third),
-                           cloud_platform_third)
+        return 1 - self.lt(c1, c2, cloud_platform_third)
 
     def lt(self, c1, c2, cloud_platform_third):
         """
@@ -371,8 +566,8 @@ class CloudPlatform:
         :return: 加密小于结果
         """
         sigma = -1 if random.random() > 5e-1 else 1
-        r1 = self._generate_random()
-        r2 = self._generate_random()
+        r1 = self._generate_factor()
+        r2 = self._generate_factor()
         (r2, r1) = (r1, r2) if r2 > r1 else (r2, r1)
         alpha = r1 * sigma * (c1 - c2) + sigma * r2
 
@@ -386,79 +581,1355 @@ class CloudPlatform:
         :param cloud_platform_third: 第三方云服务器
         :return: 加密小于等于结果
         """
-        return self.bit_or(self.eq(c1, c2, cloud_platform_third), self.lt(c1, c2, cloud_platform_third),
-                           cloud_platform_third)
+        return 1 - self.gt(c1, c2, cloud_platform_third)
 
-    def _generate_random(self):
+    def select(self, c, c1, c2, cloud_platform_third):
         """
-        云服务器 随机数生成
-        :return: 密钥长度的随机数
+        TODO 云服务器类 安全选择协议
+        ! 只能用于二进制条件
+        :param c: 加密条件 E(1) or E(0)
+        :param c1: 密文1 or 明文 条件为1时的结果
+        :param c2: 密文2 or 明文 条件为0时的结果
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密选择结果 E(c ? c1 : c2)
         """
-        return int(gmpy2.mpz_random(gmpy2.random_state(random.SystemRandom().randint(1, 0xffffffff)), self.key_length))
+        return self.select_batch([c], [c1], [c2], cloud_platform_third)[0]
 
+    def truncate(self, c, shift, cloud_platform_third):
+        """
+        TODO 云服务器类 安全截断协议
+        :param c: 密文 整数编码
+        :param shift: 截断位数
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密截断结果 E(floor(c / 2^shift)) 误差不超过1
+        """
+        return self.truncate_batch([c], shift, cloud_platform_third)[0]
 
-class CloudPlatformThird:
-    """
-    第三方云服务器类
-    """
+    def mul_batch(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 批量安全乘法协议
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密乘法结果列表
+        """
+        if all(self._is_plaintext(b) for b in c2):
+            return [a * b for a, b in zip(c1, c2)]
+
+        c2 = [self._encode_constant(b) for b in c2]
+        r1 = self._generate_random_batch(len(c1))
+        r2 = self._generate_random_batch(len(c2))
+
+        h1 = [c + r for c, r in zip(c1, r1)]
+        h2 = [c + r for c, r in zip(c2, r2)]
 
-    def __init__(self, public_key, secret_key):
+        return [h - (a * s + b * r + r * s)
+                for h, a, b, r, s in zip(cloud_platform_third.mul_batch(h1, h2), c1, c2, r1, r2)]
+
+    def truediv_batch(self, c1, c2, cloud_platform_third):
         """
-        第三方云服务器类 定义
-        :param public_key: 公钥
-        :param secret_key: 私钥
+        TODO 云服务器类 批量安全除法协议
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密除法结果列表
         """
-        self.public_key = public_key
-        self.secret_key = secret_key
+        if all(self._is_plaintext(b) for b in c2):
+            return [a / b for a, b in zip(c1, c2)]
 
-    def mul(self, h1, h2):
+        c2 = [self._encode_constant(b) for b in c2]
+        r1 = self._generate_factor_batch(len(c1))
+        r2 = self._generate_random_batch(len(c2))
+
+        h1 = [a * r + b * r * s for a, b, r, s in zip(c1, c2, r1, r2)]
+        h2 = [b * r for b, r in zip(c2, r1)]
+
+        return [h - s for h, s in zip(cloud_platform_third.truediv_batch(h1, h2), r2)]
+
+    def floordiv_batch(self, c1, c2, cloud_platform_third):
         """
-        TODO 第三方云服务器类 安全乘法协议
-        :param h1: 参数1
-        :param h2: 参数2
-        :return: 安全乘法协议结果
+        TODO 云服务器类 批量安全整除协议
+        ! 只能用于整数; 明文除数同样经一轮交互, 结果保持整数编码
+        ! r1 * (c1 + r2 * c2) // (r1 * c2) = c1 // c2 + r2
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密整除结果列表
         """
-        return self.public_key.encrypt(self.secret_key.decrypt(h1) * self.secret_key.decrypt(h2))
+        h1, h2, _, r2 = self._divmod_mask(c1, c2)
 
-    def truediv(self, h1, h2):
+        return [h - s for h, s in zip(cloud_platform_third.floordiv_batch(h1, h2), r2)]
+
+    def mod_batch(self, c1, c2, cloud_platform_third):
         """
-        TODO 第三方云服务器类 安全除法协议
-        :param h1: 参数1
-        :param h2: 参数2
-        :return: 安全除法协议结果
+        TODO 云服务器类 批量安全取模协议
+        ! 只能用于整数; r1 * (c1 + r2 * c2) % (r1 * c2) = r1 * (c1 % c2), 结果乘以r1模n的逆元
+        ! 明文除数时 c1 - c2 * (c1 // c2) 只需本地标量乘法, 省去逆元模幂
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密取模结果列表
         """
-        h2 = self.secret_key.decrypt(h2)
-        if h2 != 0:
-            return self.public_key.encrypt(self.secret_key.decrypt(h1) / h2)
-        else:
-            assert ValueError("Divisor cannot be 0")
+        if all(self._is_plaintext(b) for b in c2):
+            return [a - q * b for a, b, q in zip(c1, c2, self.floordiv_batch(c1, c2, cloud_platform_third))]
 
-    def optimum(self, h1, h2, h3, mode):
+        h1, h2, r1, _ = self._divmod_mask(c1, c2)
+        n, nsquare = self.public_key.n, self.public_key.nsquare
+
+        return [EncryptedNumber(self.public_key, powmod(h.ciphertext(be_secure=False), pow(r, -1, n), nsquare),
+                                h.exponent) for h, r in zip(cloud_platform_third.mod_batch(h1, h2), r1)]
+
+    def optimum_batch(self, c1, c2, cloud_platform_third, mode):
         """
-        TODO 第三方云服务器类 安全最值计算协议
-        :param h1: 参数
-        :param h2: 参数
-        :param h3: 参数
+        TODO 云服务器类 批量安全最值计算协议
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
         :param mode: 'max' or 'min'
-        :return: 安全最值计算协议结果
+        :return: 加密最值计算结果列表
         """
-        mode = self.secret_key.decrypt(h1) > 0 if mode == 'max' else self.secret_key.decrypt(h1) < 0
-        alpha = 1 if mode else 0
+        c2 = [self._encode_constant(b) for b in c2]
+        r1 = self._generate_factor_batch(len(c1))
+        r2 = self._generate_random_batch(len(c1))
+        r3 = self._generate_random_batch(len(c1))
 
-        return self.public_key.encrypt(alpha), h3 if alpha == 1 else h2
+        h1, h2, h3 = [], [], []
+        for a, b, s1, s2, s3 in zip(c1, c2, r1, r2, r3):
+            if random.random() > 5e-1:
+                a, b = b, a
+            h1.append((a - b) * s1)
+            h2.append(a + s2)
+            h3.append(b + s3)
 
-    def parity(self, h):
+        return [a + b - beta + alpha * s3 + (1 - alpha) * s2
+                for (alpha, beta), a, b, s2, s3 in zip(cloud_platform_third.optimum_batch(h1, h2, h3, mode),
+                                                       c1, c2, r2, r3)]
+
+    def arg_optimum_batch(self, c1, c2, i1, i2, cloud_platform_third, mode):
+        """
+        TODO 云服务器类 批量安全最值及下标计算协议
+        ! 下标作为附加载荷与数值一同掩码, 与安全最值计算协议同为一轮
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param i1: 密文1的下标 密文 or 明文列表
+        :param i2: 密文2的下标 密文 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :param mode: 'max' or 'min'
+        :return: (加密最值计算结果列表, 加密下标列表)
+        """
+        c2 = [self._encode_constant(b) for b in c2]
+        i1 = [self._encode_constant(v) for v in i1]
+        i2 = [self._encode_constant(v) for v in i2]
+        r1 = self._generate_factor_batch(len(c1))
+        r2 = self._generate_random_batch(len(c1))
+        r3 = self._generate_random_batch(len(c1))
+        s2 = self._generate_random_batch(len(c1))
+        s3 = self._generate_random_batch(len(c1))
+
+        h1, h2, h3 = [], [], []
+        for a, b, ia, ib, t1, t2, t3, u2, u3 in zip(c1, c2, i1, i2, r1, r2, r3, s2, s3):
+            if random.random() > 5e-1:
+                a, b, ia, ib = b, a, ib, ia
+            h1.append((a - b) * t1)
+            h2.append([a + t2, ia + u2])
+            h3.append([b + t3, ib + u3])
+
+        values, indices = [], []
+        for (alpha, beta), a, b, ia, ib, t2, t3, u2, u3 in zip(
+                cloud_platform_third.optimum_batch(h1, h2, h3, mode), c1, c2, i1, i2, r2, r3, s2, s3):
+            values.append(a + b - beta[0] + alpha * t3 + (1 - alpha) * t2)
+            indices.append(ia + ib - beta[1] + alpha * u3 + (1 - alpha) * u2)
+
+        return values, indices
+
+    def parity_batch(self, c, cloud_platform_third):
         """
-        TODO 第三方云服务器类 安全奇偶性判断协议
-        :param h: 参数
-        :return: 安全奇偶性判断协议结果
+        TODO 云服务器类 批量安全奇偶性判断协议
+        :param c: 密文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密奇偶性判断结果列表
         """
-        return self.public_key.encrypt(0) if self.secret_key.decrypt(h) % 2 == 0 else self.public_key.encrypt(1)
+        r = self._generate_random_batch(len(c))
+        h = [v + s for v, s in zip(c, r)]
 
-    def eq(self, h):
+        return [alpha if s % 2 == 0 else 1 - alpha for alpha, s in zip(cloud_platform_third.parity_batch(h), r)]
+
+    def bit_dec_batch(self, c, bit, cloud_platform_third):
         """
-        TODO 第三方云服务器类 安全相等协议
-        :param h: 参数
-        :return: 安全相等协议结果
+        TODO 云服务器类 批量安全二进制分解协议
+        ! 第三方云服务器分解掩码值 z = c + r, 云服务器以借位前缀电路计算 z - r
+        ! 交互轮数为 2 + ceil(log2(bit)), 与密文数量无关
+        :param c: 密文列表
+        :param bit: 位数
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密二进制分解结果列表
+        """
+        if bit <= 0:
+            return [[] for _ in c]
+        r = self._generate_random_batch(len(c))
+        z = cloud_platform_third.bit_dec_batch([v + s for v, s in zip(c, r)], bit)
+
+        # d: z与r的异或位 g: 借位生成位 p: 借位传递位
+        d, g, p = [], [], []
+        for bits, s in zip(z, r):
+            d.append([1 - v if s >> i & 1 else v for i, v in enumerate(bits)])
+            g.append([(1 - v) * (s >> i & 1) for i, v in enumerate(bits)])
+            p.append([1 - v for v in d[-1]])
+
+        # Kogge-Stone前缀计算借位: 每一层的乘法合并为一轮, 结束后g[j][i]为第i位向高位的借位
+        k = 1
+        while k < bit:
+            index = [(j, i) for j in range(len(c)) for i in range(k, bit)]
+            propagate = 2 * k < bit
+            h1 = [p[j][i] for j, i in index]
+            h2 = [g[j][i - k] for j, i in index]
+            if propagate:
+                h1 += h1
+                h2 += [p[j][i - k] for j, i in index]
+            products = self.mul_batch(h1, h2, cloud_platform_third)
+            for n, (j, i) in enumerate(index):
+                g[j][i] = g[j][i] + products[n]
+                if propagate:
+                    p[j][i] = products[n + len(index)]
+            k <<= 1
+
+        # 第i位结果为 d[i] ^ g[i - 1]
+        index = [(j, i) for j in range(len(c)) for i in range(1, bit)]
+        products = self.mul_batch([d[j][i] for j, i in index], [g[j][i - 1] for j, i in index], cloud_platform_third)
+        result = [[v[0]] for v in d]
+        for (j, i), v in zip(index, products):
+            result[j].append(d[j][i] + g[j][i - 1] - 2 * v)
+        for v in result:
+            v.reverse()
+
+        return result
+
+    def bit_and_batch(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 批量安全二进制与协议
+        :param c1: 密文1列表
+        :param c2: 密文2列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密二进制与结果列表
+        """
+        return self.mul_batch(c1, c2, cloud_platform_third)
+
+    def bit_or_batch(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 批量安全二进制或协议
+        :param c1: 密文1列表
+        :param c2: 密文2列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密二进制或结果列表
+        """
+        return [a + b - v for a, b, v in zip(c1, c2, self.bit_and_batch(c1, c2, cloud_platform_third))]
+
+    @staticmethod
+    def bit_not_batch(c):
+        """
+        TODO 云服务器类 批量安全二进制非协议
+        :param c: 密文列表
+        :return: 加密二进制非结果列表
+        """
+        return [1 - v for v in c]
+
+    def bit_xor_batch(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 批量安全二进制异或协议
+        :param c1: 密文1列表
+        :param c2: 密文2列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密二进制异或结果列表
+        """
+        return [a + b - 2 * v for a, b, v in zip(c1, c2, self.mul_batch(c1, c2, cloud_platform_third))]
+
+    def eq_batch(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 批量安全相等协议
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密相等结果列表
+        """
+        if all(self._is_plaintext(b) for b in c2):
+            sign = self._sign_batch([b - a for a, b in zip(c1, c2)] + [a - b for a, b in zip(c1, c2)], 1,
+                                    cloud_platform_third)
+            return [1 - gt - lt for gt, lt in zip(sign[:len(c1)], sign[len(c1):])]
+
+        c2 = [self._encode_constant(b) for b in c2]
+        d = [a - b for a, b in zip(c1, c2)]
+
+        return self._sign_batch(self.mul_batch(d, d, cloud_platform_third), -1, cloud_platform_third)
+
+    def ne_batch(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 批量安全不相等协议
+        :param c1: 密文1列表
+        :param c2: 密文2列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密不相等结果列表
+        """
+        return self.bit_not_batch(self.eq_batch(c1, c2, cloud_platform_third))
+
+    def gt_batch(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 批量安全大于协议
+        :param c1: 密文1列表
+        :param c2: 密文2列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密大于结果列表
+        """
+        return self._sign_batch([b - a for a, b in zip(c1, c2)], 1, cloud_platform_third)
+
+    def ge_batch(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 批量安全大于等于协议
+        :param c1: 密文1列表
+        :param c2: 密文2列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密大于等于结果列表
+        """
+        return self.bit_not_batch(self.lt_batch(c1, c2, cloud_platform_third))
+
+    def lt_batch(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 批量安全小于协议
+        :param c1: 密文1列表
+        :param c2: 密文2列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密小于结果列表
+        """
+        return self._sign_batch([a - b for a, b in zip(c1, c2)], 1, cloud_platform_third)
+
+    def le_batch(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 批量安全小于等于协议
+        :param c1: 密文1列表
+        :param c2: 密文2列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密小于等于结果列表
+        """
+        return self.bit_not_batch(self.gt_batch(c1, c2, cloud_platform_third))
+
+    def select_batch(self, c, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 批量安全选择协议
+        ! c2 + c * (c1 - c2), 差值为密文的选择合并为一轮安全乘法, 条件或差值为明文时本地计算
+        :param c: 加密条件列表
+        :param c1: 密文1 or 明文列表 条件为1时的结果
+        :param c2: 密文2 or 明文列表 条件为0时的结果
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密选择结果列表
+        """
+        result = [None] * len(c)
+        encrypted = []
+        for i, (s, a, b) in enumerate(zip(c, c1, c2)):
+            if self._is_plaintext(s):
+                result[i] = self._encode_constant(a if s else b)
+            elif self._is_plaintext(a) and self._is_plaintext(b):
+                result[i] = s * (a - b) + b
+            else:
+                encrypted.append(i)
+        products = self.mul_batch([c[i] for i in encrypted], [c1[i] - c2[i] for i in encrypted], cloud_platform_third)
+        for i, v in zip(encrypted, products):
+            result[i] = v + c2[i]
+
+        return result
+
+    def truncate_batch(self, c, shift, cloud_platform_third):
+        """
+        TODO 云服务器类 批量安全截断协议
+        ! 加上偏移使被掩码值非负, floor((z + m) / d) - floor(m / d) 与 floor(z / d) 至多相差1
+        :param c: 密文列表 整数编码 |c| < 2^(2 * bit_length)
+        :param shift: 截断位数
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密截断结果列表
+        """
+        offset = 1 << (2 * self.bit_length)
+        if self.sigma is None:
+            r = self._generate_random_batch(len(c))
+        else:
+            r = self.mask_generator.randbelow_batch(1 << (2 * self.bit_length + 1 + self.sigma), len(c))
+        m = [offset + s for s in r]
+
+        return [v - (s >> shift) for v, s in zip(cloud_platform_third.truncate_batch(
+            [v + s for v, s in zip(c, m)], shift), m)]
+
+    def dot(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 安全内积协议
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密内积结果 E(sum(c1[i] * c2[i]))
+        """
+        return self.matmul([c1], [[v] for v in c2], cloud_platform_third)[0][0]
+
+    def matmul(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 安全矩阵乘法协议
+        ! 每个元素只掩码一次, 第三方云服务器一轮内解密 m * k + k * n 个元素并返回乘积矩阵
+        ! 掩码项 c1 * S + R * c2 以密文模幂直接累乘, 不构造中间加密数字
+        :param c1: 密文1矩阵 m * k
+        :param c2: 密文2 or 明文矩阵 k * n
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密矩阵乘法结果 m * n
+        """
+        k = len(c2)
+        if any(len(row) != k for row in c1):
+            raise ValueError("Matrix shapes do not align: inner dimension {0}".format(k))
+        if not c1 or not k:
+            return [[] for _ in c1]
+        if all(self._is_plaintext(v) for row in c2 for v in row):
+            return [[sum(a * b for a, b in zip(row, col)) for col in zip(*c2)] for row in c1]
+        if self.sigma is not None and 2 * (self.bit_length + self.sigma + 1) + k.bit_length() >= \
+                self.public_key.max_int.bit_length():
+            raise ValueError("Sums of {0} masked products overflow the plaintext space".format(k))
+
+        c2 = [[self._encode_constant(v) for v in row] for row in c2]
+        exponent = min(v.exponent for row in c1 + c2 for v in row)
+        c1, c2 = [[[v if v.exponent == exponent else v.decrease_exponent_to(exponent) for v in row]
+                   for row in matrix] for matrix in (c1, c2)]
+        n = len(c2[0])
+        r = self._generate_random_batch(len(c1) * k)
+        s = self._generate_random_batch(k * n)
+        r = [r[i:i + k] for i in range(0, len(r), k)]
+        s = [s[i:i + n] for i in range(0, len(s), n)]
+
+        h1 = [[a + t for a, t in zip(row, mask)] for row, mask in zip(c1, r)]
+        h2 = [[b + u for b, u in zip(row, mask)] for row, mask in zip(c2, s)]
+        result = cloud_platform_third.matmul(h1, h2)
+
+        nsquare = self.public_key.nsquare
+        x = [[a.ciphertext(be_secure=False) for a in row] for row in c1]
+        y = [[b.ciphertext(be_secure=False) for b in row] for row in c2]
+        for i in range(len(c1)):
+            for j in range(n):
+                cipher = 1
+                for l in range(k):
+                    cipher = cipher * powmod(x[i][l], s[l][j], nsquare) * powmod(y[l][j], r[i][l], nsquare) % nsquare
+                result[i][j] = result[i][j] - EncryptedNumber(self.public_key, cipher, exponent) - sum(
+                    r[i][l] * s[l][j] for l in range(k))
+
+        return result
+
+    def mul_packed(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 打包安全乘法协议
+        ! 所有槽位一次掩码, 第三方云服务器每个打包密文只需两次解密与一次加密
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 打包密文列表 [PackedNumber(E(sum(c1[i] * c2[i] * 2^(i * width)))), ...]
+        """
+        width, count = self._packing(product=True)
+        c2 = [self._encode_constant(b) for b in c2]
+        r1 = chunks(self._generate_random_batch(len(c1)), count)
+        r2 = chunks(self._generate_random_batch(len(c1)), count)
+        c1, c2 = chunks(c1, count), chunks(c2, count)
+
+        h1 = [pack_encrypted(a, width) + pack(r, width) for a, r in zip(c1, r1)]
+        h2 = [pack_encrypted(b, width) + pack(r, width) for b, r in zip(c2, r2)]
+        result = cloud_platform_third.mul_packed(h1, h2, width, [len(a) for a in c1])
+
+        return [PackedNumber(v - pack_encrypted([x * u + y * t for x, y, t, u in zip(a, b, s, r)], width)
+                             - pack([t * u for t, u in zip(s, r)], width), width, len(a))
+                for v, a, b, s, r in zip(result, c1, c2, r1, r2)]
+
+    def parity_packed(self, c, cloud_platform_third):
+        """
+        TODO 云服务器类 打包安全奇偶性判断协议
+        ! 每个槽位的结果需单独翻转, 无法在打包密文上同态完成, 因此逐元素返回
+        :param c: 密文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密奇偶性判断结果列表
+        """
+        width, count = self._packing()
+        r = self._generate_random_batch(len(c))
+        h = [pack_encrypted(a, width) + pack(s, width) for a, s in zip(chunks(c, count), chunks(r, count))]
+        alpha = cloud_platform_third.parity_packed(h, width, [len(a) for a in chunks(c, count)])
+
+        return [beta if s % 2 == 0 else 1 - beta for beta, s in zip(alpha, r)]
+
+    def gt_packed(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 打包安全大于协议
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密大于结果列表
+        """
+        return self._sign_packed([b - a for a, b in zip(c1, c2)], cloud_platform_third)
+
+    def ge_packed(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 打包安全大于等于协议
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密大于等于结果列表
+        """
+        return self.bit_not_batch(self.lt_packed(c1, c2, cloud_platform_third))
+
+    def lt_packed(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 打包安全小于协议
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密小于结果列表
+        """
+        return self._sign_packed([a - b for a, b in zip(c1, c2)], cloud_platform_third)
+
+    def le_packed(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 打包安全小于等于协议
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密小于等于结果列表
+        """
+        return self.bit_not_batch(self.gt_packed(c1, c2, cloud_platform_third))
+
+    async def mul_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步安全乘法协议
+        :param c1: 密文1
+        :param c2: 密文2 or 明文
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密乘法结果
+        """
+        return await self._run_async(self.mul, c1, c2, cloud_platform_third)
+
+    async def truediv_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步安全除法协议
+        :param c1: 密文1
+        :param c2: 密文2 or 明文
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密除法结果
+        """
+        return await self._run_async(self.truediv, c1, c2, cloud_platform_third)
+
+    async def floordiv_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步安全整除协议
+        :param c1: 密文1
+        :param c2: 密文2 or 明文
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密整除结果 E(c1 // c2)
+        """
+        return await self._run_async(self.floordiv, c1, c2, cloud_platform_third)
+
+    async def mod_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步安全取模协议
+        :param c1: 密文1
+        :param c2: 密文2 or 明文
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密取模结果 E(c1 % c2)
+        """
+        return await self._run_async(self.mod, c1, c2, cloud_platform_third)
+
+    async def optimum_async(self, c1, c2, cloud_platform_third, mode):
+        """
+        TODO 云服务器类 异步安全最值计算协议
+        :param c1: 密文1
+        :param c2: 密文2 or 明文
+        :param cloud_platform_third: 第三方云服务器
+        :param mode: 'max' or 'min'
+        :return: 加密最值计算结果
+        """
+        return await self._run_async(self.optimum, c1, c2, cloud_platform_third, mode)
+
+    async def parity_async(self, c, cloud_platform_third):
+        """
+        TODO 云服务器类 异步安全奇偶性判断协议
+        :param c: 密文
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密奇偶性判断结果
+        """
+        return await self._run_async(self.parity, c, cloud_platform_third)
+
+    async def bit_dec_async(self, c, bit, cloud_platform_third):
+        """
+        TODO 云服务器类 异步安全二进制分解协议
+        :param c: 密文
+        :param bit: 位数
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密二进制分解结果
+        """
+        return await self._run_async(self.bit_dec, c, bit, cloud_platform_third)
+
+    async def bit_and_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步安全二进制与协议
+        :param c1: 密文1
+        :param c2: 密文2
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密二进制与结果
+        """
+        return await self._run_async(self.bit_and, c1, c2, cloud_platform_third)
+
+    async def bit_or_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步安全二进制或协议
+        :param c1: 密文1
+        :param c2: 密文2
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密二进制或结果
+        """
+        return await self._run_async(self.bit_or, c1, c2, cloud_platform_third)
+
+    async def bit_xor_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步安全二进制异或协议
+        :param c1: 密文1
+        :param c2: 密文2
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密二进制异或结果
+        """
+        return await self._run_async(self.bit_xor, c1, c2, cloud_platform_third)
+
+    async def eq_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步安全相等协议
+        :param c1: 密文1
+        :param c2: 密文2 or 明文
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密相等结果
+        """
+        return await self._run_async(self.eq, c1, c2, cloud_platform_third)
+
+    async def ne_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步安全不相等协议
+        :param c1: 密文1
+        :param c2: 密文2
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密不相等结果
+        """
+        return await self._run_async(self.ne, c1, c2, cloud_platform_third)
+
+    async def gt_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步安全大于协议
+        :param c1: 密文1
+        :param c2: 密文2
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密大于结果
+        """
+        return await self._run_async(self.gt, c1, c2, cloud_platform_third)
+
+    async def ge_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步安全大于等于协议
+        :param c1: 密文1
+        :param c2: 密文2
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密大于等于结果
+        """
+        return await self._run_async(self.ge, c1, c2, cloud_platform_third)
+
+    async def lt_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步安全小于协议
+        :param c1: 密文1
+        :param c2: 密文2
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密小于结果
+        """
+        return await self._run_async(self.lt, c1, c2, cloud_platform_third)
+
+    async def le_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步安全小于等于协议
+        :param c1: 密文1
+        :param c2: 密文2
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密小于等于结果
+        """
+        return await self._run_async(self.le, c1, c2, cloud_platform_third)
+
+    async def select_async(self, c, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步安全选择协议
+        :param c: 加密条件 E(1) or E(0)
+        :param c1: 密文1 or 明文 条件为1时的结果
+        :param c2: 密文2 or 明文 条件为0时的结果
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密选择结果 E(c ? c1 : c2)
+        """
+        return await self._run_async(self.select, c, c1, c2, cloud_platform_third)
+
+    async def truncate_async(self, c, shift, cloud_platform_third):
+        """
+        TODO 云服务器类 异步安全截断协议
+        :param c: 密文 整数编码
+        :param shift: 截断位数
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密截断结果 E(floor(c / 2^shift)) 误差不超过1
+        """
+        return await self._run_async(self.truncate, c, shift, cloud_platform_third)
+
+    async def mul_batch_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步批量安全乘法协议
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密乘法结果列表
+        """
+        return await self._run_async(self.mul_batch, c1, c2, cloud_platform_third)
+
+    async def truediv_batch_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步批量安全除法协议
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密除法结果列表
+        """
+        return await self._run_async(self.truediv_batch, c1, c2, cloud_platform_third)
+
+    async def floordiv_batch_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步批量安全整除协议
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密整除结果列表
+        """
+        return await self._run_async(self.floordiv_batch, c1, c2, cloud_platform_third)
+
+    async def mod_batch_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步批量安全取模协议
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密取模结果列表
+        """
+        return await self._run_async(self.mod_batch, c1, c2, cloud_platform_third)
+
+    async def optimum_batch_async(self, c1, c2, cloud_platform_third, mode):
+        """
+        TODO 云服务器类 异步批量安全最值计算协议
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :param mode: 'max' or 'min'
+        :return: 加密最值计算结果列表
+        """
+        return await self._run_async(self.optimum_batch, c1, c2, cloud_platform_third, mode)
+
+    async def arg_optimum_batch_async(self, c1, c2, i1, i2, cloud_platform_third, mode):
+        """
+        TODO 云服务器类 异步批量安全最值及下标计算协议
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param i1: 密文1的下标 密文 or 明文列表
+        :param i2: 密文2的下标 密文 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :param mode: 'max' or 'min'
+        :return: (加密最值计算结果列表, 加密下标列表)
+        """
+        return await self._run_async(self.arg_optimum_batch, c1, c2, i1, i2, cloud_platform_third, mode)
+
+    async def parity_batch_async(self, c, cloud_platform_third):
+        """
+        TODO 云服务器类 异步批量安全奇偶性判断协议
+        :param c: 密文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密奇偶性判断结果列表
+        """
+        return await self._run_async(self.parity_batch, c, cloud_platform_third)
+
+    async def bit_dec_batch_async(self, c, bit, cloud_platform_third):
+        """
+        TODO 云服务器类 异步批量安全二进制分解协议
+        :param c: 密文列表
+        :param bit: 位数
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密二进制分解结果列表
+        """
+        return await self._run_async(self.bit_dec_batch, c, bit, cloud_platform_third)
+
+    async def bit_and_batch_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步批量安全二进制与协议
+        :param c1: 密文1列表
+        :param c2: 密文2列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密二进制与结果列表
+        """
+        return await self._run_async(self.bit_and_batch, c1, c2, cloud_platform_third)
+
+    async def bit_or_batch_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步批量安全二进制或协议
+        :param c1: 密文1列表
+        :param c2: 密文2列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密二进制或结果列表
+        """
+        return await self._run_async(self.bit_or_batch, c1, c2, cloud_platform_third)
+
+    async def bit_xor_batch_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步批量安全二进制异或协议
+        :param c1: 密文1列表
+        :param c2: 密文2列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密二进制异或结果列表
+        """
+        return await self._run_async(self.bit_xor_batch, c1, c2, cloud_platform_third)
+
+    async def eq_batch_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步批量安全相等协议
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密相等结果列表
+        """
+        return await self._run_async(self.eq_batch, c1, c2, cloud_platform_third)
+
+    async def ne_batch_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步批量安全不相等协议
+        :param c1: 密文1列表
+        :param c2: 密文2列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密不相等结果列表
+        """
+        return await self._run_async(self.ne_batch, c1, c2, cloud_platform_third)
+
+    async def gt_batch_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步批量安全大于协议
+        :param c1: 密文1列表
+        :param c2: 密文2列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密大于结果列表
+        """
+        return await self._run_async(self.gt_batch, c1, c2, cloud_platform_third)
+
+    async def ge_batch_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步批量安全大于等于协议
+        :param c1: 密文1列表
+        :param c2: 密文2列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密大于等于结果列表
+        """
+        return await self._run_async(self.ge_batch, c1, c2, cloud_platform_third)
+
+    async def lt_batch_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步批量安全小于协议
+        :param c1: 密文1列表
+        :param c2: 密文2列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密小于结果列表
+        """
+        return await self._run_async(self.lt_batch, c1, c2, cloud_platform_third)
+
+    async def le_batch_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步批量安全小于等于协议
+        :param c1: 密文1列表
+        :param c2: 密文2列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密小于等于结果列表
+        """
+        return await self._run_async(self.le_batch, c1, c2, cloud_platform_third)
+
+    async def select_batch_async(self, c, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步批量安全选择协议
+        :param c: 加密条件列表
+        :param c1: 密文1 or 明文列表 条件为1时的结果
+        :param c2: 密文2 or 明文列表 条件为0时的结果
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密选择结果列表
+        """
+        return await self._run_async(self.select_batch, c, c1, c2, cloud_platform_third)
+
+    async def truncate_batch_async(self, c, shift, cloud_platform_third):
+        """
+        TODO 云服务器类 异步批量安全截断协议
+        :param c: 密文列表 整数编码 |c| < 2^(2 * bit_length)
+        :param shift: 截断位数
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密截断结果列表
+        """
+        return await self._run_async(self.truncate_batch, c, shift, cloud_platform_third)
+
+    async def dot_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步安全内积协议
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密内积结果 E(sum(c1[i] * c2[i]))
+        """
+        return await self._run_async(self.dot, c1, c2, cloud_platform_third)
+
+    async def matmul_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步安全矩阵乘法协议
+        :param c1: 密文1矩阵 m * k
+        :param c2: 密文2 or 明文矩阵 k * n
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密矩阵乘法结果 m * n
+        """
+        return await self._run_async(self.matmul, c1, c2, cloud_platform_third)
+
+    async def mul_packed_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步打包安全乘法协议
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 打包密文列表 [PackedNumber(E(sum(c1[i] * c2[i] * 2^(i * width)))), ...]
+        """
+        return await self._run_async(self.mul_packed, c1, c2, cloud_platform_third)
+
+    async def parity_packed_async(self, c, cloud_platform_third):
+        """
+        TODO 云服务器类 异步打包安全奇偶性判断协议
+        :param c: 密文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密奇偶性判断结果列表
+        """
+        return await self._run_async(self.parity_packed, c, cloud_platform_third)
+
+    async def gt_packed_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步打包安全大于协议
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密大于结果列表
+        """
+        return await self._run_async(self.gt_packed, c1, c2, cloud_platform_third)
+
+    async def ge_packed_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步打包安全大于等于协议
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密大于等于结果列表
+        """
+        return await self._run_async(self.ge_packed, c1, c2, cloud_platform_third)
+
+    async def lt_packed_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步打包安全小于协议
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密小于结果列表
+        """
+        return await self._run_async(self.lt_packed, c1, c2, cloud_platform_third)
+
+    async def le_packed_async(self, c1, c2, cloud_platform_third):
+        """
+        TODO 云服务器类 异步打包安全小于等于协议
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密小于等于结果列表
+        """
+        return await self._run_async(self.le_packed, c1, c2, cloud_platform_third)
+
+    @staticmethod
+    def _is_plaintext(c):
+        """
+        云服务器 明文判断
+        :param c: 密文 or 明文
+        :return: 是否为明文
+        """
+        return isinstance(c, (int, float))
+
+    def _encode_constant(self, c):
+        """
+        云服务器 明文常量编码
+        ! 第三方云服务器只接收掩码后的常量, 无需混淆
+        :param c: 密文 or 明文
+        :return: 密文
+        """
+        return self.public_key.encrypt(c, r_value=1) if self._is_plaintext(c) else c
+
+    def _divmod_mask(self, c1, c2):
+        """
+        云服务器 整除与取模掩码
+        :param c1: 密文1列表
+        :param c2: 密文2 or 明文列表
+        :return: (r1 * (c1 + r2 * c2)列表, r1 * c2列表, r1列表, r2列表)
+        """
+        c2 = [self._encode_constant(b) for b in c2]
+        r1 = self._generate_factor_batch(len(c1))
+        r2 = self._generate_random_batch(len(c2))
+
+        return [(a + b * s) * r for a, b, r, s in zip(c1, c2, r1, r2)], [b * r for b, r in zip(c2, r1)], r1, r2
+
+    def _sign_batch(self, c, shift, cloud_platform_third):
+        """
+        云服务器 批量符号判断
+        :param c: 密文列表
+        :param shift: 偏移方向 1: 判断 c < 0 -1: 判断 c <= 0
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密符号判断结果列表
+        """
+        sigma, alpha = [], []
+        for v, r1, r2 in zip(c, self._generate_factor_batch(len(c)), self._generate_factor_batch(len(c))):
+            s = -1 if random.random() > 5e-1 else 1
+            (r2, r1) = (r1, r2) if r2 > r1 else (r2, r1)
+            sigma.append(s)
+            alpha.append(r1 * s * v + s * shift * r2)
+
+        return [beta if s == 1 else 1 - beta for beta, s in zip(cloud_platform_third.eq_batch(alpha), sigma)]
+
+    def _packing(self, product=False):
+        """
+        云服务器 打包参数
+        ! 打包要求操作数与掩码有界, 仅在sigma指定时可用
+        :param product: 是否容纳乘积
+        :return: (槽位宽度, 槽位数)
+        """
+        if self.sigma is None:
+            raise ValueError("Slot packing requires an explicit sigma")
+        width = slot_width(self.bit_length, self.sigma, product)
+
+        return width, slot_count(self.public_key, width)
+
+    def _sign_packed(self, c, cloud_platform_third):
+        """
+        云服务器 打包符号判断
+        ! 乘法掩码逐元素施加后再打包
+        :param c: 密文列表
+        :param cloud_platform_third: 第三方云服务器
+        :return: 加密符号判断结果列表 E(c < 0)
+        """
+        width, count = self._packing()
+        sigma, alpha = [], []
+        for v, r1, r2 in zip(c, self._generate_factor_batch(len(c)), self._generate_factor_batch(len(c))):
+            s = -1 if random.random() > 5e-1 else 1
+            (r2, r1) = (r1, r2) if r2 > r1 else (r2, r1)
+            sigma.append(s)
+            alpha.append(v * (r1 * s) + s * r2)
+        h = [pack_encrypted(a, width) for a in chunks(alpha, count)]
+        beta = cloud_platform_third.eq_packed(h, width, [len(a) for a in chunks(alpha, count)])
+
+        return [b if s == 1 else 1 - b for b, s in zip(beta, sigma)]
+
+    async def _run_async(self, method, *args):
+        """
+        云服务器 异步执行协议
+        ! 协议在有界线程池中执行, 不阻塞事件循环; 同时进行的协议不超过concurrency个, 其余排队等待
+        :param method: 协议方法
+        :param args: 协议参数
+        :return: 协议结果
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='smpcp')
+
+        return await asyncio.get_running_loop().run_in_executor(self._executor, functools.partial(method, *args))
+
+    def _generate_random(self):
+        """
+        云服务器 加法掩码生成
+        :return: 加法掩码
+        """
+        return self._generate_random_batch(1)[0]
+
+    def _generate_random_batch(self, count):
+        """
+        云服务器 批量加法掩码生成
+        :param count: 数量
+        :return: 加法掩码列表
+        """
+        if self.sigma is None:
+            return self.mask_generator.randbelow_batch(self.key_length, count)
+
+        return self.mask_generator.randbelow_batch(1 << (self.bit_length + self.sigma), count)
+
+    def _generate_factor(self):
+        """
+        云服务器 乘法掩码生成
+        :return: 乘法掩码
+        """
+        return self._generate_factor_batch(1)[0]
+
+    def _generate_factor_batch(self, count):
+        """
+        云服务器 批量乘法掩码生成
+        :param count: 数量
+        :return: 乘法掩码列表
+        """
+        bound = self.key_length if self.sigma is None else 1 << self.sigma
+
+        return [r + 1 for r in self.mask_generator.randbelow_batch(bound - 1, count)]
+
+
+class CloudPlatformThird:
+    """
+    第三方云服务器类
+    """
+
+    def __init__(self, public_key, secret_key, pool=None):
+        """
+        第三方云服务器类 定义
+        :param public_key: 公钥
+        :param secret_key: 私钥
+        :param pool: 混淆因子池 None: 在线加密
+        """
+        self.public_key = public_key
+        self.secret_key = secret_key
+        self.pool = pool
+
+    def _encrypt(self, value):
+        """
+        第三方云服务器 加密
+        :param value: 明文
+        :return: 加密数字
+        """
+        return self.pool.encrypt(value) if self.pool is not None else self.public_key.encrypt(value)
+
+    def mul(self, h1, h2):
+        """
+        TODO 第三方云服务器类 安全乘法协议
+        :param h1: 参数1
+        :param h2: 参数2
+        :return: 安全乘法协议结果
+        """
+        return self._encrypt(self.secret_key.decrypt(h1) * self.secret_key.decrypt(h2))
+
+    def truediv(self, h1, h2):
+        """
+        TODO 第三方云服务器类 安全除法协议
+        :param h1: 参数1
+        :param h2: 参数2
+        :return: 安全除法协议结果
+        """
+        h2 = self.secret_key.decrypt(h2)
+        if h2 != 0:
+            return self._encrypt(self.secret_key.decrypt(h1) / h2)
+        else:
+            assert ValueError("Divisor cannot be 0")
+
+    def floordiv(self, h1, h2):
+        """
+        TODO 第三方云服务器类 安全整除协议
+        :param h1: 参数1
+        :param h2: 参数2
+        :return: 安全整除协议结果
+        """
+        h2 = self.secret_key.decrypt(h2)
+        if h2 == 0:
+            raise ValueError("Divisor cannot be 0")
+
+        return self._encrypt(self.secret_key.decrypt(h1) // h2)
+
+    def mod(self, h1, h2):
+        """
+        TODO 第三方云服务器类 安全取模协议
+        :param h1: 参数1
+        :param h2: 参数2
+        :return: 安全取模协议结果
+        """
+        h2 = self.secret_key.decrypt(h2)
+        if h2 == 0:
+            raise ValueError("Divisor cannot be 0")
+
+        return self._encrypt(self.secret_key.decrypt(h1) % h2)
+
+    def optimum(self, h1, h2, h3, mode):
+        """
+        TODO 第三方云服务器类 安全最值计算协议
+        :param h1: 参数
+        :param h2: 参数
+        :param h3: 参数
+        :param mode: 'max' or 'min'
+        :return: 安全最值计算协议结果
+        """
+        mode = self.secret_key.decrypt(h1) > 0 if mode == 'max' else self.secret_key.decrypt(h1) < 0
+        alpha = 1 if mode else 0
+
+        return self._encrypt(alpha), h3 if alpha == 1 else h2
+
+    def parity(self, h):
+        """
+        TODO 第三方云服务器类 安全奇偶性判断协议
+        :param h: 参数
+        :return: 安全奇偶性判断协议结果
+        """
+        return self._encrypt(0) if self.secret_key.decrypt(h) % 2 == 0 else self._encrypt(1)
+
+    def eq(self, h):
+        """
+        TODO 第三方云服务器类 安全相等协议
+        :param h: 参数
+        :return: 安全相等协议结果
+        """
+        return self._encrypt(1) if self.secret_key.decrypt(h) < 0 else self._encrypt(0)
+
+    def truncate(self, h, shift):
+        """
+        TODO 第三方云服务器类 安全截断协议
+        :param h: 参数
+        :param shift: 截断位数
+        :return: 安全截断协议结果
+        """
+        return self._encrypt(self.secret_key.decrypt(h) >> shift)
+
+    def mul_batch(self, h1, h2):
+        """
+        TODO 第三方云服务器类 批量安全乘法协议
+        :param h1: 参数1列表
+        :param h2: 参数2列表
+        :return: 批量安全乘法协议结果列表
+        """
+        return [self.mul(a, b) for a, b in zip(h1, h2)]
+
+    def truediv_batch(self, h1, h2):
+        """
+        TODO 第三方云服务器类 批量安全除法协议
+        :param h1: 参数1列表
+        :param h2: 参数2列表
+        :return: 批量安全除法协议结果列表
+        """
+        return [self.truediv(a, b) for a, b in zip(h1, h2)]
+
+    def floordiv_batch(self, h1, h2):
+        """
+        TODO 第三方云服务器类 批量安全整除协议
+        :param h1: 参数1列表
+        :param h2: 参数2列表
+        :return: 批量安全整除协议结果列表
+        """
+        return [self.floordiv(a, b) for a, b in zip(h1, h2)]
+
+    def mod_batch(self, h1, h2):
+        """
+        TODO 第三方云服务器类 批量安全取模协议
+        :param h1: 参数1列表
+        :param h2: 参数2列表
+        :return: 批量安全取模协议结果列表
+        """
+        return [self.mod(a, b) for a, b in zip(h1, h2)]
+
+    def optimum_batch(self, h1, h2, h3, mode):
+        """
+        TODO 第三方云服务器类 批量安全最值计算协议
+        :param h1: 参数列表
+        :param h2: 参数列表
+        :param h3: 参数列表
+        :param mode: 'max' or 'min'
+        :return: 批量安全最值计算协议结果列表
+        """
+        return [self.optimum(a, b, c, mode) for a, b, c in zip(h1, h2, h3)]
+
+    def parity_batch(self, h):
+        """
+        TODO 第三方云服务器类 批量安全奇偶性判断协议
+        :param h: 参数列表
+        :return: 批量安全奇偶性判断协议结果列表
+        """
+        return [self.parity(v) for v in h]
+
+    def eq_batch(self, h):
+        """
+        TODO 第三方云服务器类 批量安全相等协议
+        :param h: 参数列表
+        :return: 批量安全相等协议结果列表
+        """
+        return [self.eq(v) for v in h]
+
+    def bit_dec(self, h, bit):
+        """
+        TODO 第三方云服务器类 安全二进制分解协议
+        :param h: 参数
+        :param bit: 位数
+        :return: 安全二进制分解协议结果 低位在前
+        """
+        h = int(self.secret_key.decrypt(h))
+
+        return [self._encrypt(h >> i & 1) for i in range(bit)]
+
+    def bit_dec_batch(self, h, bit):
+        """
+        TODO 第三方云服务器类 批量安全二进制分解协议
+        :param h: 参数列表
+        :param bit: 位数
+        :return: 批量安全二进制分解协议结果列表 低位在前
+        """
+        return [self.bit_dec(v, bit) for v in h]
+
+    def truncate_batch(self, h, shift):
+        """
+        TODO 第三方云服务器类 批量安全截断协议
+        :param h: 参数列表
+        :param shift: 截断位数
+        :return: 批量安全截断协议结果列表
+        """
+        return [self.truncate(v, shift) for v in h]
+
+    def matmul(self, h1, h2):
+        """
+        TODO 第三方云服务器类 安全矩阵乘法协议
+        :param h1: 参数1矩阵 m * k
+        :param h2: 参数2矩阵 k * n
+        :return: 安全矩阵乘法协议结果 m * n
+        """
+        a = [[self.secret_key.decrypt(v) for v in row] for row in h1]
+        b = list(zip(*([self.secret_key.decrypt(v) for v in row] for row in h2)))
+
+        return [[self._encrypt(sum(x * y for x, y in zip(row, col))) for col in b] for row in a]
+
+    def mul_packed(self, h1, h2, width, counts):
+        """
+        TODO 第三方云服务器类 打包安全乘法协议
+        :param h1: 打包参数1列表
+        :param h2: 打包参数2列表
+        :param width: 槽位宽度
+        :param counts: 各打包参数的槽位数
+        :return: 打包安全乘法协议结果列表
+        """
+        return [self._encrypt(pack([a * b for a, b in zip(unpack(self.secret_key.decrypt(x), width, k),
+                                                          unpack(self.secret_key.decrypt(y), width, k))], width))
+                for x, y, k in zip(h1, h2, counts)]
+
+    def parity_packed(self, h, width, counts):
+        """
+        TODO 第三方云服务器类 打包安全奇偶性判断协议
+        :param h: 打包参数列表
+        :param width: 槽位宽度
+        :param counts: 各打包参数的槽位数
+        :return: 打包安全奇偶性判断协议结果列表 逐槽位
+        """
+        return [self._encrypt(v % 2) for x, k in zip(h, counts) for v in unpack(self.secret_key.decrypt(x), width, k)]
+
+    def eq_packed(self, h, width, counts):
+        """
+        TODO 第三方云服务器类 打包安全相等协议
+        :param h: 打包参数列表
+        :param width: 槽位宽度
+        :param counts: 各打包参数的槽位数
+        :return: 打包安全相等协议结果列表 逐槽位
+        """
+        return [self._encrypt(1 if v < 0 else 0)
+                for x, k in zip(h, counts) for v in unpack(self.secret_key.decrypt(x), width, k)]
+
+    def batch(self, calls):
+        """
+        TODO 第三方云服务器类 多协议批量调用
+        ! 同一轮次内不同协议的请求合并为一次交互
+        :param calls: 协议调用列表 [(协议方法名, 位置参数列表), ...]
+        :return: 各协议结果列表
         """
-        return self.public_key.encrypt(1) if self.secret_key.decrypt(h) < 0 else self.public_key.encrypt(0)
+        return [getattr(self, method)(*args) for method, args in calls]
@@ -0,0 +1,596 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 10:05
+@File: transport.py
+@License: MIT
+"""
+import asyncio
+import concurrent.futures
+import functools
+import itertools
+import json
+import struct
+import threading
+
+from phe import EncryptedNumber
+
+from smpcp import wire
+
+# 第三方云服务器对外开放的协议方法
+METHODS = (
+    'mul', 'truediv', 'floordiv', 'mod', 'optimum', 'parity', 'bit_dec', 'eq', 'truncate',
+    'mul_batch', 'truediv_batch', 'floordiv_batch', 'mod_batch', 'optimum_batch', 'parity_batch', 'bit_dec_batch',
+    'eq_batch', 'truncate_batch',
+    'mul_packed', 'parity_packed', 'eq_packed', 'matmul', 'batch',
+)
+
+_HEADER = struct.Struct('>I')  # 帧头与消息内各段长度: 4字节大端
+
+
+class TransportError(Exception):
+    """
+    传输层异常
+    """
+
+
+def _dump(value, blobs):
+    """
+    序列化协议参数
+    ! 密文与密文列表以wire二进制格式存入blobs, JSON中只保留下标
+    :param value: 协议参数
+    :param blobs: 二进制密文批次列表
+    :return: 可JSON编码的协议参数
+    """
+    if isinstance(value, EncryptedNumber):
+        blobs.append(wire.encode_batch(value.public_key, [value]))
+        return {'n': len(blobs) - 1}
+    if isinstance(value, (list, tuple)):
+        if value and all(isinstance(v, EncryptedNumber) for v in value):
+            blobs.append(wire.encode_batch(value[0].public_key, value))
+            return {'b': len(blobs) - 1}
+        return [_dump(v, blobs) for v in value]
+
+    return value
+
+
+def _load(value, public_key, blobs):
+    """
+    反序列化协议参数
+    :param value: JSON解码后的协议参数
+    :param public_key: 公钥
+    :param blobs: 二进制密文批次列表
+    :return: 协议参数
+    """
+    if isinstance(value, dict):
+        if 'n' in value:
+            return wire.decode_batch(public_key, blobs[value['n']])[0]
+        return wire.decode_batch(public_key, blobs[value['b']])
+    if isinstance(value, list):
+        return [_load(v, public_key, blobs) for v in value]
+
+    return value
+
+
+def _pack(value, **fields):
+    """
+    编码消息
+    ! 格式: JSON长度 | JSON {**fields, 'value': 协议参数} | (批次长度 | wire二进制密文批次)...
+    :param value: 协议参数 or 协议结果
+    :param fields: 其他字段 如请求编号, 方法名, 错误信息
+    :return: 编码结果
+    """
+    blobs = []
+    body = json.dumps(dict(fields, value=_dump(value, blobs)), separators=(',', ':')).encode()
+
+    return b''.join([_HEADER.pack(len(body)), body] + [_HEADER.pack(len(v)) + v for v in blobs])
+
+
+def _split(data):
+    """
+    拆分消息 只解析JSON部分, 密文批次保留为memoryview切片, 不复制数据
+    :param data: 编码结果
+    :return: (消息, 二进制密文批次列表)
+    """
+    data = memoryview(data)
+    size, = _HEADER.unpack_from(data, 0)
+    offset = _HEADER.size + size
+    message = json.loads(bytes(data[_HEADER.size:offset]))
+    blobs = []
+    while offset < len(data):
+        size, = _HEADER.unpack_from(data, offset)
+        offset += _HEADER.size
+        blobs.append(data[offset:offset + size])
+        offset += size
+
+    return message, blobs
+
+
+def _unpack(data, public_key):
+    """
+    解码消息
+    :param data: 编码结果
+    :param public_key: 公钥
+    :return: 消息 {**fields, 'value': 协议参数}
+    """
+    message, blobs = _split(data)
+    message['value'] = _load(message['value'], public_key, blobs)
+
+    return message
+
+
+async def _read_frame(reader):
+    """
+    读取一帧数据
+    :param reader: 流读取器
+    :return: 帧数据
+    """
+    size, = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+
+    return await reader.readexactly(size)
+
+
+def _frame(data):
+    """
+    封装一帧数据
+    :param data: 编码后的消息
+    :return: 帧数据
+    """
+    return _HEADER.pack(len(data)) + data
+
+
+class CloudPlatformThirdServer:
+    """
+    第三方云服务器服务端类
+    ! 同一连接上的请求并发执行, 响应按完成顺序返回
+    """
+
+    def __init__(self, cloud_platform_third, host='127.0.0.1', port=0, path=None, executor=None):
+        """
+        第三方云服务器服务端类 定义
+        :param cloud_platform_third: 第三方云服务器
+        :param host: 监听地址
+        :param port: 监听端口 0: 自动分配
+        :param path: Unix套接字路径 指定后忽略host与port
+        :param executor: 执行协议计算的线程池 None: 事件循环默认线程池
+        """
+        self.cloud_platform_third = cloud_platform_third
+        self.host = host
+        self.port = port
+        self.path = path
+        self.executor = executor
+        self._server = None
+
+    @property
+    def address(self):
+        """
+        第三方云服务器服务端 监听地址
+        :return: (host, port) or Unix套接字路径
+        """
+        return self._server.sockets[0].getsockname()
+
+    async def start(self):
+        """
+        第三方云服务器服务端 启动
+        """
+        if self.path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, path=self.path)
+        else:
+            self._server = await asyncio.start_server(self._handle, host=self.host, port=self.port)
+
+        return self
+
+    async def serve_forever(self):
+        """
+        第三方云服务器服务端 持续服务
+        """
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self):
+        """
+        第三方云服务器服务端 关闭
+        """
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        """
+        第三方云服务器服务端 处理连接
+        :param reader: 流读取器
+        :param writer: 流写入器
+        """
+        lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                try:
+                    frame = await _read_frame(reader)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                task = asyncio.ensure_future(self._dispatch(frame, writer, lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            writer.close()
+
+    async def _dispatch(self, frame, writer, lock):
+        """
+        第三方云服务器服务端 执行请求
+        :param frame: 请求帧数据
+        :param writer: 流写入器
+        :param lock: 写入锁
+        """
+        request, blobs = _split(frame)
+        try:
+            if request['method'] not in METHODS:
+                raise TransportError("Unknown method: {0}".format(request['method']))
+            args = _load(request['value'], self.cloud_platform_third.public_key, blobs)
+            if request['method'] == 'batch':
+                for method, _ in args[0]:
+                    if method not in METHODS or method == 'batch':
+                        raise TransportError("Unknown method: {0}".format(method))
+            call = functools.partial(getattr(self.cloud_platform_third, request['method']), *args)
+            response = _pack(await asyncio.get_running_loop().run_in_executor(self.executor, call), id=request['id'])
+        except Exception as e:
+            response = _pack(None, id=request['id'], error="{0}: {1}".format(type(e).__name__, e))
+
+        async with lock:
+            writer.write(_frame(response))
+            await writer.drain()
+
+
+async def serve(cloud_platform_third, host='127.0.0.1', port=0, path=None):
+    """
+    启动第三方云服务器服务并持续服务
+    :param cloud_platform_third: 第三方云服务器
+    :param host: 监听地址
+    :param port: 监听端口
+    :param path: Unix套接字路径
+    """
+    await CloudPlatformThirdServer(cloud_platform_third, host=host, port=port, path=path).serve_forever()
+
+
+class CloudPlatformThirdClient:
+    """
+    第三方云服务器客户端类
+    ! 与CloudPlatformThird接口一致, 可直接传给CloudPlatform使用
+    """
+
+    def __init__(self, public_key, host='127.0.0.1', port=None, path=None, connections=1, timeout=None):
+        """
+        第三方云服务器客户端类 定义
+        :param public_key: 公钥
+        :param host: 服务端地址
+        :param port: 服务端端口
+        :param path: Unix套接字路径 指定后忽略host与port
+        :param connections: 持久连接数 请求按轮询分配到各连接
+        :param timeout: 请求超时时间(秒) None: 不超时
+        """
+        self.public_key = public_key
+        self.host = host
+        self.port = port
+        self.path = path
+        self.timeout = timeout
+        self._ids = itertools.count()
+        self._futures = {}
+        self._connections = []
+        self._lost = {}  # 已断开的连接 {连接序号: 断开原因}
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        for index in range(connections):
+            self._connections.append(asyncio.run_coroutine_threadsafe(self._connect(index), self._loop).result())
+
+    async def _connect(self, index):
+        """
+        第三方云服务器客户端 建立连接
+        :param index: 连接序号
+        :return: (流写入器, 写入锁, 接收任务)
+        """
+        if self.path is not None:
+            reader, writer = await asyncio.open_unix_connection(path=self.path)
+        else:
+            reader, writer = await asyncio.open_connection(host=self.host, port=self.port)
+
+        return writer, asyncio.Lock(), asyncio.ensure_future(self._receive(reader, index))
+
+    async def _receive(self, reader, index):
+        """
+        第三方云服务器客户端 接收响应
+        ! 连接断开后标记为已断开, 该连接上等待中的请求以TransportError失败, 后续请求以ConnectionError立即失败
+        :param reader: 流读取器
+        :param index: 连接序号
+        """
+        try:
+            while True:
+                response, blobs = _split(await _read_frame(reader))
+                future = self._futures.pop(response['id'], None)
+                if future is None or future.done():
+                    continue
+                if 'error' in response:
+                    future.set_exception(TransportError(response['error']))
+                else:
+                    try:
+                        future.set_result(_load(response['value'], self.public_key, blobs))
+                    except ValueError as e:
+                        future.set_exception(TransportError("Invalid response: {0}".format(e)))
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            self._lost[index] = "Connection lost: {0}".format(e)
+            for request_id, future in list(self._futures.items()):
+                if request_id % len(self._connections) == index and not future.done():
+                    future.set_exception(TransportError(self._lost[index]))
+
+    async def _request(self, request_id, method, args):
+        """
+        第三方云服务器客户端 发送请求并等待响应
+        :param request_id: 请求编号
+        :param method: 协议方法
+        :param args: 协议参数
+        :return: 协议结果
+        """
+        index = request_id % len(self._connections)
+        if index in self._lost:
+            raise ConnectionError(self._lost[index])
+        future = self._loop.create_future()
+        self._futures[request_id] = future
+        try:
+            writer, lock, _ = self._connections[index]
+            async with lock:
+                writer.write(_frame(_pack(list(args), id=request_id, method=method)))
+                await writer.drain()
+
+            return await future
+        finally:
+            self._futures.pop(request_id, None)
+
+    def _call(self, method, *args):
+        """
+        第三方云服务器客户端 同步调用
+        ! 超时后取消请求, 不再保留其等待中的响应
+        :param method: 协议方法
+        :param args: 协议参数
+        :return: 协议结果
+        """
+        future = asyncio.run_coroutine_threadsafe(self._request(next(self._ids), method, args), self._loop)
+        try:
+            return future.result(self.timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def close(self):
+        """
+        第三方云服务器客户端 关闭连接
+        """
+        async def _close():
+            for writer, _, task in self._connections:
+                writer.close()
+                task.cancel()
+
+        asyncio.run_coroutine_threadsafe(_close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def mul(self, h1, h2):
+        """
+        TODO 第三方云服务器客户端类 安全乘法协议
+        :param h1: 参数1
+        :param h2: 参数2
+        :return: 安全乘法协议结果
+        """
+        return self._call('mul', h1, h2)
+
+    def truediv(self, h1, h2):
+        """
+        TODO 第三方云服务器客户端类 安全除法协议
+        :param h1: 参数1
+        :param h2: 参数2
+        :return: 安全除法协议结果
+        """
+        return self._call('truediv', h1, h2)
+
+    def floordiv(self, h1, h2):
+        """
+        TODO 第三方云服务器客户端类 安全整除协议
+        :param h1: 参数1
+        :param h2: 参数2
+        :return: 安全整除协议结果
+        """
+        return self._call('floordiv', h1, h2)
+
+    def mod(self, h1, h2):
+        """
+        TODO 第三方云服务器客户端类 安全取模协议
+        :param h1: 参数1
+        :param h2: 参数2
+        :return: 安全取模协议结果
+        """
+        return self._call('mod', h1, h2)
+
+    def optimum(self, h1, h2, h3, mode):
+        """
+        TODO 第三方云服务器客户端类 安全最值计算协议
+        :param h1: 参数
+        :param h2: 参数
+        :param h3: 参数
+        :param mode: 'max' or 'min'
+        :return: 安全最值计算协议结果
+        """
+        return tuple(self._call('optimum', h1, h2, h3, mode))
+
+    def parity(self, h):
+        """
+        TODO 第三方云服务器客户端类 安全奇偶性判断协议
+        :param h: 参数
+        :return: 安全奇偶性判断协议结果
+        """
+        return self._call('parity', h)
+
+    def bit_dec(self, h, bit):
+        """
+        TODO 第三方云服务器客户端类 安全二进制分解协议
+        :param h: 参数
+        :param bit: 位数
+        :return: 安全二进制分解协议结果 低位在前
+        """
+        return self._call('bit_dec', h, bit)
+
+    def eq(self, h):
+        """
+        TODO 第三方云服务器客户端类 安全相等协议
+        :param h: 参数
+        :return: 安全相等协议结果
+        """
+        return self._call('eq', h)
+
+    def truncate(self, h, shift):
+        """
+        TODO 第三方云服务器客户端类 安全截断协议
+        :param h: 参数
+        :param shift: 截断位数
+        :return: 安全截断协议结果
+        """
+        return self._call('truncate', h, shift)
+
+    def mul_batch(self, h1, h2):
+        """
+        TODO 第三方云服务器客户端类 批量安全乘法协议
+        :param h1: 参数1列表
+        :param h2: 参数2列表
+        :return: 批量安全乘法协议结果列表
+        """
+        return self._call('mul_batch', h1, h2)
+
+    def truediv_batch(self, h1, h2):
+        """
+        TODO 第三方云服务器客户端类 批量安全除法协议
+        :param h1: 参数1列表
+        :param h2: 参数2列表
+        :return: 批量安全除法协议结果列表
+        """
+        return self._call('truediv_batch', h1, h2)
+
+    def floordiv_batch(self, h1, h2):
+        """
+        TODO 第三方云服务器客户端类 批量安全整除协议
+        :param h1: 参数1列表
+        :param h2: 参数2列表
+        :return: 批量安全整除协议结果列表
+        """
+        return self._call('floordiv_batch', h1, h2)
+
+    def mod_batch(self, h1, h2):
+        """
+        TODO 第三方云服务器客户端类 批量安全取模协议
+        :param h1: 参数1列表
+        :param h2: 参数2列表
+        :return: 批量安全取模协议结果列表
+        """
+        return self._call('mod_batch', h1, h2)
+
+    def optimum_batch(self, h1, h2, h3, mode):
+        """
+        TODO 第三方云服务器客户端类 批量安全最值计算协议
+        :param h1: 参数列表
+        :param h2: 参数列表
+        :param h3: 参数列表
+        :param mode: 'max' or 'min'
+        :return: 批量安全最值计算协议结果列表
+        """
+        return [tuple(v) for v in self._call('optimum_batch', h1, h2, h3, mode)]
+
+    def parity_batch(self, h):
+        """
+        TODO 第三方云服务器客户端类 批量安全奇偶性判断协议
+        :param h: 参数列表
+        :return: 批量安全奇偶性判断协议结果列表
+        """
+        return self._call('parity_batch', h)
+
+    def bit_dec_batch(self, h, bit):
+        """
+        TODO 第三方云服务器客户端类 批量安全二进制分解协议
+        :param h: 参数列表
+        :param bit: 位数
+        :return: 批量安全二进制分解协议结果列表 低位在前
+        """
+        return self._call('bit_dec_batch', h, bit)
+
+    def eq_batch(self, h):
+        """
+        TODO 第三方云服务器客户端类 批量安全相等协议
+        :param h: 参数列表
+        :return: 批量安全相等协议结果列表
+        """
+        return self._call('eq_batch', h)
+
+    def truncate_batch(self, h, shift):
+        """
+        TODO 第三方云服务器客户端类 批量安全截断协议
+        :param h: 参数列表
+        :param shift: 截断位数
+        :return: 批量安全截断协议结果列表
+        """
+        return self._call('truncate_batch', h, shift)
+
+    def mul_packed(self, h1, h2, width, counts):
+        """
+        TODO 第三方云服务器客户端类 打包安全乘法协议
+        :param h1: 打包参数1列表
+        :param h2: 打包参数2列表
+        :param width: 槽位宽度
+        :param counts: 各打包参数的槽位数
+        :return: 打包安全乘法协议结果列表
+        """
+        return self._call('mul_packed', h1, h2, width, counts)
+
+    def parity_packed(self, h, width, counts):
+        """
+        TODO 第三方云服务器客户端类 打包安全奇偶性判断协议
+        :param h: 打包参数列表
+        :param width: 槽位宽度
+        :param counts: 各打包参数的槽位数
+        :return: 打包安全奇偶性判断协议结果列表 逐槽位
+        """
+        return self._call('parity_packed', h, width, counts)
+
+    def eq_packed(self, h, width, counts):
+        """
+        TODO 第三方云服务器客户端类 打包安全相等协议
+        :param h: 打包参数列表
+        :param width: 槽位宽度
+        :param counts: 各打包参数的槽位数
+        :return: 打包安全相等协议结果列表 逐槽位
+        """
+        return self._call('eq_packed', h, width, counts)
+
+    def matmul(self, h1, h2):
+        """
+        TODO 第三方云服务器客户端类 安全矩阵乘法协议
+        :param h1: 参数1矩阵 m * k
+        :param h2: 参数2矩阵 k * n
+        :return: 安全矩阵乘法协议结果 m * n
+        """
+        return self._call('matmul', h1, h2)
+
+    def batch(self, calls):
+        """
+        TODO 第三方云服务器客户端类 多协议批量调用
+        :param calls: 协议调用列表 [(协议方法名, 位置参数列表), ...]
+        :return: 各协议结果列表
+        """
+        return self._call('batch', calls)
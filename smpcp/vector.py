@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 09:12
+@File: vector.py
+@License: MIT
+"""
+
+
+class EncryptedVector:
+    """
+    加密向量类
+    ! 逐元素运算, 每一轮协议只与第三方云服务器交互一次
+    """
+
+    def __init__(self, c1, c2, ciphers=None):
+        """
+        加密向量类 定义
+        :param c1: 云服务器
+        :param c2: 第三方云服务器
+        :param ciphers: 密文列表
+        """
+        self.c1 = c1
+        self.c2 = c2
+        self.ciphers = list(ciphers) if ciphers is not None else []
+
+    def encode(self, encrypted_numbers):
+        """
+        加密向量类 编码
+        :param encrypted_numbers: 加密数字列表
+        :return: 编码后的加密向量
+        """
+        return EncryptedVector(c1=self.c1, c2=self.c2, ciphers=encrypted_numbers)
+
+    def decode(self):
+        """
+        加密向量类 解码
+        :return: 解码后的加密数字列表
+        """
+        return list(self.ciphers)
+
+    def __len__(self):
+        return len(self.ciphers)
+
+    def __iter__(self):
+        return iter(self.ciphers)
+
+    def __getitem__(self, item):
+        return self.ciphers[item]
+
+    def _operand(self, other):
+        """
+        加密向量类 操作数对齐
+        :param other: 加密向量 or 密文列表 or 明文
+        :return: 密文列表
+        """
+        if isinstance(other, (int, float)):
+            return [other] * len(self.ciphers)
+        other = other.ciphers if isinstance(other, EncryptedVector) else list(other)
+        if len(other) != len(self.ciphers):
+            raise ValueError("Vector length mismatch: {0} != {1}".format(len(self.ciphers), len(other)))
+
+        return other
+
+    def __mul__(self, other):
+        """
+        TODO 加密向量类 批量安全乘法协议
+        :param other: 加密向量 or 密文列表 or 明文
+        :return: 批量安全乘法协议结果 [E(self[i] * other[i]), ...]
+        """
+        return self.c1.mul_batch(self.ciphers, self._operand(other), self.c2)
+
+    def __truediv__(self, other):
+        """
+        TODO 加密向量类 批量安全除法协议
+        :param other: 加密向量 or 密文列表 or 明文
+        :return: 批量安全除法协议结果 [E(self[i] / other[i]), ...]
+        """
+        return self.c1.truediv_batch(self.ciphers, self._operand(other), self.c2)
+
+    def __floordiv__(self, other):
+        """
+        TODO 加密向量类 批量安全整除协议
+        ! 只能用于整数
+        :param other: 加密向量 or 密文列表 or 明文
+        :return: 批量安全整除协议结果 [E(self[i] // other[i]), ...]
+        """
+        return self.c1.floordiv_batch(self.ciphers, self._operand(other), self.c2)
+
+    def __mod__(self, other):
+        """
+        TODO 加密向量类 批量安全取模协议
+        ! 只能用于整数
+        :param other: 加密向量 or 密文列表 or 明文
+        :return: 批量安全取模协议结果 [E(self[i] % other[i]), ...]
+        """
+        return self.c1.mod_batch(self.ciphers, self._operand(other), self.c2)
+
+    def optimum(self, other, mode):
+        """
+        TODO 加密向量类 批量安全最值计算协议
+        :param other: 加密向量 or 密文列表 or 明文
+        :param mode: 'max' or 'min'
+        :return: 批量安全最值计算协议结果 [E(max(self[i], other[i])) or E(min(self[i], other[i])), ...]
+        """
+        return self.c1.optimum_batch(self.ciphers, self._operand(other), self.c2, mode)
+
+    def parity(self):
+        """
+        TODO 加密向量类 批量安全奇偶性判断协议
+        :return: 批量安全奇偶性判断协议结果 奇数: E(1) 偶数: E(0)
+        """
+        return self.c1.parity_batch(self.ciphers, self.c2)
+
+    def bit_dec(self, bit):
+        """
+        TODO 加密向量类 批量安全二进制分解协议
+        :param bit: 位数
+        :return: 批量安全二进制分解协议结果 [[E(1) or E(0), ...], ...] 每项长度为bit
+        """
+        return self.c1.bit_dec_batch(self.ciphers, bit, self.c2)
+
+    def __and__(self, other):
+        """
+        TODO 加密向量类 批量安全二进制与协议
+        ! 只能用于二进制数
+        :param other: 加密向量 or 密文列表 or 明文
+        :return: 批量安全二进制与协议结果 [E(self[i] & other[i]), ...]
+        """
+        return self.c1.bit_and_batch(self.ciphers, self._operand(other), self.c2)
+
+    def __or__(self, other):
+        """
+        TODO 加密向量类 批量安全二进制或协议
+        ! 只能用于二进制数
+        :param other: 加密向量 or 密文列表 or 明文
+        :return: 批量安全二进制或协议结果 [E(self[i] | other[i]), ...]
+        """
+        return self.c1.bit_or_batch(self.ciphers, self._operand(other), self.c2)
+
+    def bit_not(self):
+        """
+        TODO 加密向量类 批量安全二进制非协议
+        ! 只能用于二进制数
+        :return: 批量安全二进制非协议结果 [E(!self[i]), ...]
+        """
+        return self.c1.bit_not_batch(self.ciphers)
+
+    def __xor__(self, other):
+        """
+        TODO 加密向量类 批量安全二进制异或协议
+        ! 只能用于二进制数
+        :param other: 加密向量 or 密文列表 or 明文
+        :return: 批量安全二进制异或协议结果 [E(self[i] ^ other[i]), ...]
+        """
+        return self.c1.bit_xor_batch(self.ciphers, self._operand(other), self.c2)
+
+    def __eq__(self, other):
+        """
+        TODO 加密向量类 批量安全相等协议
+        :param other: 加密向量 or 密文列表 or 明文
+        :return: 批量安全相等协议结果 [E(self[i] == other[i]), ...]
+        """
+        return self.c1.eq_batch(self.ciphers, self._operand(other), self.c2)
+
+    def __ne__(self, other):
+        """
+        TODO 加密向量类 批量安全不相等协议
+        :param other: 加密向量 or 密文列表 or 明文
+        :return: 批量安全不相等协议结果 [E(self[i] != other[i]), ...]
+        """
+        return self.c1.ne_batch(self.ciphers, self._operand(other), self.c2)
+
+    def __gt__(self, other):
+        """
+        TODO 加密向量类 批量安全大于协议
+        :param other: 加密向量 or 密文列表 or 明文
+        :return: 批量安全大于协议结果 [E(self[i] > other[i]), ...]
+        """
+        return self.c1.gt_batch(self.ciphers, self._operand(other), self.c2)
+
+    def __ge__(self, other):
+        """
+        TODO 加密向量类 批量安全大于等于协议
+        :param other: 加密向量 or 密文列表 or 明文
+        :return: 批量安全大于等于协议结果 [E(self[i] >= other[i]), ...]
+        """
+        return self.c1.ge_batch(self.ciphers, self._operand(other), self.c2)
+
+    def __lt__(self, other):
+        """
+        TODO 加密向量类 批量安全小于协议
+        :param other: 加密向量 or 密文列表 or 明文
+        :return: 批量安全小于协议结果 [E(self[i] < other[i]), ...]
+        """
+        return self.c1.lt_batch(self.ciphers, self._operand(other), self.c2)
+
+    def __le__(self, other):
+        """
+        TODO 加密向量类 批量安全小于等于协议
+        :param other: 加密向量 or 密文列表 or 明文
+        :return: 批量安全小于等于协议结果 [E(self[i] <= other[i]), ...]
+        """
+        return self.c1.le_batch(self.ciphers, self._operand(other), self.c2)
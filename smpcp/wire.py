@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 19:20
+@File: wire.py
+@License: MIT
+"""
+import hashlib
+import struct
+
+from phe import EncryptedNumber
+
+MAGIC = b'SMPW'  # 魔数
+VERSION = 1  # 格式版本
+
+_SHARED = 0x01  # 标志位: 所有密文共用一个指数
+
+# 头部: 魔数, 版本, 标志位, 公钥指纹, 密文数量, 密文宽度(字节)
+_HEADER = struct.Struct('>4sBB8sIH')
+
+
+def fingerprint(public_key):
+    """
+    公钥指纹
+    :param public_key: 公钥
+    :return: 8字节指纹 SHA-256(n)前8字节
+    """
+    n = public_key.n
+
+    return hashlib.sha256(n.to_bytes((n.bit_length() + 7) // 8, 'big')).digest()[:8]
+
+
+def width(public_key):
+    """
+    密文宽度
+    :param public_key: 公钥
+    :return: 每个密文占用的字节数
+    """
+    return (public_key.nsquare.bit_length() + 7) // 8
+
+
+def encode_batch(public_key, encrypted_numbers):
+    """
+    编码密文批次
+    ! 格式: 头部 | 指数 (int32 大端, 共用时只存一个) | 密文 (定长大端, 连续存放)
+    :param public_key: 公钥
+    :param encrypted_numbers: 加密数字列表
+    :return: 编码结果
+    """
+    exponents = [v.exponent for v in encrypted_numbers]
+    shared = len(set(exponents)) == 1
+    if shared:
+        exponents = exponents[:1]
+    size = width(public_key)
+
+    data = bytearray(_HEADER.size + 4 * len(exponents) + size * len(encrypted_numbers))
+    _HEADER.pack_into(data, 0, MAGIC, VERSION, _SHARED if shared else 0, fingerprint(public_key),
+                      len(encrypted_numbers), size)
+    struct.pack_into('>{0}i'.format(len(exponents)), data, _HEADER.size, *exponents)
+    offset = _HEADER.size + 4 * len(exponents)
+    for v in encrypted_numbers:
+        if v.public_key != public_key:
+            raise ValueError("Encrypted number was encrypted under a different key")
+        data[offset:offset + size] = v.ciphertext(be_secure=False).to_bytes(size, 'big')
+        offset += size
+
+    return bytes(data)
+
+
+class BatchView:
+    """
+    密文批次视图类
+    ! 直接引用原始缓冲区, 按需构造加密数字, 不复制密文数据
+    """
+
+    def __init__(self, public_key, data):
+        """
+        密文批次视图类 定义
+        :param public_key: 公钥
+        :param data: 编码结果 bytes or bytearray or memoryview
+        """
+        data = memoryview(data).cast('B')
+        if len(data) < _HEADER.size:
+            raise ValueError("Truncated batch header")
+        magic, version, flags, key, count, size = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Invalid batch magic: {0!r}".format(magic))
+        if version != VERSION:
+            raise ValueError("Unsupported batch version: {0}".format(version))
+        if key != fingerprint(public_key) or size != width(public_key):
+            raise ValueError("Batch was encoded under a different public key")
+
+        exponents = 1 if flags & _SHARED else count
+        self._offset = _HEADER.size + 4 * exponents
+        if len(data) != self._offset + size * count:
+            raise ValueError("Batch size mismatch: expected {0} bytes, got {1}".format(
+                self._offset + size * count, len(data)))
+        self.public_key = public_key
+        self._data = data
+        self._count = count
+        self._size = size
+        self._exponents = struct.unpack_from('>{0}i'.format(exponents), data, _HEADER.size) if count else ()
+
+    @property
+    def exponents(self):
+        """
+        密文批次视图类 指数
+        :return: 指数元组 共用指数时只有一个
+        """
+        return self._exponents
+
+    @property
+    def ciphertexts(self):
+        """
+        密文批次视图类 密文数据
+        :return: 定长大端密文的memoryview
+        """
+        return self._data[self._offset:]
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self[i] for i in range(*item.indices(self._count))]
+        if item < 0:
+            item += self._count
+        if not 0 <= item < self._count:
+            raise IndexError("Batch index out of range")
+        start = self._offset + item * self._size
+        exponent = self._exponents[0] if len(self._exponents) == 1 else self._exponents[item]
+
+        return EncryptedNumber(self.public_key, int.from_bytes(self._data[start:start + self._size], 'big'), exponent)
+
+    def __iter__(self):
+        data, size, public_key = self._data, self._size, self.public_key
+        exponents = self._exponents * self._count if len(self._exponents) == 1 else self._exponents
+        for start, exponent in zip(range(self._offset, len(data), size), exponents):
+            yield EncryptedNumber(public_key, int.from_bytes(data[start:start + size], 'big'), exponent)
+
+
+def decode_batch(public_key, data):
+    """
+    解码密文批次
+    :param public_key: 公钥
+    :param data: 编码结果 bytes or bytearray or memoryview
+    :return: 加密数字列表
+    """
+    return list(BatchView(public_key, data))
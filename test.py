@@ -20,6 +20,7 @@ import tqdm
 
 sys.path.append("test_case/")  # 添加测试文件路径
 from BeautifulReport import BeautifulReport
+from test_case.keypair import keypair
 
 TEMPLATE_PATH = 'test_case/template/template'  # 模板文件路径
 REPORT_PATH = 'test_case/report'  # 报告文件路径
@@ -89,6 +90,7 @@ def run():
 
 if __name__ == '__main__':
     start = time.time()  # 开始时间
+    keypair()  # 预先生成并缓存密钥对 各测试进程直接加载
     times = 100  # TODO 测试次数
     process_pool = Pool(cpu_count())  # 开启进程池
     # 进度条
@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 18:52
+@File: keypair.py
+@License: MIT
+"""
+import functools
+import os
+
+from smpcp.keystore import cached_keypair
+
+# 密钥缓存目录 可通过环境变量SMPCP_KEYSTORE指定
+KEYSTORE_PATH = os.environ.get('SMPCP_KEYSTORE', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.keystore'))
+
+
+@functools.lru_cache(maxsize=None)
+def keypair(key_length=2048):
+    """
+    测试用密钥对 同一进程及各测试进程共用一份磁盘缓存
+    :param key_length: 密钥长度
+    :return: (公钥, 私钥)
+    """
+    return cached_keypair(os.path.join(KEYSTORE_PATH, 'paillier-{0}.json'.format(key_length)), n_length=key_length)
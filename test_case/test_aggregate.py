@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/19 02:05
+@File: test_aggregate.py
+@License: MIT
+"""
+import random
+import statistics
+import sys
+import unittest
+
+from smpcp.aggregate import secure_covariance, secure_mean, secure_sum, secure_variance
+from smpcp.metrics import ProtocolMetrics
+from smpcp.smpcp import CloudPlatform, CloudPlatformThird
+from smpcp.vector import EncryptedVector
+from test_case.keypair import keypair
+
+sys.path.append("test_case/")  # 添加测试文件路径
+
+key_length = 2048  # TODO 密钥长度
+size = 10  # TODO 向量长度
+
+public_key, secret_key = keypair(key_length)  # 加载缓存的密钥对
+
+cloud1 = CloudPlatform(public_key=public_key)  # 云服务器1
+cloud2 = CloudPlatformThird(public_key=public_key, secret_key=secret_key)  # 云服务器2
+
+vector = EncryptedVector(c1=cloud1, c2=cloud2)  # 加密向量类
+
+
+class AggregateTest(unittest.TestCase):
+    """
+    安全聚合统计测试类
+    """
+
+    def setUp(self):
+        """
+        测试前
+        """
+        self.x = [random.SystemRandom().randint(-key_length, key_length) for _ in range(size)]
+        self.y = [random.SystemRandom().randint(-key_length, key_length) for _ in range(size)]
+        self.w = [random.SystemRandom().randint(1, 10) for _ in range(size)]
+        self.ex = vector.encode([public_key.encrypt(v) for v in self.x])
+        self.ey = vector.encode([public_key.encrypt(v) for v in self.y])
+        return super().setUp()
+
+    def test_sum(self):
+        """
+        安全求和协议 无需交互, 支持混合指数
+        """
+        with ProtocolMetrics() as metrics:
+            result = secure_sum(self.ex)
+        self.assertEqual(0, metrics.totals['rounds'])
+        self.assertEqual(sum(self.x), secret_key.decrypt(result))
+        self.assertAlmostEqual(sum(self.x) + 0.5, secret_key.decrypt(secure_sum(
+            self.ex.encode(self.ex.decode() + [public_key.encrypt(0.5)]))))
+        self.assertEqual(0, secret_key.decrypt(secure_sum(vector)))
+
+    def test_mean(self):
+        """
+        安全均值协议
+        """
+        with ProtocolMetrics() as metrics:
+            result = secure_mean(self.ex)
+        self.assertEqual(0, metrics.totals['rounds'])
+        self.assertAlmostEqual(statistics.mean(self.x), secret_key.decrypt(result))
+        weighted = sum(a * w for a, w in zip(self.x, self.w)) / sum(self.w)
+        self.assertAlmostEqual(weighted, secret_key.decrypt(secure_mean(self.ex, self.w)))
+        with ProtocolMetrics() as metrics:
+            result = secure_mean(self.ex, [public_key.encrypt(w) for w in self.w])
+        self.assertEqual(2, metrics.totals['rounds'])
+        self.assertAlmostEqual(weighted, secret_key.decrypt(result))
+        result = secure_mean(self.ex, count=public_key.encrypt(size - 2))
+        self.assertAlmostEqual(sum(self.x) / (size - 2), secret_key.decrypt(result))
+        with self.assertRaises(ValueError):
+            secure_mean(vector)
+
+    def test_variance(self):
+        """
+        安全方差协议 一轮交互
+        """
+        with ProtocolMetrics() as metrics:
+            population = secure_variance(self.ex)
+        self.assertEqual(1, metrics.totals['rounds'])
+        self.assertEqual(2, metrics.totals['c2']['encrypt'])
+        self.assertAlmostEqual(statistics.pvariance(self.x), secret_key.decrypt(population), places=6)
+        self.assertAlmostEqual(statistics.variance(self.x), secret_key.decrypt(secure_variance(self.ex, ddof=1)),
+                               places=6)
+        with self.assertRaises(ValueError):
+            secure_variance(self.ex.encode(self.ex.decode()[:1]), ddof=1)
+
+    def test_covariance(self):
+        """
+        安全协方差协议 一轮交互
+        """
+        with ProtocolMetrics() as metrics:
+            result = secure_covariance(self.ex, self.ey, ddof=1)
+        self.assertEqual(1, metrics.totals['rounds'])
+        self.assertAlmostEqual(statistics.covariance(self.x, self.y), secret_key.decrypt(result), places=6)
+        with self.assertRaises(ValueError):
+            secure_covariance(self.ex, self.ey.encode(self.ey.decode()[1:]))
+
+
+if __name__ == '__main__':
+    unittest.main()
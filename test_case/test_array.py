@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 20:36
+@File: test_array.py
+@License: MIT
+"""
+import random
+import sys
+import unittest
+
+from smpcp import wire
+from smpcp.array import CipherArray
+from smpcp.smpcp import CloudPlatform, CloudPlatformThird, SecureMultiPartyComputationProtocol
+from test_case.keypair import keypair
+
+sys.path.append("test_case/")  # 添加测试文件路径
+
+key_length = 2048  # TODO 密钥长度
+
+public_key, secret_key = keypair(key_length)  # 加载缓存的密钥对
+
+cloud1 = CloudPlatform(public_key=public_key)  # 云服务器1
+cloud2 = CloudPlatformThird(public_key=public_key, secret_key=secret_key)  # 云服务器2
+
+
+class CipherArrayTest(unittest.TestCase):
+    """
+    密文数组测试类
+    """
+
+    def setUp(self):
+        """
+        测试前
+        """
+        self.ints = [random.SystemRandom().randint(-key_length, key_length) for _ in range(8)]
+        self.array = CipherArray.from_numbers(public_key, [public_key.encrypt(v) for v in self.ints])
+        return super().setUp()
+
+    def decrypt(self, ciphers):
+        """
+        解密密文列表
+        """
+        return [secret_key.decrypt(v) for v in ciphers]
+
+    def test_container(self):
+        """
+        存取与切片
+        """
+        self.assertEqual(len(self.ints), len(self.array))
+        self.assertEqual(self.ints, self.decrypt(self.array))
+        self.assertEqual(self.ints[-1], secret_key.decrypt(self.array[-1]))
+        self.assertEqual(self.ints[2:6], self.decrypt(self.array[2:6]))
+        self.assertEqual(self.ints[::3], self.decrypt(self.array[::3]))
+        self.array.append(public_key.encrypt(7))
+        self.assertEqual(7, secret_key.decrypt(self.array[len(self.ints)]))
+        with self.assertRaises(IndexError):
+            _ = self.array[len(self.ints) + 1]
+
+    def test_exponent(self):
+        """
+        指数统一
+        """
+        floats = [0.5, -1.25, 3, 1e-3]
+        array = CipherArray.from_numbers(public_key, [public_key.encrypt(v) for v in floats])
+        self.assertEqual(min(public_key.encrypt(v).exponent for v in floats), array.exponent)
+        self.assertEqual(floats, [round(v, 10) for v in self.decrypt(array)])
+
+    def test_convert(self):
+        """
+        与加密向量、安全多方计算协议及二进制格式互转
+        """
+        vector = self.array.to_vector(cloud1, cloud2)
+        self.assertEqual([a * a for a in self.ints], self.decrypt(vector * vector))
+        self.assertEqual(self.ints, self.decrypt(CipherArray.from_vector(vector)))
+
+        protocols = self.array.to_protocols(cloud1, cloud2)
+        self.assertIsInstance(protocols[0], SecureMultiPartyComputationProtocol)
+        self.assertEqual(self.ints[0] * self.ints[1], secret_key.decrypt(protocols[0] * protocols[1].decode()))
+        self.assertEqual(self.ints, self.decrypt(CipherArray.from_protocols(public_key, protocols)))
+
+        data = self.array.to_wire()
+        self.assertEqual(self.ints, self.decrypt(wire.decode_batch(public_key, data)))
+        self.assertEqual(self.ints, self.decrypt(CipherArray.from_wire(public_key, data)))
+
+    def test_memory(self):
+        """
+        每个元素占用内存
+        """
+        self.assertLess(self.array.memory_per_element(), self.array.width + 64)
+        self.assertEqual(0.0, CipherArray(public_key).memory_per_element())
+        with self.assertRaises(ValueError):
+            CipherArray(public_key, data=b'\x00')
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/19 00:10
+@File: test_async.py
+@License: MIT
+"""
+import asyncio
+import random
+import sys
+import threading
+import time
+import unittest
+
+from smpcp.metrics import ProtocolMetrics
+from smpcp.smpcp import CloudPlatform, CloudPlatformThird, SecureMultiPartyComputationProtocol
+from test_case.keypair import keypair
+
+sys.path.append("test_case/")  # 添加测试文件路径
+
+key_length = 2048  # TODO 密钥长度
+
+public_key, secret_key = keypair(key_length)  # 加载缓存的密钥对
+
+cloud1 = CloudPlatform(public_key=public_key)  # 云服务器1
+cloud2 = CloudPlatformThird(public_key=public_key, secret_key=secret_key)  # 云服务器2
+
+protocol = SecureMultiPartyComputationProtocol(c1=cloud1, c2=cloud2)  # 安全多方计算协议类
+
+
+class SlowCloudPlatformThird(CloudPlatformThird):
+    """
+    模拟网络延迟的第三方云服务器 记录同时进行的请求数
+    """
+
+    def __init__(self, delay):
+        super().__init__(public_key, secret_key)
+        self.delay = delay
+        self.active = self.peak = 0
+        self._lock = threading.Lock()
+
+    def mul(self, h1, h2):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+
+        return super().mul(h1, h2)
+
+
+class AsyncTest(unittest.IsolatedAsyncioTestCase):
+    """
+    异步协议测试类
+    """
+
+    def setUp(self):
+        """
+        测试前
+        """
+        self.int1 = random.SystemRandom().randint(-key_length, key_length)
+        self.int2 = random.SystemRandom().randint(1, key_length)
+        self.n1 = protocol.encode(public_key.encrypt(self.int1))
+        self.n2 = public_key.encrypt(self.int2)
+        return super().setUp()
+
+    async def test_protocol(self):
+        """
+        异步协议结果与同步一致
+        """
+        result = await asyncio.gather(self.n1.mul_async(self.n2), self.n1.optimum_async(self.n2, 'min'),
+                                      self.n1.gt_async(self.n2), self.n1.le_async(self.n2), self.n1.eq_async(self.n2),
+                                      self.n1.parity_async(), self.n1.truediv_async(self.n2))
+        self.assertEqual([self.int1 * self.int2, min(self.int1, self.int2), int(self.int1 > self.int2),
+                          int(self.int1 <= self.int2), int(self.int1 == self.int2), self.int1 % 2],
+                         [secret_key.decrypt(v) for v in result[:-1]])
+        self.assertAlmostEqual(self.int1 / self.int2, secret_key.decrypt(result[-1]))
+        bits = await protocol.encode(public_key.encrypt(self.int2)).bit_dec_async(12)
+        self.assertEqual([int(v) for v in format(self.int2, '012b')], [secret_key.decrypt(v) for v in bits])
+
+    async def test_batch(self):
+        """
+        异步批量协议
+        """
+        c = [public_key.encrypt(v) for v in range(4)]
+        result = await cloud1.lt_batch_async(c, [self.n2] * 4, cloud2)
+        self.assertEqual([int(v < self.int2) for v in range(4)], [secret_key.decrypt(v) for v in result])
+
+    async def test_concurrency(self):
+        """
+        并发数受限, 多个协议的第三方云服务器延迟相互重叠, 事件循环不被阻塞
+        """
+        slow, c1 = SlowCloudPlatformThird(delay=0.2), CloudPlatform(public_key=public_key, concurrency=2)
+        ticks = []
+
+        async def tick():
+            while len(ticks) < 1000:
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.ensure_future(tick())
+        start = time.perf_counter()
+        result = await asyncio.gather(*(c1.mul_async(self.n1.decode(), self.n2, slow) for _ in range(6)))
+        elapsed = time.perf_counter() - start
+        ticker.cancel()
+        self.assertEqual([self.int1 * self.int2] * 6, [secret_key.decrypt(v) for v in result])
+        self.assertEqual(2, slow.peak)
+        self.assertLess(elapsed, 6 * 0.2)
+        self.assertGreater(len(ticks), 10)
+
+    async def test_metrics(self):
+        """
+        异步协议只记录一次顶层调用
+        """
+        with ProtocolMetrics() as metrics:
+            await self.n1.mul_async(self.n2)
+        self.assertEqual(['mul'], [v['protocol'] for v in metrics.calls])
+        self.assertEqual(1, metrics.totals['rounds'])
+
+
+if __name__ == '__main__':
+    unittest.main()
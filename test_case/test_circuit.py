@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/19 04:10
+@File: test_circuit.py
+@License: MIT
+"""
+import random
+import sys
+import unittest
+from unittest import mock
+
+from smpcp.circuit import Circuit, adder_circuit, comparison_circuit, equality_circuit
+from smpcp.metrics import ProtocolMetrics
+from smpcp.smpcp import CloudPlatform, CloudPlatformThird
+from test_case.keypair import keypair
+
+sys.path.append("test_case/")  # 添加测试文件路径
+
+key_length = 2048  # TODO 密钥长度
+bit = 8  # TODO 位数
+
+public_key, secret_key = keypair(key_length)  # 加载缓存的密钥对
+
+cloud1 = CloudPlatform(public_key=public_key)  # 云服务器1
+cloud2 = CloudPlatformThird(public_key=public_key, secret_key=secret_key)  # 云服务器2
+
+
+def encrypt_bits(value, width):
+    """
+    加密二进制分解 高位在前
+    :param value: 非负整数
+    :param width: 位数
+    :return: 加密比特列表
+    """
+    return [public_key.encrypt(value >> i & 1) for i in reversed(range(width))]
+
+
+def decrypt_bits(bits):
+    """
+    解密二进制 高位在前
+    :param bits: 加密比特列表
+    :return: 非负整数
+    """
+    return int(''.join(str(secret_key.decrypt(v)) for v in bits), 2)
+
+
+class CircuitTest(unittest.TestCase):
+    """
+    布尔电路测试类
+    """
+
+    def setUp(self):
+        """
+        测试前
+        """
+        self.a = random.SystemRandom().randrange(1 << bit)
+        self.b = random.SystemRandom().randrange(1 << bit)
+        return super().setUp()
+
+    def evaluate(self, circuit, a, b, c1=cloud1):
+        return circuit.evaluate(c1, cloud2, encrypt_bits(a, bit) + encrypt_bits(b, bit))
+
+    def test_gates(self):
+        """
+        基本门真值表
+        """
+        circuit = Circuit()
+        x, y = circuit.inputs(2)
+        one, zero = circuit.constant(1), circuit.constant(0)
+        circuit.output(circuit.bit_and(x, y), circuit.bit_or(x, y), circuit.bit_xor(x, y), circuit.bit_not(x),
+                       circuit.bit_and(x, one), circuit.bit_or(y, zero), circuit.bit_or(x, one), one)
+        for p in (0, 1):
+            for q in (0, 1):
+                result = circuit.evaluate(cloud1, cloud2, [public_key.encrypt(p), public_key.encrypt(q)])
+                self.assertEqual([secret_key.decrypt(v) for v in result], [p & q, p | q, p ^ q, 1 - p, p, q, 1, 1])
+
+    def test_constant(self):
+        """
+        常量门折叠 输出仍为密文
+        """
+        circuit = Circuit()
+        x = circuit.input()
+        one, zero = circuit.constant(1), circuit.constant(0)
+        gates = [circuit.bit_and(one, one), circuit.bit_or(zero, zero), circuit.bit_xor(one, one),
+                 circuit.bit_not(one), circuit.bit_not(zero), circuit.bit_not(circuit.bit_xor(one, zero))]
+        circuit.output(*gates, circuit.bit_and(x, circuit.bit_not(zero)))
+        self.assertEqual(circuit.rounds(), 0)
+        with mock.patch.object(cloud2, 'parity_batch', wraps=cloud2.parity_batch) as parity_batch:
+            result = circuit.evaluate(cloud1, cloud2, [public_key.encrypt(1)])
+        self.assertEqual(parity_batch.call_count, 0)
+        for v in result:
+            self.assertNotIsInstance(v, int)
+        self.assertEqual([secret_key.decrypt(v) for v in result], [1, 0, 0, 0, 1, 0, 1])
+
+    def test_netlist(self):
+        """
+        网表定义
+        """
+        circuit = Circuit([('input',), ('input',), ('xor', 0, 1), ('and', 0, 2)], outputs=[3])
+        result = circuit.evaluate(cloud1, cloud2, [public_key.encrypt(1), public_key.encrypt(0)])
+        self.assertEqual(secret_key.decrypt(result[0]), 1)
+
+        with self.assertRaises(ValueError):
+            Circuit([('input',), ('xor', 0, 2), ('input',)], outputs=[1]).evaluate(cloud1, cloud2, [])
+        with self.assertRaises(ValueError):
+            circuit.evaluate(cloud1, cloud2, [public_key.encrypt(1)])
+
+    def test_comparison(self):
+        """
+        比较电路
+        """
+        for a, b in ((self.a, self.b), (self.a, self.a), (0, (1 << bit) - 1)):
+            (result,) = self.evaluate(comparison_circuit(bit), a, b)
+            self.assertEqual(secret_key.decrypt(result), int(a > b))
+
+    def test_equality(self):
+        """
+        相等电路
+        """
+        for a, b in ((self.a, self.b), (self.a, self.a)):
+            (result,) = self.evaluate(equality_circuit(bit), a, b)
+            self.assertEqual(secret_key.decrypt(result), int(a == b))
+
+    def test_adder(self):
+        """
+        加法电路
+        """
+        for a, b in ((self.a, self.b), ((1 << bit) - 1, 1)):
+            self.assertEqual(decrypt_bits(self.evaluate(adder_circuit(bit), a, b)), a + b)
+
+    def test_rounds(self):
+        """
+        同一乘法深度的与门合并为一轮交互, 输出归一化一轮
+        """
+        circuit = comparison_circuit(bit)
+        self.assertEqual(circuit.rounds(), 5)
+        self.assertEqual(equality_circuit(bit).rounds(), 4)
+        with mock.patch.object(cloud2, 'mul_batch', wraps=cloud2.mul_batch) as mul_batch, \
+                mock.patch.object(cloud2, 'parity_batch', wraps=cloud2.parity_batch) as parity_batch:
+            self.evaluate(circuit, self.a, self.b)
+        self.assertEqual(mul_batch.call_count, 4)
+        self.assertEqual(parity_batch.call_count, 1)
+
+    def test_round_trips(self):
+        """
+        同一深度的安全乘法与归一化合并为一轮 实际交互轮数与rounds()一致
+        """
+        c1 = CloudPlatform(public_key=public_key, sigma=40, bit_length=4)
+        for circuit, platform, width in ((comparison_circuit(bit), cloud1, bit), (adder_circuit(16), cloud1, 16),
+                                         (adder_circuit(bit), c1, bit)):
+            a, b = random.SystemRandom().randrange(1 << width), random.SystemRandom().randrange(1 << width)
+            with ProtocolMetrics() as metrics:
+                circuit.evaluate(platform, cloud2, encrypt_bits(a, width) + encrypt_bits(b, width))
+            self.assertEqual(metrics.totals['rounds'], circuit.rounds(bit_length=platform.bit_length))
+
+    def test_normalize(self):
+        """
+        导线值超出位宽时归一化
+        """
+        c1 = CloudPlatform(public_key=public_key, sigma=40, bit_length=4)
+        circuit = adder_circuit(bit)
+        self.assertGreater(circuit.rounds(bit_length=4), circuit.rounds())
+        with mock.patch.object(cloud2, 'parity_batch', wraps=cloud2.parity_batch) as parity_batch:
+            self.assertEqual(decrypt_bits(self.evaluate(circuit, self.a, self.b, c1)), self.a + self.b)
+        self.assertGreater(parity_batch.call_count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/19 02:45
+@File: test_condition.py
+@License: MIT
+"""
+import random
+import sys
+import unittest
+from unittest import mock
+
+from smpcp.condition import secure_select, secure_where
+from smpcp.smpcp import CloudPlatform, CloudPlatformThird, SecureMultiPartyComputationProtocol
+from smpcp.vector import EncryptedVector
+from test_case.keypair import keypair
+
+sys.path.append("test_case/")  # 添加测试文件路径
+
+key_length = 2048  # TODO 密钥长度
+size = 8  # TODO 向量长度
+
+public_key, secret_key = keypair(key_length)  # 加载缓存的密钥对
+
+cloud1 = CloudPlatform(public_key=public_key)  # 云服务器1
+cloud2 = CloudPlatformThird(public_key=public_key, secret_key=secret_key)  # 云服务器2
+
+protocol = SecureMultiPartyComputationProtocol(c1=cloud1, c2=cloud2)  # 安全多方计算协议类
+vector = EncryptedVector(c1=cloud1, c2=cloud2)  # 加密向量类
+
+
+class ConditionTest(unittest.TestCase):
+    """
+    安全选择测试类
+    """
+
+    def setUp(self):
+        """
+        测试前
+        """
+        self.conds = [random.SystemRandom().randint(0, 1) for _ in range(size)]
+        self.conds[:2] = [0, 1]  # 覆盖两个分支
+        self.a = [random.SystemRandom().randint(-key_length, key_length) for _ in range(size)]
+        self.b = [random.SystemRandom().randint(-key_length, key_length) for _ in range(size)]
+        return super().setUp()
+
+    def test_select(self):
+        """
+        安全选择协议 一轮交互
+        """
+        for cond in (0, 1):
+            n = protocol.encode(public_key.encrypt(cond))
+            with mock.patch.object(cloud2, 'mul_batch', wraps=cloud2.mul_batch) as mul_batch:
+                result = secure_select(n, protocol.encode(public_key.encrypt(self.a[0])), public_key.encrypt(self.b[0]))
+            self.assertEqual(1, mul_batch.call_count)
+            self.assertEqual(self.a[0] if cond else self.b[0], secret_key.decrypt(result))
+            result = secure_select(n, self.a[0], self.b[0])
+            self.assertEqual(self.a[0] if cond else self.b[0], secret_key.decrypt(result))
+        self.assertEqual(self.b[0], secret_key.decrypt(cloud1.select(0, self.a[0], self.b[0], cloud2)))
+
+    def test_where(self):
+        """
+        批量安全选择协议 所有选择一轮交互
+        """
+        conds = vector.encode([public_key.encrypt(v) for v in self.conds])
+        with mock.patch.object(cloud2, 'mul_batch', wraps=cloud2.mul_batch) as mul_batch:
+            result = secure_where(conds, [public_key.encrypt(v) for v in self.a], vector.encode(
+                [public_key.encrypt(v) for v in self.b]))
+        self.assertEqual(1, mul_batch.call_count)
+        expected = [a if c else b for c, a, b in zip(self.conds, self.a, self.b)]
+        self.assertEqual(expected, [secret_key.decrypt(v) for v in result])
+        # 明文分支本地计算 标量广播
+        with mock.patch.object(cloud2, 'mul_batch', wraps=cloud2.mul_batch) as mul_batch:
+            result = secure_where(conds, self.a, 0)
+        mul_batch.assert_not_called()
+        self.assertEqual([a if c else 0 for c, a in zip(self.conds, self.a)], [secret_key.decrypt(v) for v in result])
+        with self.assertRaises(ValueError):
+            secure_where(conds, self.a[1:], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 21:38
+@File: test_fixed.py
+@License: MIT
+"""
+import random
+import sys
+import unittest
+from unittest import mock
+
+from smpcp.fixed import EncryptedFixed, mul_batch
+from smpcp.smpcp import CloudPlatform, CloudPlatformThird
+from test_case.keypair import keypair
+
+sys.path.append("test_case/")  # 添加测试文件路径
+
+key_length = 2048  # TODO 密钥长度
+precision = 16  # TODO 小数位数
+
+public_key, secret_key = keypair(key_length)  # 加载缓存的密钥对
+
+cloud1 = CloudPlatform(public_key=public_key, sigma=40, bit_length=64)  # 云服务器1
+cloud2 = CloudPlatformThird(public_key=public_key, secret_key=secret_key)  # 云服务器2
+
+fixed = EncryptedFixed(c1=cloud1, c2=cloud2, precision=precision)  # 加密定点数类
+
+ulp = 2 ** -precision  # 最小精度
+
+
+class EncryptedFixedTest(unittest.TestCase):
+    """
+    加密定点数测试类
+    """
+
+    def setUp(self):
+        """
+        测试前
+        """
+        self.float1 = random.SystemRandom().uniform(-1000, 1000)
+        self.float2 = random.SystemRandom().uniform(-1000, 1000)
+        self.n1 = fixed.encrypt(self.float1)
+        self.n2 = fixed.encrypt(self.float2)
+        return super().setUp()
+
+    def test_local(self):
+        """
+        本地加减 指数不变
+        """
+        result = self.n1 + self.n2 - 1.5 + 3
+        self.assertEqual(0, result.cipher.exponent)
+        self.assertAlmostEqual(self.float1 + self.float2 + 1.5, result.decrypt(secret_key), delta=2 * ulp)
+        self.assertAlmostEqual(-self.float1, (-self.n1).decrypt(secret_key), delta=ulp)
+        self.assertAlmostEqual(2.5 - self.float1, (2.5 - self.n1).decrypt(secret_key), delta=ulp)
+
+    def test_mul(self):
+        """
+        安全乘法协议 截断误差不超过1个最小精度
+        """
+        with mock.patch.object(cloud2, 'mul_batch', wraps=cloud2.mul_batch) as mul, \
+                mock.patch.object(cloud2, 'truncate_batch', wraps=cloud2.truncate_batch) as truncate:
+            result = self.n1 * self.n2
+        self.assertEqual((1, 1), (mul.call_count, truncate.call_count))
+        self.assertEqual(0, result.cipher.exponent)
+        # 编码误差 |x| * ulp / 2 + |y| * ulp / 2 加截断误差 ulp
+        delta = (abs(self.float1) + abs(self.float2) + 4) * ulp
+        self.assertAlmostEqual(self.float1 * self.float2, result.decrypt(secret_key), delta=delta)
+        self.assertAlmostEqual(self.float1 * 3, (self.n1 * 3).decrypt(secret_key), delta=3 * ulp)
+        self.assertAlmostEqual(self.float1 * 0.25, (self.n1 * 0.25).decrypt(secret_key), delta=2 * ulp)
+
+    def test_truncate(self):
+        """
+        安全截断协议
+        """
+        for value in (0, 1, -1, (1 << 100) + 12345, -(1 << 100) - 12345):
+            self.assertIn(value // 256 - secret_key.decrypt(cloud1.truncate(public_key.encrypt(value), 8, cloud2)),
+                          (0, -1))
+        legacy = CloudPlatform(public_key=public_key)
+        self.assertIn(-1000 // 16 - secret_key.decrypt(legacy.truncate(public_key.encrypt(-1000), 4, cloud2)),
+                      (0, -1))
+
+    def test_batch(self):
+        """
+        批量定点数安全乘法协议 两轮
+        """
+        x = [fixed.encrypt(random.SystemRandom().uniform(-10, 10)) for _ in range(6)]
+        y = [fixed.encrypt(random.SystemRandom().uniform(-10, 10)) for _ in range(4)] + [0.5, 2]
+        with mock.patch.object(cloud2, 'mul_batch', wraps=cloud2.mul_batch) as mul, \
+                mock.patch.object(cloud2, 'truncate_batch', wraps=cloud2.truncate_batch) as truncate:
+            result = mul_batch(x, y)
+        self.assertEqual((1, 1), (mul.call_count, truncate.call_count))
+        for a, b, v in zip(x, y, result):
+            b = b.decrypt(secret_key) if isinstance(b, EncryptedFixed) else b
+            self.assertAlmostEqual(a.decrypt(secret_key) * b, v.decrypt(secret_key), delta=24 * ulp)
+        self.assertEqual([], mul_batch([], []))
+
+    def test_compare(self):
+        """
+        安全比较协议
+        """
+        self.assertEqual(int(self.float1 > self.float2), secret_key.decrypt(self.n1 > self.n2))
+        self.assertEqual(int(self.float1 <= self.float2), secret_key.decrypt(self.n1 <= self.n2))
+        self.assertEqual(1, secret_key.decrypt(self.n1 == self.n1 + 0))
+        self.assertEqual(int(self.float1 < 0.5), secret_key.decrypt(self.n1 < 0.5))
+        self.assertAlmostEqual(max(self.float1, self.float2), self.n1.optimum(self.n2, 'max').decrypt(secret_key),
+                               delta=ulp)
+        with self.assertRaises(ValueError):
+            _ = self.n1 + EncryptedFixed(c1=cloud1, c2=cloud2, cipher=self.n2.cipher, precision=8)
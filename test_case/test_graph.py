@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 16:48
+@File: test_graph.py
+@License: MIT
+"""
+import random
+import sys
+import unittest
+from unittest import mock
+
+from smpcp.graph import ProtocolGraph
+from smpcp.metrics import ProtocolMetrics
+from smpcp.smpcp import CloudPlatform, CloudPlatformThird
+from test_case.keypair import keypair
+
+sys.path.append("test_case/")  # 添加测试文件路径
+
+key_length = 2048  # TODO 密钥长度
+
+public_key, secret_key = keypair(key_length)  # 加载缓存的密钥对
+
+cloud1 = CloudPlatform(public_key=public_key)  # 云服务器1
+cloud2 = CloudPlatformThird(public_key=public_key, secret_key=secret_key)  # 云服务器2
+
+
+class ProtocolGraphTest(unittest.TestCase):
+    """
+    惰性协议计算图测试类
+    """
+
+    def setUp(self):
+        """
+        测试前
+        """
+        self.graph = ProtocolGraph(c1=cloud1, c2=cloud2)
+        self.ints = [random.SystemRandom().randint(1, key_length) for _ in range(4)]
+        self.a, self.b, self.c, self.d = [self.graph.encode(public_key.encrypt(v)) for v in self.ints]
+        return super().setUp()
+
+    def evaluate(self, *nodes):
+        """
+        计算并统计交互轮数
+        """
+        with ProtocolMetrics() as metrics:
+            result = self.graph.evaluate(*nodes)
+
+        return [secret_key.decrypt(v) for v in result], metrics.totals['rounds']
+
+    def test_independent(self):
+        """
+        独立子表达式合并为一轮
+        """
+        a, b, c, d = self.ints
+        result, rounds = self.evaluate(self.a * self.b + self.c * self.d)
+        self.assertEqual([a * b + c * d], result)
+        self.assertEqual(1, rounds)
+
+    def test_dedup(self):
+        """
+        相同子表达式只计算一次
+        """
+        a, b, _, _ = self.ints
+        self.assertIs(self.a * self.b, self.b * self.a)
+        with mock.patch.object(cloud2, 'mul_batch', wraps=cloud2.mul_batch) as mul_batch:
+            result = self.graph.evaluate((self.a * self.b) * 3 + self.b * self.a)
+        self.assertEqual(a * b * 4, secret_key.decrypt(result[0]))
+        self.assertEqual(1, len(mul_batch.call_args[0][0]))
+
+    def test_levels(self):
+        """
+        按交互轮次分层
+        """
+        a, b, c, d = self.ints
+        formula = (self.a * self.b).optimum(self.c * self.d, 'max')
+        compare = (self.a > self.b) | (self.c <= self.d)
+        result, rounds = self.evaluate(formula, compare, self.a != self.c, self.a == 5)
+        self.assertEqual([max(a * b, c * d), int(a > b or c <= d), int(a != c), int(a == 5)], result)
+        # 第1轮: mul, lt, eq(密文)的乘法, eq(明文) 第2轮: optimum, mul, eq(密文)的符号判断
+        self.assertEqual(2, rounds)
+
+    def test_cache(self):
+        """
+        已计算节点不再交互
+        """
+        node = self.a * self.b + 1
+        self.assertEqual(self.ints[0] * self.ints[1] + 1, secret_key.decrypt(node.evaluate()))
+        result, rounds = self.evaluate(node - self.c, -node)
+        self.assertEqual([self.ints[0] * self.ints[1] + 1 - self.ints[2], -self.ints[0] * self.ints[1] - 1], result)
+        self.assertEqual(0, rounds)
+
+    def test_bit_dec(self):
+        """
+        安全二进制分解协议 与其他协议合并
+        """
+        bit = max(self.ints).bit_length()
+        bits = self.a.bit_dec(bit)
+        result, rounds = self.evaluate(*bits, self.a.parity(), self.a / self.b, self.a / 2)
+        self.assertEqual(2 + (bit - 1).bit_length(), rounds)
+        self.assertEqual(bin(self.ints[0])[2:].zfill(bit), ''.join(str(v) for v in result[:bit]))
+        self.assertEqual(self.ints[0] % 2, result[bit])
+        self.assertAlmostEqual(self.ints[0] / self.ints[1], result[bit + 1])
+        self.assertAlmostEqual(self.ints[0] / 2, result[bit + 2])
+
+    def test_batch(self):
+        """
+        每一轮只调用一次第三方云服务器
+        """
+        a, b, c, _ = self.ints
+        with mock.patch.object(cloud2, 'batch', wraps=cloud2.batch) as batch:
+            result = self.graph.evaluate((self.a * self.b).optimum(self.c, 'min'), self.a > self.c)
+        self.assertEqual([min(a * b, c), int(a > c)], [secret_key.decrypt(v) for v in result])
+        self.assertEqual(2, batch.call_count)
+        self.assertEqual(['eq_batch', 'mul_batch'], sorted(method for method, _ in batch.call_args_list[0][0][0]))
+
+    def test_error(self):
+        """
+        协议出错时计算失败
+        """
+        with mock.patch.object(cloud2, 'optimum_batch', side_effect=ValueError("optimum")):
+            with self.assertRaises(ValueError):
+                self.graph.evaluate((self.a * self.b).optimum(self.c, 'min'), self.a * self.c + self.a > self.d)
+
+    def test_foreign(self):
+        """
+        不同计算图的节点
+        """
+        other = ProtocolGraph(c1=cloud1, c2=cloud2).encode(public_key.encrypt(1))
+        with self.assertRaises(ValueError):
+            _ = self.a * other
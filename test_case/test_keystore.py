@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 19:05
+@File: test_keystore.py
+@License: MIT
+"""
+import json
+import os
+import stat
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import phe
+
+from smpcp import keystore
+from test_case.keypair import keypair
+
+sys.path.append("test_case/")  # 添加测试文件路径
+
+key_length = 2048  # TODO 密钥长度
+
+public_key, secret_key = keypair(key_length)  # 加载缓存的密钥对
+
+
+class KeystoreTest(unittest.TestCase):
+    """
+    密钥存储测试类
+    """
+
+    def setUp(self):
+        """
+        测试前
+        """
+        self.path = os.path.join(tempfile.mkdtemp(), 'keypair.json')
+        return super().setUp()
+
+    def test_roundtrip(self):
+        """
+        保存与加载 CRT参数直接恢复
+        """
+        keystore.save(self.path, public_key, secret_key)
+        self.assertEqual(0o600, stat.S_IMODE(os.stat(self.path).st_mode))
+        with mock.patch.object(phe.PaillierPrivateKey, 'h_function') as h_function:
+            public, secret = keystore.load(self.path)
+        h_function.assert_not_called()
+        self.assertEqual(public_key, public)
+        self.assertEqual((secret_key.hp, secret_key.hq, secret_key.p_inverse), (secret.hp, secret.hq, secret.p_inverse))
+        self.assertEqual(-12345, secret.decrypt(public_key.encrypt(-12345)))
+        self.assertEqual(42, secret_key.decrypt(public.encrypt(42)))
+
+    def test_public(self):
+        """
+        只保存公钥
+        """
+        keystore.save(self.path, public_key)
+        with open(self.path, encoding='utf-8') as f:
+            self.assertNotIn('p', json.load(f))
+        self.assertEqual((public_key, None), keystore.load(self.path))
+
+    def test_invalid(self):
+        """
+        版本不符与密钥不匹配
+        """
+        data = keystore.dump_keypair(public_key, secret_key)
+        with self.assertRaises(ValueError):
+            keystore.load_keypair(dict(data, version=0))
+        with self.assertRaises(ValueError):
+            keystore.load_keypair(dict(data, q=format(secret_key.q + 2, 'x')))
+
+    def test_cached(self):
+        """
+        缓存密钥对只生成一次
+        """
+        with mock.patch.object(phe, 'generate_paillier_keypair', wraps=phe.generate_paillier_keypair) as generate:
+            first = keystore.cached_keypair(self.path, n_length=512)
+            second = keystore.cached_keypair(self.path, n_length=512)
+            keystore.cached_keypair(self.path, n_length=768)
+        self.assertEqual(2, generate.call_count)
+        self.assertEqual(first[0], second[0])
+        self.assertEqual(768, keystore.load(self.path)[0].n.bit_length())
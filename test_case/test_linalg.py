@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/19 00:55
+@File: test_linalg.py
+@License: MIT
+"""
+import random
+import sys
+import unittest
+from unittest import mock
+
+from smpcp.linalg import secure_dot, secure_matmul
+from smpcp.smpcp import CloudPlatform, CloudPlatformThird
+from smpcp.vector import EncryptedVector
+from test_case.keypair import keypair
+
+sys.path.append("test_case/")  # 添加测试文件路径
+
+key_length = 2048  # TODO 密钥长度
+
+public_key, secret_key = keypair(key_length)  # 加载缓存的密钥对
+
+cloud1 = CloudPlatform(public_key=public_key)  # 云服务器1
+cloud2 = CloudPlatformThird(public_key=public_key, secret_key=secret_key)  # 云服务器2
+
+vector = EncryptedVector(c1=cloud1, c2=cloud2)  # 加密向量类
+
+
+def random_matrix(rows, cols):
+    """
+    随机整数矩阵
+    """
+    return [[random.SystemRandom().randint(-key_length, key_length) for _ in range(cols)] for _ in range(rows)]
+
+
+def encrypt_matrix(matrix):
+    """
+    加密矩阵 每行一个加密向量
+    """
+    return [vector.encode([public_key.encrypt(v) for v in row]) for row in matrix]
+
+
+def decrypt_matrix(matrix):
+    """
+    解密矩阵
+    """
+    return [[secret_key.decrypt(v) for v in row] for row in matrix]
+
+
+class LinalgTest(unittest.TestCase):
+    """
+    安全线性代数测试类
+    """
+
+    def test_dot(self):
+        """
+        安全内积协议 一轮交互
+        """
+        u, v = random_matrix(2, 6)
+        with mock.patch.object(cloud2, 'matmul', wraps=cloud2.matmul) as matmul:
+            result = secure_dot(encrypt_matrix([u])[0], [public_key.encrypt(x) for x in v])
+        self.assertEqual(1, matmul.call_count)
+        self.assertEqual(sum(a * b for a, b in zip(u, v)), secret_key.decrypt(result))
+        self.assertEqual(sum(a * b for a, b in zip(u, v)), secret_key.decrypt(secure_dot(encrypt_matrix([u])[0], v)))
+        with self.assertRaises(ValueError):
+            secure_dot(encrypt_matrix([u])[0], v[:-1])
+
+    def test_matmul(self):
+        """
+        安全矩阵乘法协议 一轮交互, 每个元素只解密一次
+        """
+        a, b = random_matrix(3, 4), random_matrix(4, 5)
+        expected = [[sum(x * y for x, y in zip(row, col)) for col in zip(*b)] for row in a]
+        ea, eb = encrypt_matrix(a), encrypt_matrix(b)
+        with mock.patch.object(cloud2, 'matmul', wraps=cloud2.matmul) as matmul, \
+                mock.patch.object(cloud2.secret_key, 'decrypt', wraps=cloud2.secret_key.decrypt) as decrypt:
+            result = secure_matmul(ea, eb)
+        self.assertEqual(1, matmul.call_count)
+        self.assertEqual(3 * 4 + 4 * 5, decrypt.call_count)
+        self.assertEqual(expected, decrypt_matrix(result))
+        self.assertEqual(expected, decrypt_matrix(secure_matmul(ea, b)))
+        with self.assertRaises(ValueError):
+            secure_matmul(ea, ea)
+
+    def test_mixed(self):
+        """
+        混合明文与浮点数
+        """
+        a = [[1.5, -2.0], [0.25, 3.0]]
+        b = [[public_key.encrypt(2), 1], [public_key.encrypt(-1.5), public_key.encrypt(4)]]
+        expected = [[1.5 * 2 + 2.0 * 1.5, 1.5 - 8.0], [0.5 - 4.5, 0.25 + 12.0]]
+        for row, values in zip(decrypt_matrix(secure_matmul(encrypt_matrix(a), b)), expected):
+            for x, y in zip(row, values):
+                self.assertAlmostEqual(y, x)
+
+    def test_sigma(self):
+        """
+        sigma模式下的矩阵乘法
+        """
+        c1 = CloudPlatform(public_key=public_key, sigma=40, bit_length=32)
+        a, b = random_matrix(2, 3), random_matrix(3, 2)
+        expected = [[sum(x * y for x, y in zip(row, col)) for col in zip(*b)] for row in a]
+        result = c1.matmul([[public_key.encrypt(v) for v in row] for row in a],
+                           [[public_key.encrypt(v) for v in row] for row in b], cloud2)
+        self.assertEqual(expected, decrypt_matrix(result))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 13:20
+@File: test_mask.py
+@License: MIT
+"""
+import sys
+import unittest
+
+from smpcp.mask import MaskGenerator
+
+sys.path.append("test_case/")  # 添加测试文件路径
+
+
+class MaskGeneratorTest(unittest.TestCase):
+    """
+    随机掩码生成器测试类
+    """
+
+    def setUp(self):
+        """
+        测试前
+        """
+        self.generator = MaskGenerator(block_size=64)  # 小缓冲区, 覆盖补充逻辑
+        return super().setUp()
+
+    def test_getrandbits(self):
+        """
+        指定位宽随机数
+        """
+        for bits in (1, 7, 8, 40, 104, 2048):
+            result = self.generator.getrandbits_batch(bits, 64)
+            self.assertEqual(64, len(result))
+            self.assertTrue(all(0 <= v < 1 << bits for v in result))
+        self.assertEqual([0, 0], self.generator.getrandbits_batch(0, 2))
+
+    def test_randbelow(self):
+        """
+        有界随机数
+        """
+        for bound in (1, 2, 617, (1 << 64) + 1):
+            result = self.generator.randbelow_batch(bound, 256)
+            self.assertEqual(256, len(result))
+            self.assertTrue(all(0 <= v < bound for v in result))
+        self.assertEqual({0, 1, 2}, set(self.generator.randbelow_batch(3, 256)))
+        with self.assertRaises(ValueError):
+            self.generator.randbelow(0)
+
+    def test_unique(self):
+        """
+        随机数不重复
+        """
+        result = self.generator.getrandbits_batch(128, 1000)
+        self.assertEqual(len(result), len(set(result)))
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 17:32
+@File: test_metrics.py
+@License: MIT
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+from smpcp.metrics import ProtocolMetrics
+from smpcp.pool import ObfuscatorPool
+from smpcp.smpcp import CloudPlatform, CloudPlatformThird, SecureMultiPartyComputationProtocol
+from test_case.keypair import keypair
+
+sys.path.append("test_case/")  # 添加测试文件路径
+
+key_length = 2048  # TODO 密钥长度
+
+public_key, secret_key = keypair(key_length)  # 加载缓存的密钥对
+
+cloud1 = CloudPlatform(public_key=public_key)  # 云服务器1
+cloud2 = CloudPlatformThird(public_key=public_key, secret_key=secret_key)  # 云服务器2
+
+protocol = SecureMultiPartyComputationProtocol(c1=cloud1, c2=cloud2)  # 安全多方计算协议类
+
+
+class ProtocolMetricsTest(unittest.TestCase):
+    """
+    协议开销统计测试类
+    """
+
+    def setUp(self):
+        """
+        测试前
+        """
+        self.n1 = protocol.encode(public_key.encrypt(7))
+        self.n2 = public_key.encrypt(3)
+        return super().setUp()
+
+    def test_calls(self):
+        """
+        顶层调用统计
+        """
+        with ProtocolMetrics() as metrics:
+            self.assertEqual(1, secret_key.decrypt(self.n1 >= self.n2))
+            self.assertEqual(0, secret_key.decrypt(self.n1 == self.n2))
+        ge, eq = metrics.calls
+        self.assertEqual(('ge', 1, 2), (ge['protocol'], ge['rounds'], ge['c1']['masks']))
+        self.assertEqual((1, 1), (ge['c2']['decrypt'], ge['c2']['encrypt']))
+        self.assertEqual(0, ge['c1']['decrypt'])
+        self.assertEqual(('eq', 2), (eq['protocol'], eq['rounds']))
+        self.assertGreater(ge['c1']['scalar_mul'], 0)
+        self.assertGreater(ge['c1']['bytes'], public_key.n.bit_length() // 4)
+        self.assertEqual(3, metrics.totals['rounds'])
+        self.assertEqual(ge['c2']['bytes'] + eq['c2']['bytes'], metrics.totals['c2']['bytes'])
+
+    def test_restore(self):
+        """
+        退出后恢复原方法
+        """
+        original = vars(CloudPlatform)['bit_not']
+        with ProtocolMetrics() as metrics:
+            with self.assertRaises(RuntimeError):
+                ProtocolMetrics().__enter__()
+            self.assertEqual(0, secret_key.decrypt(cloud1.bit_not(public_key.encrypt(1))))
+        self.assertIs(original, vars(CloudPlatform)['bit_not'])
+        self.n1 * self.n2
+        self.assertEqual(1, len(metrics.calls))
+
+    def test_json(self):
+        """
+        导出JSON
+        """
+        with ProtocolMetrics() as metrics:
+            cloud1.mul_batch([public_key.encrypt(2)] * 3, [self.n2] * 3, cloud2)
+        path = os.path.join(tempfile.mkdtemp(), 'metrics.json')
+        self.assertEqual(json.loads(metrics.to_json(path)), metrics.to_dict())
+        with open(path, encoding='utf-8') as f:
+            self.assertEqual('mul_batch', json.load(f)['calls'][0]['protocol'])
+        self.assertEqual(6, metrics.totals['c1']['masks'])
+
+    def test_keyword(self):
+        """
+        关键字参数调用
+        """
+        h1, h2 = public_key.encrypt(6), public_key.encrypt(4)
+        with ProtocolMetrics() as metrics:
+            self.assertEqual(24, secret_key.decrypt(cloud2.mul(h1=h1, h2=h2)))
+            self.assertEqual([0], [secret_key.decrypt(v) for v in cloud2.parity_batch(h=[h1])])
+        self.assertEqual(2, metrics.totals['rounds'])
+        self.assertEqual(3, metrics.totals['c2']['decrypt'])
+
+    def test_pool(self):
+        """
+        混淆因子池加密与混淆因子生成
+        """
+        pool = ObfuscatorPool(public_key, high_watermark=4, low_watermark=1, start=False)
+        pool.fill(2)
+        c2 = CloudPlatformThird(public_key=public_key, secret_key=secret_key, pool=pool)
+        with ProtocolMetrics() as metrics:
+            products = cloud1.mul_batch([self.n2] * 3, [public_key.encrypt(2)] * 3, c2)
+            self.assertEqual(1, secret_key.decrypt(c2.parity(public_key.encrypt(5))))
+            pool.fill(2)
+        self.assertEqual([6] * 3, [secret_key.decrypt(v) for v in products])
+        self.assertEqual(4, metrics.totals['c2']['encrypt'])
+        self.assertEqual(4, metrics.totals['c2']['obfuscators'])
+        self.assertEqual((3, 1), (metrics.calls[0]['c2']['encrypt'], metrics.calls[0]['c2']['obfuscators']))
+
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 15:36
+@File: test_ordering.py
+@License: MIT
+"""
+import itertools
+import random
+import sys
+import unittest
+from unittest import mock
+
+from smpcp.ordering import secure_argmax, secure_argmin, secure_max, secure_min, secure_sort, sorting_network
+from smpcp.smpcp import CloudPlatform, CloudPlatformThird
+from smpcp.vector import EncryptedVector
+from test_case.keypair import keypair
+
+sys.path.append("test_case/")  # 添加测试文件路径
+
+key_length = 2048  # TODO 密钥长度
+
+public_key, secret_key = keypair(key_length)  # 加载缓存的密钥对
+
+cloud1 = CloudPlatform(public_key=public_key)  # 云服务器1
+cloud2 = CloudPlatformThird(public_key=public_key, secret_key=secret_key)  # 云服务器2
+
+vector = EncryptedVector(c1=cloud1, c2=cloud2)  # 加密向量类
+
+
+class OrderingTest(unittest.TestCase):
+    """
+    安全排序测试类
+    """
+
+    def test_network(self):
+        """
+        排序网络正确性 0-1原则
+        """
+        for n in range(1, 11):
+            for bits in itertools.product((0, 1), repeat=n):
+                values = list(bits)
+                for layer in sorting_network(n):
+                    for i, j in layer:
+                        values[i], values[j] = min(values[i], values[j]), max(values[i], values[j])
+                self.assertEqual(sorted(bits), values)
+        self.assertEqual(6, len(sorting_network(8)))
+        self.assertEqual([], sorting_network(1))
+
+    def test_sort(self):
+        """
+        安全排序协议
+        """
+        values = [random.SystemRandom().randint(0, key_length) for _ in range(7)]
+        values[3] = values[5]  # 保证存在重复元素
+        ciphers = vector.encode([public_key.encrypt(v) for v in values])
+        with mock.patch.object(cloud2, 'optimum_batch', wraps=cloud2.optimum_batch) as optimum_batch:
+            result = secure_sort(ciphers)
+        self.assertEqual(sorted(values), [secret_key.decrypt(v) for v in result])
+        self.assertEqual(len(sorting_network(7)), optimum_batch.call_count)
+        self.assertEqual(sorted(values, reverse=True),
+                         [secret_key.decrypt(v) for v in secure_sort(ciphers, descending=True)])
+
+    def test_empty(self):
+        """
+        空向量与单元素向量
+        """
+        self.assertEqual([], secure_sort(vector.encode([])))
+        self.assertEqual([5], [secret_key.decrypt(v) for v in secure_sort(vector.encode([public_key.encrypt(5)]))])
+
+    def test_optimum(self):
+        """
+        安全最大值/最小值协议 树形归约
+        """
+        values = [random.SystemRandom().randint(0, key_length) for _ in range(7)]
+        ciphers = vector.encode([public_key.encrypt(v) for v in values])
+        with mock.patch.object(cloud2, 'optimum_batch', wraps=cloud2.optimum_batch) as optimum_batch:
+            self.assertEqual(max(values), secret_key.decrypt(secure_max(ciphers)))
+        self.assertEqual(3, optimum_batch.call_count)
+        self.assertEqual(min(values), secret_key.decrypt(secure_min(ciphers)))
+        self.assertEqual(5, secret_key.decrypt(secure_max(vector.encode([public_key.encrypt(5)]))))
+        with self.assertRaises(ValueError):
+            secure_max(vector.encode([]))
+
+    def test_arg_optimum(self):
+        """
+        安全最大值/最小值下标协议
+        """
+        values = random.SystemRandom().sample(range(key_length), 6)
+        ciphers = vector.encode([public_key.encrypt(v) for v in values])
+        with mock.patch.object(cloud2, 'optimum_batch', wraps=cloud2.optimum_batch) as optimum_batch:
+            self.assertEqual(values.index(max(values)), secret_key.decrypt(secure_argmax(ciphers)))
+        self.assertEqual(3, optimum_batch.call_count)
+        self.assertEqual(values.index(min(values)), secret_key.decrypt(secure_argmin(ciphers)))
+        one_hot = [int(i == values.index(max(values))) for i in range(len(values))]
+        self.assertEqual(one_hot, [secret_key.decrypt(v) for v in secure_argmax(ciphers, one_hot=True)])
+        self.assertEqual(0, secret_key.decrypt(secure_argmin(vector.encode([public_key.encrypt(5)]))))
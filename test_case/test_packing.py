@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 22:40
+@File: test_packing.py
+@License: MIT
+"""
+import random
+import sys
+import unittest
+from unittest import mock
+
+from smpcp.packing import decrypt_packed, pack, slot_count, slot_width, unpack
+from smpcp.smpcp import CloudPlatform, CloudPlatformThird
+from test_case.keypair import keypair
+
+sys.path.append("test_case/")  # 添加测试文件路径
+
+key_length = 2048  # TODO 密钥长度
+bit_length = 32  # TODO 操作数位宽
+size = 30  # TODO 批量大小
+
+public_key, secret_key = keypair(key_length)  # 加载缓存的密钥对
+
+cloud1 = CloudPlatform(public_key=public_key, sigma=40, bit_length=bit_length)  # 云服务器1
+cloud2 = CloudPlatformThird(public_key=public_key, secret_key=secret_key)  # 云服务器2
+
+
+class PackingTest(unittest.TestCase):
+    """
+    槽位打包测试类
+    """
+
+    def setUp(self):
+        """
+        测试前
+        """
+        bound = 1 << (bit_length - 2)
+        self.int1 = [random.SystemRandom().randint(-bound, bound) for _ in range(size)]
+        self.int2 = [random.SystemRandom().randint(-bound, bound) for _ in range(size)]
+        self.int2[:3] = self.int1[:3]  # 覆盖相等的情况
+        self.c1 = [public_key.encrypt(v) for v in self.int1]
+        self.c2 = [public_key.encrypt(v) for v in self.int2]
+        return super().setUp()
+
+    def test_pack(self):
+        """
+        明文打包与有符号解包
+        """
+        width = slot_width(bit_length, 40)
+        values = [0, -1, 1, -(1 << (width - 2)), (1 << (width - 2)) - 1]
+        self.assertEqual(values, unpack(pack(values, width), width, len(values)))
+        self.assertEqual((2048 - 3) // width, slot_count(public_key, width))
+        with self.assertRaises(ValueError):
+            slot_count(public_key, 4096)
+
+    def test_mul_packed(self):
+        """
+        打包安全乘法协议 第三方云服务器解密次数按槽位数减少
+        """
+        count = slot_count(public_key, slot_width(bit_length, 40, product=True))
+        packs = -(-size // count)
+        with mock.patch.object(cloud2.secret_key, 'decrypt', wraps=cloud2.secret_key.decrypt) as decrypt:
+            result = cloud1.mul_packed(self.c1, self.c2, cloud2)
+        self.assertEqual(2 * packs, decrypt.call_count)
+        self.assertEqual(packs, len(result))
+        self.assertEqual([a * b for a, b in zip(self.int1, self.int2)], decrypt_packed(secret_key, result))
+        self.assertEqual([a * 7 for a in self.int1], decrypt_packed(secret_key, cloud1.mul_packed(self.c1, [7] * size,
+                                                                                                   cloud2)))
+
+    def test_parity_packed(self):
+        """
+        打包安全奇偶性判断协议
+        """
+        with mock.patch.object(cloud2.secret_key, 'decrypt', wraps=cloud2.secret_key.decrypt) as decrypt:
+            result = cloud1.parity_packed(self.c1, cloud2)
+        self.assertEqual(-(-size // slot_count(public_key, slot_width(bit_length, 40))), decrypt.call_count)
+        self.assertEqual([v % 2 for v in self.int1], [secret_key.decrypt(v) for v in result])
+
+    def test_compare_packed(self):
+        """
+        打包安全比较协议
+        """
+        for method, expected in (
+                (cloud1.gt_packed, [a > b for a, b in zip(self.int1, self.int2)]),
+                (cloud1.ge_packed, [a >= b for a, b in zip(self.int1, self.int2)]),
+                (cloud1.lt_packed, [a < b for a, b in zip(self.int1, self.int2)]),
+                (cloud1.le_packed, [a <= b for a, b in zip(self.int1, self.int2)]),
+        ):
+            self.assertEqual([int(v) for v in expected],
+                             [secret_key.decrypt(v) for v in method(self.c1, self.c2, cloud2)])
+
+    def test_legacy(self):
+        """
+        未指定sigma时不支持打包
+        """
+        with self.assertRaises(ValueError):
+            CloudPlatform(public_key=public_key).mul_packed(self.c1, self.c2, cloud2)
+
+
+if __name__ == '__main__':
+    unittest.main()
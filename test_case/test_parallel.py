@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 23:20
+@File: test_parallel.py
+@License: MIT
+"""
+import random
+import sys
+import unittest
+from unittest import mock
+
+from smpcp.metrics import ProtocolMetrics
+from smpcp.packing import decrypt_packed
+from smpcp.parallel import ParallelCloudPlatformThird
+from smpcp.pool import ObfuscatorPool
+from smpcp.smpcp import CloudPlatform
+from smpcp.vector import EncryptedVector
+from test_case.keypair import keypair
+
+sys.path.append("test_case/")  # 添加测试文件路径
+
+key_length = 2048  # TODO 密钥长度
+size = 12  # TODO 批量大小
+
+public_key, secret_key = keypair(key_length)  # 加载缓存的密钥对
+
+cloud1 = CloudPlatform(public_key=public_key, sigma=40, bit_length=32)  # 云服务器1
+
+
+class ParallelCloudPlatformThirdTest(unittest.TestCase):
+    """
+    多进程第三方云服务器测试类
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        测试类前 启动进程池
+        """
+        cls.cloud2 = ParallelCloudPlatformThird(public_key, secret_key, workers=2, chunk_size=4)
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        测试类后 关闭进程池
+        """
+        cls.cloud2.close()
+
+    def setUp(self):
+        """
+        测试前
+        """
+        self.int1 = [random.SystemRandom().randint(-(1 << 30), 1 << 30) for _ in range(size)]
+        self.int2 = [random.SystemRandom().randint(1, 1 << 30) for _ in range(size)]
+        self.c1 = [public_key.encrypt(v) for v in self.int1]
+        self.c2 = [public_key.encrypt(v) for v in self.int2]
+        return super().setUp()
+
+    def test_chunk(self):
+        """
+        批量协议按块分发
+        """
+        with mock.patch.object(self.cloud2._executor, 'submit', wraps=self.cloud2._executor.submit) as submit:
+            result = cloud1.mul_batch(self.c1, self.c2, self.cloud2)
+        self.assertEqual(3, submit.call_count)
+        self.assertEqual([a * b for a, b in zip(self.int1, self.int2)], [secret_key.decrypt(v) for v in result])
+
+    def test_batch(self):
+        """
+        批量协议结果与串行一致
+        """
+        vector = EncryptedVector(c1=cloud1, c2=self.cloud2, ciphers=self.c1)
+        self.assertEqual([max(a, b) for a, b in zip(self.int1, self.int2)],
+                         [secret_key.decrypt(v) for v in vector.optimum(self.c2, 'max')])
+        self.assertEqual([a % 2 for a in self.int1], [secret_key.decrypt(v) for v in vector.parity()])
+        self.assertEqual([int(a < b) for a, b in zip(self.int1, self.int2)],
+                         [secret_key.decrypt(v) for v in cloud1.lt_batch(self.c1, self.c2, self.cloud2)])
+        for a, v in zip(self.int2, cloud1.truncate_batch(self.c2, 4, self.cloud2)):
+            self.assertIn((a >> 4) - secret_key.decrypt(v), (0, -1))
+        self.assertEqual([[a >> i & 1 for i in range(8)] for a in self.int2],
+                         [[secret_key.decrypt(v) for v in bits] for bits in self.cloud2.bit_dec_batch(
+                             [public_key.encrypt(a) for a in self.int2], 8)])
+
+    def test_matmul(self):
+        """
+        安全矩阵乘法协议按行分块
+        """
+        with mock.patch.object(self.cloud2._executor, 'submit', wraps=self.cloud2._executor.submit) as submit:
+            result = cloud1.matmul([[v] for v in self.c1], [self.c2[:2]], self.cloud2)
+        self.assertEqual(3, submit.call_count)
+        self.assertEqual([[a * b for b in self.int2[:2]] for a in self.int1],
+                         [[secret_key.decrypt(v) for v in row] for row in result])
+
+    def test_packed(self):
+        """
+        打包协议结果与串行一致
+        """
+        self.assertEqual([a * b for a, b in zip(self.int1, self.int2)],
+                         decrypt_packed(secret_key, cloud1.mul_packed(self.c1, self.c2, self.cloud2)))
+        self.assertEqual([int(a > b) for a, b in zip(self.int1, self.int2)],
+                         [secret_key.decrypt(v) for v in cloud1.gt_packed(self.c1, self.c2, self.cloud2)])
+
+    def test_small(self):
+        """
+        小批量在当前进程执行
+        """
+        with mock.patch.object(self.cloud2._executor, 'submit') as submit:
+            result = cloud1.mul_batch(self.c1[:4], self.c2[:4], self.cloud2)
+        submit.assert_not_called()
+        self.assertEqual([a * b for a, b in zip(self.int1, self.int2)][:4], [secret_key.decrypt(v) for v in result])
+
+    def test_metrics(self):
+        """
+        开销统计包含工作进程的解密与加密
+        """
+        with ProtocolMetrics() as metrics:
+            result = cloud1.mul_batch(self.c1, self.c2, self.cloud2)
+        self.assertEqual(1, metrics.totals['rounds'])
+        self.assertEqual((2 * size, size), (metrics.totals['c2']['decrypt'], metrics.totals['c2']['encrypt']))
+        self.assertEqual([a * b for a, b in zip(self.int1, self.int2)], [secret_key.decrypt(v) for v in result])
+
+    def test_metrics_spawn(self):
+        """
+        开销统计期间启动的工作进程
+        """
+        with ProtocolMetrics() as metrics:
+            with ParallelCloudPlatformThird(public_key, secret_key, workers=2, chunk_size=4) as cloud2:
+                result = cloud1.parity_batch(self.c1, cloud2)
+                self.assertEqual([a % 2 for a in self.int1], [secret_key.decrypt(v) for v in result])
+        self.assertEqual((1, size), (metrics.totals['rounds'], metrics.totals['c2']['decrypt']))
+
+    def test_pool(self):
+        """
+        混淆因子池
+        """
+        pool = ObfuscatorPool(public_key, high_watermark=16, low_watermark=4, start=False)
+        with ParallelCloudPlatformThird(public_key, secret_key, workers=2, chunk_size=4, pool=pool) as cloud2:
+            self.assertIs(pool, cloud2.pool)
+            result = cloud1.mul_batch(self.c1, self.c2, cloud2)
+        self.assertEqual([a * b for a, b in zip(self.int1, self.int2)], [secret_key.decrypt(v) for v in result])
+        pool.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
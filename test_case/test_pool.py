@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 11:52
+@File: test_pool.py
+@License: MIT
+"""
+import random
+import sys
+import time
+import unittest
+
+from smpcp.pool import ObfuscatorPool
+from smpcp.smpcp import CloudPlatform, CloudPlatformThird, SecureMultiPartyComputationProtocol
+from test_case.keypair import keypair
+
+sys.path.append("test_case/")  # 添加测试文件路径
+
+key_length = 2048  # TODO 密钥长度
+
+public_key, secret_key = keypair(key_length)  # 加载缓存的密钥对
+
+
+class ObfuscatorPoolTest(unittest.TestCase):
+    """
+    混淆因子池测试类
+    """
+
+    def test_encrypt(self):
+        """
+        预计算加密
+        """
+        pool = ObfuscatorPool(public_key, high_watermark=8, low_watermark=2, start=False)
+        pool.fill()
+        self.assertEqual(8, len(pool))
+        self.assertEqual(0, secret_key.decrypt(pool.zero()))
+        self.assertEqual(1, secret_key.decrypt(pool.one()))
+        self.assertEqual(-42, secret_key.decrypt(pool.encrypt(-42)))
+        self.assertAlmostEqual(3.14, secret_key.decrypt(pool.encrypt(3.14)))
+        self.assertEqual(4, len(pool))
+
+    def test_empty(self):
+        """
+        池为空时在线加密
+        """
+        pool = ObfuscatorPool(public_key, high_watermark=2, low_watermark=0, start=False)
+        self.assertEqual(0, len(pool))
+        self.assertEqual(1, secret_key.decrypt(pool.one()))
+
+    def test_fresh(self):
+        """
+        每次加密使用不同的混淆因子
+        """
+        pool = ObfuscatorPool(public_key, high_watermark=4, low_watermark=1, start=False)
+        pool.fill()
+        self.assertNotEqual(pool.zero().ciphertext(), pool.zero().ciphertext())
+
+    def test_background(self):
+        """
+        后台线程补充至高水位
+        """
+        pool = ObfuscatorPool(public_key, high_watermark=16, low_watermark=4)
+        try:
+            deadline = time.time() + 30
+            while len(pool) < 16 and time.time() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(16, len(pool))
+            for _ in range(13):
+                pool.zero()
+            deadline = time.time() + 30
+            while len(pool) < 16 and time.time() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(16, len(pool))
+        finally:
+            pool.close()
+
+    def test_watermark(self):
+        """
+        非法水位
+        """
+        with self.assertRaises(ValueError):
+            ObfuscatorPool(public_key, high_watermark=4, low_watermark=4, start=False)
+
+    def test_protocol(self):
+        """
+        使用混淆因子池的第三方云服务器
+        """
+        pool = ObfuscatorPool(public_key, high_watermark=32, low_watermark=8)
+        try:
+            cloud1 = CloudPlatform(public_key=public_key)
+            cloud2 = CloudPlatformThird(public_key=public_key, secret_key=secret_key, pool=pool)
+            protocol = SecureMultiPartyComputationProtocol(c1=cloud1, c2=cloud2)
+            int1 = random.SystemRandom().randint(0, key_length)
+            int2 = random.SystemRandom().randint(0, key_length)
+            int_n1 = protocol.encode(public_key.encrypt(int1))
+            int_n2 = public_key.encrypt(int2)
+            self.assertEqual(int1 * int2, secret_key.decrypt(int_n1 * int_n2))
+            self.assertEqual(int1 % 2, secret_key.decrypt(int_n1.parity()))
+            self.assertEqual(1 if int1 == int2 else 0, secret_key.decrypt(int_n1 == int_n2))
+            self.assertEqual(1 if int1 > int2 else 0, secret_key.decrypt(int_n1 > int_n2))
+        finally:
+            pool.close()
@@ -11,17 +11,18 @@
 import random
 import sys
 import unittest
+from unittest import mock
 
 import gmpy2
-import phe
 
 from smpcp.smpcp import CloudPlatform, CloudPlatformThird, SecureMultiPartyComputationProtocol
+from test_case.keypair import keypair
 
 sys.path.append("test_case/")  # 添加测试文件路径
 
 key_length = 2048  # TODO 密钥长度
 
-public_key, secret_key = phe.generate_paillier_keypair(n_length=key_length)  # 生成密钥对
+public_key, secret_key = keypair(key_length)  # 加载缓存的密钥对
 
 cloud1 = CloudPlatform(public_key=public_key)  # 云服务器1
 cloud2 = CloudPlatformThird(public_key=public_key, secret_key=secret_key)  # 云服务器2
@@ -92,6 +93,24 @@ class SMPCPTest(unittest.TestCase):
         # 整数除法测试：经过测试，最高支持10位整数除法
         self.assertEqual(round(self.int1 / self.int2, 10), round(secret_key.decrypt(self.int_n1 / self.int_n2), 10))
 
+    # TODO 安全整除与取模协议测试
+    # @unittest.skip('跳过安全整除与取模协议')
+    def test_floordiv(self):
+        """
+        安全整除与取模协议 结果为整数编码
+        """
+        int2 = self.int2 or 1
+        self.assertEqual(self.int1 // int2, secret_key.decrypt(self.int_n1 // public_key.encrypt(int2)))
+        self.assertEqual(self.int1 % int2, secret_key.decrypt(self.int_n1 % public_key.encrypt(int2)))
+        self.assertEqual(0, (self.int_n1 // public_key.encrypt(int2)).exponent)
+        # 负数与明文除数
+        negative = protocol.encode(public_key.encrypt(-self.int1 - 1))
+        self.assertEqual((-self.int1 - 1) // 7, secret_key.decrypt(negative // 7))
+        self.assertEqual((-self.int1 - 1) % 7, secret_key.decrypt(negative % 7))
+        self.assertEqual((-self.int1 - 1) % -7, secret_key.decrypt(negative % public_key.encrypt(-7)))
+        with self.assertRaises(ValueError):
+            self.int_n1 // 0
+
     # TODO 安全最值计算协议测试
     # @unittest.skip('跳过安全最值计算协议')
     def test_optimum(self):
@@ -256,3 +275,153 @@ class SMPCPTest(unittest.TestCase):
 
         # 整数相等测试：经过测试，极少数情况下，浮点数会影响结果
         self.assertEqual(1 if self.int1 <= self.int2 else 0, secret_key.decrypt(self.int_n1 <= self.int_n2))
+
+
+class SMPCPSigmaTest(unittest.TestCase):
+    """
+    统计安全参数测试类
+    """
+
+    def setUp(self):
+        """
+        测试前
+        """
+        self.cloud = CloudPlatform(public_key=public_key, sigma=40, bit_length=64)
+        self.protocol = SecureMultiPartyComputationProtocol(c1=self.cloud, c2=cloud2)
+        self.int1 = random.SystemRandom().randint(-(1 << 63), 1 << 63)
+        self.int2 = random.SystemRandom().randint(-(1 << 63), 1 << 63)
+        self.int_n1 = self.protocol.encode(public_key.encrypt(self.int1))
+        self.int_n2 = public_key.encrypt(self.int2)
+        return super().setUp()
+
+    def test_mask(self):
+        """
+        掩码位宽
+        """
+        self.assertTrue(all(0 <= r < 1 << 104 for r in self.cloud._generate_random_batch(64)))
+        self.assertTrue(all(0 < r < 1 << 40 for r in self.cloud._generate_factor_batch(64)))
+
+    def test_overflow(self):
+        """
+        掩码超出明文空间
+        """
+        with self.assertRaises(ValueError):
+            CloudPlatform(public_key=public_key, sigma=128, bit_length=key_length // 2)
+
+    def test_protocol(self):
+        """
+        指定统计安全参数的整数协议
+        """
+        self.assertEqual(self.int1 * self.int2, secret_key.decrypt(self.int_n1 * self.int_n2))
+        self.assertEqual(max(self.int1, self.int2), secret_key.decrypt(self.int_n1.optimum(self.int_n2, 'max')))
+        self.assertEqual(self.int1 % 2, secret_key.decrypt(self.int_n1.parity()))
+        self.assertEqual(1 if self.int1 == self.int2 else 0, secret_key.decrypt(self.int_n1 == self.int_n2))
+        self.assertEqual(1, secret_key.decrypt(self.int_n1 == self.int_n1.decode()))
+        self.assertEqual(1 if self.int1 > self.int2 else 0, secret_key.decrypt(self.int_n1 > self.int_n2))
+        self.assertEqual(1 if self.int1 < self.int2 else 0, secret_key.decrypt(self.int_n1 < self.int_n2))
+
+    def test_bit_dec(self):
+        """
+        指定统计安全参数的二进制分解协议 取低8位, 负数为补码
+        """
+        result = ''.join([str(secret_key.decrypt(v)) for v in self.int_n1.bit_dec(8)])
+        self.assertEqual(format(self.int1 & 0xff, '08b'), result)
+
+
+class SMPCPPlaintextTest(unittest.TestCase):
+    """
+    明文操作数测试类
+    """
+
+    def setUp(self):
+        """
+        测试前
+        """
+        self.int1 = random.SystemRandom().randint(0, key_length)
+        self.int2 = random.SystemRandom().randint(1, key_length)
+        self.int_n1 = protocol.encode(public_key.encrypt(self.int1))
+        self.bit1 = random.SystemRandom().randint(0, 1)
+        self.bit2 = random.SystemRandom().randint(0, 1)
+        self.bit_n1 = protocol.encode(public_key.encrypt(self.bit1))
+        return super().setUp()
+
+    def test_local(self):
+        """
+        本地计算, 不与第三方云服务器交互
+        """
+        with mock.patch.object(cloud2, 'mul') as mul, mock.patch.object(cloud2, 'truediv') as truediv:
+            self.assertEqual(self.int1 * self.int2, secret_key.decrypt(self.int_n1 * self.int2))
+            self.assertEqual(round(self.int1 / self.int2, 10), round(secret_key.decrypt(self.int_n1 / self.int2), 10))
+            self.assertEqual(self.bit1 & self.bit2, secret_key.decrypt(self.bit_n1 & self.bit2))
+            self.assertEqual(self.bit1 | self.bit2, secret_key.decrypt(self.bit_n1 | self.bit2))
+            self.assertEqual(self.bit1 ^ self.bit2, secret_key.decrypt(self.bit_n1 ^ self.bit2))
+        mul.assert_not_called()
+        truediv.assert_not_called()
+
+    def test_compare(self):
+        """
+        与明文常量比较
+        """
+        with mock.patch.object(cloud2, 'mul', wraps=cloud2.mul) as mul, \
+                mock.patch.object(cloud2, 'eq_batch', wraps=cloud2.eq_batch) as eq_batch:
+            self.assertEqual(1, secret_key.decrypt(self.int_n1 == self.int1))
+            self.assertEqual(1 if self.int1 == self.int2 else 0, secret_key.decrypt(self.int_n1 == self.int2))
+            self.assertEqual(1 if self.int1 != self.int2 else 0, secret_key.decrypt(self.int_n1 != self.int2))
+        mul.assert_not_called()
+        self.assertEqual(3, eq_batch.call_count)
+        self.assertEqual(1 if self.int1 > self.int2 else 0, secret_key.decrypt(self.int_n1 > self.int2))
+        self.assertEqual(1 if self.int1 < self.int2 else 0, secret_key.decrypt(self.int_n1 < self.int2))
+        self.assertEqual(max(self.int1, self.int2), secret_key.decrypt(self.int_n1.optimum(self.int2, 'max')))
+        self.assertEqual(min(self.int1, self.int2), secret_key.decrypt(self.int_n1.optimum(self.int2, 'min')))
+
+
+class SMPCPRoundTest(unittest.TestCase):
+    """
+    交互轮数测试类
+    """
+
+    def setUp(self):
+        """
+        测试前
+        """
+        self.int1 = random.SystemRandom().randint(0, key_length)
+        self.int2 = random.SystemRandom().randint(0, key_length)
+        self.int_n1 = protocol.encode(public_key.encrypt(self.int1))
+        self.int_n2 = public_key.encrypt(self.int2)
+        return super().setUp()
+
+    def assertRounds(self, rounds, func):
+        """
+        断言与第三方云服务器的交互轮数
+        :param rounds: 期望轮数
+        :param func: 协议调用
+        :return: 协议结果
+        """
+        with mock.patch.object(cloud2, 'mul', wraps=cloud2.mul) as mul, \
+                mock.patch.object(cloud2, 'eq', wraps=cloud2.eq) as eq:
+            result = func()
+        self.assertEqual(rounds, mul.call_count + eq.call_count)
+
+        return result
+
+    def test_ge(self):
+        """
+        安全大于等于协议 单轮
+        """
+        self.assertEqual(1 if self.int1 >= self.int2 else 0,
+                         secret_key.decrypt(self.assertRounds(1, lambda: self.int_n1 >= self.int_n2)))
+        self.assertEqual(1, secret_key.decrypt(self.assertRounds(1, lambda: self.int_n1 >= self.int_n1.decode())))
+
+    def test_le(self):
+        """
+        安全小于等于协议 单轮
+        """
+        self.assertEqual(1 if self.int1 <= self.int2 else 0,
+                         secret_key.decrypt(self.assertRounds(1, lambda: self.int_n1 <= self.int_n2)))
+        self.assertEqual(1, secret_key.decrypt(self.assertRounds(1, lambda: self.int_n1 <= self.int_n1.decode())))
+
+    def test_eq(self):
+        """
+        安全相等协议 两轮
+        """
+        self.assertEqual(1, secret_key.decrypt(self.assertRounds(2, lambda: self.int_n1 == self.int_n1.decode())))
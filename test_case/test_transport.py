@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 10:48
+@File: test_transport.py
+@License: MIT
+"""
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from smpcp import wire
+from smpcp.graph import ProtocolGraph
+from smpcp.packing import decrypt_packed
+from smpcp.smpcp import CloudPlatform, CloudPlatformThird, SecureMultiPartyComputationProtocol
+from smpcp.transport import CloudPlatformThirdClient, CloudPlatformThirdServer, TransportError, _pack, _unpack
+from smpcp.vector import EncryptedVector
+from test_case.keypair import keypair
+
+sys.path.append("test_case/")  # 添加测试文件路径
+
+key_length = 2048  # TODO 密钥长度
+
+public_key, secret_key = keypair(key_length)  # 加载缓存的密钥对
+
+cloud1 = CloudPlatform(public_key=public_key)  # 云服务器1
+cloud2 = CloudPlatformThird(public_key=public_key, secret_key=secret_key)  # 云服务器2
+
+loop = asyncio.new_event_loop()  # 服务端事件循环
+socket_dir = tempfile.mkdtemp()  # Unix套接字目录
+
+
+def setUpModule():
+    """
+    启动服务端
+    """
+    global tcp_server, unix_server
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    tcp_server = asyncio.run_coroutine_threadsafe(CloudPlatformThirdServer(cloud2).start(), loop).result()
+    unix_server = asyncio.run_coroutine_threadsafe(
+        CloudPlatformThirdServer(cloud2, path=os.path.join(socket_dir, 'c2.sock')).start(), loop).result()
+
+
+def tearDownModule():
+    """
+    关闭服务端
+    """
+    asyncio.run_coroutine_threadsafe(tcp_server.close(), loop).result()
+    asyncio.run_coroutine_threadsafe(unix_server.close(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+
+
+class TransportTest(unittest.TestCase):
+    """
+    传输层测试类
+    """
+
+    def setUp(self):
+        """
+        测试前
+        """
+        self.client = CloudPlatformThirdClient(public_key, port=tcp_server.address[1], connections=2)
+        self.protocol = SecureMultiPartyComputationProtocol(c1=cloud1, c2=self.client)
+        self.int1 = random.SystemRandom().randint(0, key_length)
+        self.int2 = random.SystemRandom().randint(1, key_length)
+        self.int_n1 = self.protocol.encode(public_key.encrypt(self.int1))
+        self.int_n2 = public_key.encrypt(self.int2)
+        return super().setUp()
+
+    def tearDown(self):
+        """
+        测试后
+        """
+        self.client.close()
+        return super().tearDown()
+
+    def test_protocol(self):
+        """
+        经由传输层的安全多方计算协议
+        """
+        self.assertEqual(self.int1 * self.int2, secret_key.decrypt(self.int_n1 * self.int_n2))
+        self.assertEqual(round(self.int1 / self.int2, 10), round(secret_key.decrypt(self.int_n1 / self.int_n2), 10))
+        self.assertEqual(max(self.int1, self.int2), secret_key.decrypt(self.int_n1.optimum(self.int_n2, 'max')))
+        self.assertEqual(self.int1 % 2, secret_key.decrypt(self.int_n1.parity()))
+        self.assertEqual(1 if self.int1 == self.int2 else 0, secret_key.decrypt(self.int_n1 == self.int_n2))
+        self.assertEqual(1 if self.int1 > self.int2 else 0, secret_key.decrypt(self.int_n1 > self.int_n2))
+        self.assertIn(self.int1 * self.int2 // 16 - secret_key.decrypt(cloud1.truncate(self.int_n1 * self.int_n2, 4,
+                                                                                      self.client)), (0, -1))
+        self.assertEqual(self.int1 % self.int2, secret_key.decrypt(cloud1.mod(self.int_n1.decode(), self.int_n2,
+                                                                              self.client)))
+
+    def test_batch(self):
+        """
+        经由传输层的批量协议
+        """
+        int1 = [random.SystemRandom().randint(0, key_length) for _ in range(8)]
+        int2 = [random.SystemRandom().randint(1, key_length) for _ in range(8)]
+        v1 = EncryptedVector(c1=cloud1, c2=self.client, ciphers=[public_key.encrypt(v) for v in int1])
+        v2 = [public_key.encrypt(v) for v in int2]
+        self.assertEqual([a * b for a, b in zip(int1, int2)], [secret_key.decrypt(v) for v in v1 * v2])
+        self.assertEqual([min(a, b) for a, b in zip(int1, int2)],
+                         [secret_key.decrypt(v) for v in v1.optimum(v2, 'min')])
+        packed = CloudPlatform(public_key=public_key, sigma=40, bit_length=32)
+        self.assertEqual([a * b for a, b in zip(int1, int2)],
+                         decrypt_packed(secret_key, packed.mul_packed(v1.ciphers, v2, self.client)))
+        self.assertEqual([int(a < b) for a, b in zip(int1, int2)],
+                         [secret_key.decrypt(v) for v in packed.lt_packed(v1.ciphers, v2, self.client)])
+        self.assertEqual([[a * b for b in int2[:3]] for a in int1[:2]],
+                         [[secret_key.decrypt(v) for v in row] for row in cloud1.matmul(
+                             [[v] for v in v1.ciphers[:2]], [v2[:3]], self.client)])
+        graph = ProtocolGraph(c1=cloud1, c2=self.client)
+        a, b = graph.encode(v1.ciphers[0]), graph.encode(v2[0])
+        self.assertEqual([int1[0] * int2[0], int(int1[0] < int2[0])],
+                         [secret_key.decrypt(v) for v in graph.evaluate(a * b, a < b)])
+
+    def test_pipeline(self):
+        """
+        多线程并发请求
+        """
+        values = [random.SystemRandom().randint(0, key_length) for _ in range(16)]
+        with ThreadPoolExecutor(8) as executor:
+            result = list(executor.map(lambda v: self.int_n1 * public_key.encrypt(v), values))
+        self.assertEqual([self.int1 * v for v in values], [secret_key.decrypt(v) for v in result])
+
+    def test_unix_socket(self):
+        """
+        Unix套接字传输
+        """
+        with CloudPlatformThirdClient(public_key, path=unix_server.address) as client:
+            protocol = SecureMultiPartyComputationProtocol(c1=cloud1, c2=client)
+            self.assertEqual(self.int1 * self.int2,
+                             secret_key.decrypt(protocol.encode(public_key.encrypt(self.int1)) * self.int_n2))
+
+    def test_error(self):
+        """
+        非法请求
+        """
+        with self.assertRaises(TransportError):
+            self.client._call('decrypt', self.int_n2)
+        with self.assertRaises(TransportError):
+            self.client.batch([('decrypt', [self.int_n2])])
+
+    def test_encoding(self):
+        """
+        密文以wire二进制格式传输
+        """
+        ciphers = [public_key.encrypt(v) for v in range(4)]
+        args = [ciphers, [[ciphers[0]], []], ciphers[1], 3, 'max']
+        data = _pack(args, id=1, method='mul_batch')
+        self.assertEqual(3, data.count(wire.MAGIC))
+        self.assertLess(len(data), 6 * (wire.width(public_key) + 64))  # 6个定长密文, 十六进制JSON约为两倍
+        message = _unpack(data, public_key)
+        self.assertEqual((1, 'mul_batch'), (message['id'], message['method']))
+        value = message['value']
+        self.assertEqual([0, 1, 2, 3], [secret_key.decrypt(v) for v in value[0]])
+        self.assertEqual((0, []), (secret_key.decrypt(value[1][0][0]), value[1][1]))
+        self.assertEqual((1, 3, 'max'), (secret_key.decrypt(value[2]), value[3], value[4]))
+
+        other, _ = keypair(1024)
+        with self.assertRaises(TransportError):
+            self.client.mul(other.encrypt(1), other.encrypt(2))
+
+    def test_connection_lost(self):
+        """
+        连接断开后请求立即失败
+        """
+        with CloudPlatformThirdClient(public_key, port=tcp_server.address[1]) as client:
+            writer, _, task = client._connections[0]
+            client._loop.call_soon_threadsafe(writer.transport.abort)
+            asyncio.run_coroutine_threadsafe(asyncio.wait([task]), client._loop).result(5)
+            with self.assertRaises(ConnectionError):
+                cloud1.mul(self.int_n1.decode(), self.int_n2, client)
+            self.assertEqual(client._futures, {})
+
+    def test_timeout(self):
+        """
+        超时请求不再保留
+        """
+        silent = asyncio.run_coroutine_threadsafe(
+            asyncio.start_server(lambda r, w: None, host='127.0.0.1', port=0), loop).result()  # 不响应的服务端
+        try:
+            with CloudPlatformThirdClient(public_key, port=silent.sockets[0].getsockname()[1], timeout=0.2) as client:
+                with self.assertRaises(TimeoutError):
+                    client.mul(self.int_n2, self.int_n2)
+                asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), client._loop).result()
+                self.assertEqual(client._futures, {})
+        finally:
+            silent.close()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 09:40
+@File: test_vector.py
+@License: MIT
+"""
+import random
+import sys
+import unittest
+
+from smpcp.smpcp import CloudPlatform, CloudPlatformThird
+from smpcp.vector import EncryptedVector
+from test_case.keypair import keypair
+
+sys.path.append("test_case/")  # 添加测试文件路径
+
+key_length = 2048  # TODO 密钥长度
+size = 8  # TODO 向量长度
+
+public_key, secret_key = keypair(key_length)  # 加载缓存的密钥对
+
+
+class CountingCloudPlatformThird(CloudPlatformThird):
+    """
+    记录交互轮数的第三方云服务器类
+    """
+
+    def __init__(self, public_key, secret_key):
+        super().__init__(public_key, secret_key)
+        self.rounds = 0
+
+    def mul_batch(self, h1, h2):
+        self.rounds += 1
+        return super().mul_batch(h1, h2)
+
+    def truediv_batch(self, h1, h2):
+        self.rounds += 1
+        return super().truediv_batch(h1, h2)
+
+    def floordiv_batch(self, h1, h2):
+        self.rounds += 1
+        return super().floordiv_batch(h1, h2)
+
+    def mod_batch(self, h1, h2):
+        self.rounds += 1
+        return super().mod_batch(h1, h2)
+
+    def optimum_batch(self, h1, h2, h3, mode):
+        self.rounds += 1
+        return super().optimum_batch(h1, h2, h3, mode)
+
+    def parity_batch(self, h):
+        self.rounds += 1
+        return super().parity_batch(h)
+
+    def bit_dec_batch(self, h, bit):
+        self.rounds += 1
+        return super().bit_dec_batch(h, bit)
+
+    def eq_batch(self, h):
+        self.rounds += 1
+        return super().eq_batch(h)
+
+
+cloud1 = CloudPlatform(public_key=public_key)  # 云服务器1
+cloud2 = CountingCloudPlatformThird(public_key=public_key, secret_key=secret_key)  # 云服务器2
+
+vector = EncryptedVector(c1=cloud1, c2=cloud2)  # 加密向量类
+
+
+class EncryptedVectorTest(unittest.TestCase):
+    """
+    加密向量测试类
+    """
+
+    def setUp(self):
+        """
+        测试前
+        """
+        self.int1 = [random.SystemRandom().randint(0, key_length) for _ in range(size)]
+        self.int2 = [random.SystemRandom().randint(1, key_length) for _ in range(size)]
+        self.int2[0] = self.int1[0]  # 保证存在相等元素
+        self.int_n1 = vector.encode([public_key.encrypt(v) for v in self.int1])
+        self.int_n2 = [public_key.encrypt(v) for v in self.int2]
+        self.bit1 = [random.SystemRandom().randint(0, 1) for _ in range(size)]
+        self.bit2 = [random.SystemRandom().randint(0, 1) for _ in range(size)]
+        self.bit_n1 = vector.encode([public_key.encrypt(v) for v in self.bit1])
+        self.bit_n2 = [public_key.encrypt(v) for v in self.bit2]
+        cloud2.rounds = 0
+        return super().setUp()
+
+    def decrypt(self, ciphers):
+        """
+        解密密文列表
+        """
+        return [secret_key.decrypt(v) for v in ciphers]
+
+    def test_mul(self):
+        """
+        批量安全乘法协议
+        """
+        self.assertEqual([a * b for a, b in zip(self.int1, self.int2)], self.decrypt(self.int_n1 * self.int_n2))
+        self.assertEqual(1, cloud2.rounds)
+
+    def test_div(self):
+        """
+        批量安全除法协议
+        """
+        self.assertEqual([round(a / b, 10) for a, b in zip(self.int1, self.int2)],
+                         [round(v, 10) for v in self.decrypt(self.int_n1 / self.int_n2)])
+        self.assertEqual(1, cloud2.rounds)
+
+    def test_floordiv(self):
+        """
+        批量安全整除与取模协议
+        """
+        self.assertEqual([a // b for a, b in zip(self.int1, self.int2)], self.decrypt(self.int_n1 // self.int_n2))
+        self.assertEqual([a % b for a, b in zip(self.int1, self.int2)], self.decrypt(self.int_n1 % self.int_n2))
+        self.assertEqual(2, cloud2.rounds)
+        self.assertEqual([a % 3 for a in self.int1], self.decrypt(self.int_n1 % 3))
+
+    def test_optimum(self):
+        """
+        批量安全最值计算协议
+        """
+        self.assertEqual([max(a, b) for a, b in zip(self.int1, self.int2)],
+                         self.decrypt(self.int_n1.optimum(self.int_n2, 'max')))
+        self.assertEqual([min(a, b) for a, b in zip(self.int1, self.int2)],
+                         self.decrypt(self.int_n1.optimum(self.int_n2, 'min')))
+        self.assertEqual(2, cloud2.rounds)
+
+    def test_parity(self):
+        """
+        批量安全奇偶性判断协议
+        """
+        self.assertEqual([v % 2 for v in self.int1], self.decrypt(self.int_n1.parity()))
+        self.assertEqual(1, cloud2.rounds)
+
+    def test_bit_dec(self):
+        """
+        批量安全二进制分解协议
+        """
+        bit = max(self.int1).bit_length()
+        result = [''.join(str(b) for b in self.decrypt(v)) for v in self.int_n1.bit_dec(bit)]
+        self.assertEqual([bin(v)[2:].zfill(bit) for v in self.int1], result)
+        self.assertEqual(2 + (bit - 1).bit_length(), cloud2.rounds)
+
+    def test_bit(self):
+        """
+        批量安全二进制协议
+        """
+        self.assertEqual([a & b for a, b in zip(self.bit1, self.bit2)], self.decrypt(self.bit_n1 & self.bit_n2))
+        self.assertEqual([a | b for a, b in zip(self.bit1, self.bit2)], self.decrypt(self.bit_n1 | self.bit_n2))
+        self.assertEqual([a ^ b for a, b in zip(self.bit1, self.bit2)], self.decrypt(self.bit_n1 ^ self.bit_n2))
+        self.assertEqual([1 - a for a in self.bit1], self.decrypt(self.bit_n1.bit_not()))
+        self.assertEqual(3, cloud2.rounds)
+
+    def test_compare(self):
+        """
+        批量安全比较协议
+        """
+        self.assertEqual([int(a == b) for a, b in zip(self.int1, self.int2)], self.decrypt(self.int_n1 == self.int_n2))
+        self.assertEqual([int(a != b) for a, b in zip(self.int1, self.int2)], self.decrypt(self.int_n1 != self.int_n2))
+        self.assertEqual([int(a > b) for a, b in zip(self.int1, self.int2)], self.decrypt(self.int_n1 > self.int_n2))
+        self.assertEqual([int(a >= b) for a, b in zip(self.int1, self.int2)], self.decrypt(self.int_n1 >= self.int_n2))
+        self.assertEqual([int(a < b) for a, b in zip(self.int1, self.int2)], self.decrypt(self.int_n1 < self.int_n2))
+        self.assertEqual([int(a <= b) for a, b in zip(self.int1, self.int2)], self.decrypt(self.int_n1 <= self.int_n2))
+
+    def test_length_mismatch(self):
+        """
+        向量长度不一致
+        """
+        with self.assertRaises(ValueError):
+            _ = self.int_n1 * self.int_n2[1:]
+
+    def test_plaintext(self):
+        """
+        明文操作数
+        """
+        self.assertEqual([a * 3 for a in self.int1], self.decrypt(self.int_n1 * 3))
+        self.assertEqual(0, cloud2.rounds)
+        self.assertEqual([int(a == self.int1[0]) for a in self.int1], self.decrypt(self.int_n1 == self.int1[0]))
+        self.assertEqual([int(a > 7) for a in self.int1], self.decrypt(self.int_n1 > 7))
+        self.assertEqual([max(a, 7) for a in self.int1], self.decrypt(self.int_n1.optimum(7, 'max')))
+        self.assertEqual(3, cloud2.rounds)
+
+    def test_ge_le(self):
+        """
+        批量安全大于等于/小于等于协议 单轮
+        """
+        self.assertEqual([int(a >= b) for a, b in zip(self.int1, self.int2)], self.decrypt(self.int_n1 >= self.int_n2))
+        self.assertEqual(1, cloud2.rounds)
+        self.assertEqual([int(a <= b) for a, b in zip(self.int1, self.int2)], self.decrypt(self.int_n1 <= self.int_n2))
+        self.assertEqual(2, cloud2.rounds)
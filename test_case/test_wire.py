@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+@Version: 2.0.2
+@Project: Secure-Multi-Party-Computation-Protocol
+@Author: Zhan Shi
+@Time  : 2026/10/18 19:42
+@File: test_wire.py
+@License: MIT
+"""
+import random
+import sys
+import unittest
+
+import phe
+
+from smpcp import wire
+from test_case.keypair import keypair
+
+sys.path.append("test_case/")  # 添加测试文件路径
+
+key_length = 2048  # TODO 密钥长度
+
+public_key, secret_key = keypair(key_length)  # 加载缓存的密钥对
+
+
+class WireTest(unittest.TestCase):
+    """
+    二进制传输格式测试类
+    """
+
+    def setUp(self):
+        """
+        测试前
+        """
+        self.ints = [random.SystemRandom().randint(-key_length, key_length) for _ in range(8)]
+        self.numbers = [public_key.encrypt(v) for v in self.ints]
+        return super().setUp()
+
+    def test_roundtrip(self):
+        """
+        编码与解码 共用指数
+        """
+        data = wire.encode_batch(public_key, self.numbers)
+        self.assertEqual(20 + 4 + 8 * wire.width(public_key), len(data))
+        result = wire.decode_batch(public_key, data)
+        self.assertEqual(self.ints, [secret_key.decrypt(v) for v in result])
+        self.assertEqual([v.ciphertext(be_secure=False) for v in self.numbers],
+                         [v.ciphertext(be_secure=False) for v in result])
+
+    def test_exponents(self):
+        """
+        编码与解码 各自指数
+        """
+        floats = [0.5, -1.25, 3, 1e-3]
+        data = wire.encode_batch(public_key, [public_key.encrypt(v) for v in floats])
+        self.assertEqual(20 + 4 * 4 + 4 * wire.width(public_key), len(data))
+        self.assertEqual(floats, [secret_key.decrypt(v) for v in wire.decode_batch(public_key, data)])
+        self.assertEqual([], wire.decode_batch(public_key, wire.encode_batch(public_key, [])))
+
+    def test_view(self):
+        """
+        从memoryview零拷贝解码
+        """
+        data = wire.encode_batch(public_key, self.numbers)
+        buffer = bytearray(b'\x00' * 16 + data + b'\x00' * 16)
+        view = wire.BatchView(public_key, memoryview(buffer)[16:-16])
+        self.assertEqual(len(self.ints), len(view))
+        self.assertEqual(self.ints[-1], secret_key.decrypt(view[-1]))
+        self.assertEqual(self.ints[2:5], [secret_key.decrypt(v) for v in view[2:5]])
+        with self.assertRaises(IndexError):
+            _ = view[len(self.ints)]
+
+    def test_invalid(self):
+        """
+        格式错误与公钥不匹配
+        """
+        data = wire.encode_batch(public_key, self.numbers)
+        other, _ = phe.generate_paillier_keypair(n_length=512)
+        with self.assertRaises(ValueError):
+            wire.decode_batch(other, data)
+        with self.assertRaises(ValueError):
+            wire.decode_batch(public_key, b'XXXX' + data[4:])
+        with self.assertRaises(ValueError):
+            wire.decode_batch(public_key, data[:4] + b'\x09' + data[5:])
+        with self.assertRaises(ValueError):
+            wire.decode_batch(public_key, data[:-1])
+        with self.assertRaises(ValueError):
+            wire.decode_batch(public_key, data[:10])
+        with self.assertRaises(ValueError):
+            wire.encode_batch(other, self.numbers)